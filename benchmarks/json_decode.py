@@ -0,0 +1,114 @@
+"""
+Decode time and resident size of large upstream payloads, per installed JSON decoder.
+
+    python benchmarks/json_decode.py                        # synthetic /rawaddr document
+    python benchmarks/json_decode.py --txs 20000            # bigger synthetic document
+    python benchmarks/json_decode.py rawaddr.json blocks.json   # recorded payloads (e.g. curl -o)
+"""
+# manually add project root to sys.path => entire repo becomes usable
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+import argparse
+import json
+import random
+import statistics
+import time
+import tracemalloc
+
+from src.api.json_decoder import DECODERS
+
+
+def synthetic_rawaddr(txs: int) -> bytes:
+    """Blockchain.com /rawaddr document of a busy address, same keys and value types as the real one"""
+    rng = random.Random(42)
+    address = "bc1qm34lsc65zpw79lxes69zkqmk6ee3ewf0j77s3h"
+
+    def output() -> dict:
+        return {
+            "type": 0,
+            "spent": rng.random() < 0.5,
+            "value": rng.randrange(1_000, 10**9),
+            "spending_outpoints": [],
+            "n": rng.randrange(0, 4),
+            "tx_index": rng.randrange(10**15),
+            "script": "0014" + os.urandom(20).hex(),
+            "addr": address if rng.random() < 0.3 else "bc1q" + os.urandom(19).hex(),
+        }
+
+    transactions = [{
+        "hash": os.urandom(32).hex(),
+        "ver": 2,
+        "vin_sz": 2,
+        "vout_sz": 2,
+        "size": rng.randrange(200, 1000),
+        "weight": rng.randrange(500, 4000),
+        "fee": rng.randrange(200, 50_000),
+        "relayed_by": "0.0.0.0",
+        "lock_time": 0,
+        "tx_index": rng.randrange(10**15),
+        "double_spend": False,
+        "time": 1_700_000_000 + i * 600,
+        "block_index": 800_000 + i,
+        "block_height": 800_000 + i,
+        "inputs": [{"sequence": 4294967293, "witness": os.urandom(107).hex(), "script": "", "index": n, "prev_out": output()} for n in range(2)],
+        "out": [output() for _ in range(2)],
+        "result": rng.randrange(-10**8, 10**8),
+        "balance": rng.randrange(10**10),
+    } for i in range(txs)]
+
+    return json.dumps({
+        "hash160": os.urandom(20).hex(),
+        "address": address,
+        "n_tx": txs,
+        "n_unredeemed": txs // 2,
+        "total_received": 10**12,
+        "total_sent": 10**12 - 10**9,
+        "final_balance": 10**9,
+        "txs": transactions,
+    }).encode()
+
+
+def decoded_size(loads, payload: bytes) -> int:
+    """Bytes allocated by the decoded object, measured with tracemalloc"""
+    tracemalloc.start()
+    obj = loads(payload)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def bench(name: str, payload: bytes, repeat: int) -> None:
+    print(f"\n## {name} : {len(payload) / 1_000_000:.2f} MB raw")
+    print(f"{'decoder':<10}{'median ms':>12}{'min ms':>10}{'decoded MB':>12}{'x raw':>8}")
+
+    for decoder, loads in DECODERS.items():
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            loads(payload)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        size = decoded_size(loads, payload)
+        print(f"{decoder:<10}{statistics.median(timings):>12.1f}{min(timings):>10.1f}{size / 1_000_000:>12.2f}{size / len(payload):>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the JSON decoders on large payloads")
+    parser.add_argument("files", nargs="*", help="Recorded response bodies, a synthetic /rawaddr document otherwise")
+    parser.add_argument("--txs", type=int, default=5000, help="Transactions in the synthetic document")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Installed decoders : {', '.join(DECODERS)}")
+
+    if args.files:
+        for path in args.files:
+            with open(path, "rb") as f:
+                bench(os.path.basename(path), f.read(), args.repeat)
+    else:
+        bench(f"synthetic /rawaddr ({args.txs} txs)", synthetic_rawaddr(args.txs), args.repeat)
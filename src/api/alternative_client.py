@@ -1,18 +1,26 @@
 import logging
 from typing import Optional
-from src.api.client import APIClient
+from src.api.client import AsyncAPIClient
+from src.api.ttl_policy import TTLPolicy
 from src.config import Config
 
 logger = logging.getLogger(__name__)
 
-class AlternativeClient(APIClient):
+class AlternativeClient(AsyncAPIClient):
+    TTL_POLICIES = (
+        TTLPolicy(r"^/fng/", ttl=3600, stale_ttl=Config.CACHE_STALE_TTL_TIME), # the index is published once a day
+        TTLPolicy(r"^/v2/global", ttl=120),
+    )
+    RATE_LIMIT = Config.ALTERNATIVE_RATE_LIMIT
+    RATE_LIMIT_BURST = Config.ALTERNATIVE_RATE_BURST
+
     def __init__(self):
         super().__init__(Config.ALTERNATIVE_API_URL)
 
 
     # === BITCOIN NETWORK INFORMATIONS ===
 
-    def get_global_cryptomarket_infos(self) -> Optional[dict]:
+    async def get_global_cryptomarket_infos(self) -> Optional[dict]:
         """
         Unused
 
@@ -20,18 +28,18 @@ class AlternativeClient(APIClient):
         Docs : https://alternative.me/crypto/api/
         """
         try:
-            return self.get("/v2/global")
+            return await self.get("/v2/global")
         except Exception as e:
             logger.error(f"Failed to fetch data from Alternative : {e}")
             return None
 
-    def get_fear_greed_index(self) -> Optional[dict]:
+    async def get_fear_greed_index(self) -> Optional[dict]:
         """
         Returns the 'Fear & Greed' index on the crypto market over 7 days
         Docs : https://alternative.me/crypto/fear-and-greed-index/#api
         """
         try:
-            return self.get("/fng/?limit=7")
+            return await self.get("/fng/?limit=7")
         except Exception as e:
             logger.error(f"Failed to fetch data from Alternative : {e}")
             return None
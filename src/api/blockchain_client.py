@@ -1,22 +1,33 @@
 import logging
-from typing import Optional
-from src.api.client import APIClient
+from typing import AsyncIterator, Optional
+from src.api.client import AsyncAPIClient, StreamInterrupted
+from src.api.ttl_policy import TTLPolicy
 from src.config import Config
 
 logger = logging.getLogger(__name__)
 
-class BlockchainClient(APIClient):
+class BlockchainClient(AsyncAPIClient):
+    TTL_POLICIES = (
+        TTLPolicy(r"^/latestblock$", ttl=15, tip_dependent=True),
+        TTLPolicy(r"^/rawaddr/", ttl=30),
+        TTLPolicy(r"^/stats", ttl=60, stale_ttl=Config.CACHE_STALE_TTL_TIME),
+        TTLPolicy(r"^/q/", ttl=60),
+    )
+    RATE_LIMIT = Config.BLOCKCHAIN_INFO_RATE_LIMIT
+    RATE_LIMIT_BURST = Config.BLOCKCHAIN_INFO_RATE_BURST
+    CACHE_RAW_BYTES = True # /rawaddr documents of busy addresses are far smaller as bytes than as dicts
+
     def __init__(self):
         super().__init__(Config.BLOCKCHAIN_INFO_API_URL)
 
 
-    def get_network_stats(self) -> Optional[dict]:
+    async def get_network_stats(self) -> Optional[dict]:
         """
         Returns current Bitcoin network stats
         Docs : https://blockchain.com/fr/explorer/api/blockchain_api
         """
         try:
-            return self.get("/stats?format=json")
+            return await self.get("/stats?format=json")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
@@ -24,7 +35,7 @@ class BlockchainClient(APIClient):
 
     # === BITCOIN NETWORK INFORMATIONS ===
 
-    def get_network_hashrate(self) -> Optional[int]:
+    async def get_network_hashrate(self) -> Optional[int]:
         """
         Unused
 
@@ -32,13 +43,13 @@ class BlockchainClient(APIClient):
         Docs : https://www.blockchain.com/fr/explorer/api/q
         """
         try :
-            result = self.get("/q/hashrate")
+            result = await self.get("/q/hashrate")
             return int(result) if result else None
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
 
-    def get_network_difficulty(self) -> Optional[float]:
+    async def get_network_difficulty(self) -> Optional[float]:
         """
         Unused
 
@@ -46,7 +57,7 @@ class BlockchainClient(APIClient):
         Docs : https://www.blockchain.com/fr/explorer/api/q
         """
         try:
-            result = self.get("/q/getdifficulty")
+            result = await self.get("/q/getdifficulty")
             return int(result) if result else None
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
@@ -55,7 +66,7 @@ class BlockchainClient(APIClient):
 
     # === BITCOIN TRANSACTIONS INFORMATIONS ===
 
-    def get_nb_tx_day(self) -> Optional[int]:
+    async def get_nb_tx_day(self) -> Optional[int]:
         """
         Unused
 
@@ -63,13 +74,13 @@ class BlockchainClient(APIClient):
         Docs : https://www.blockchain.com/fr/explorer/api/q
         """
         try:
-            result = self.get("/q/24hrtransactioncount")
+            result = await self.get("/q/24hrtransactioncount")
             return int(result) if result else None
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
 
-    def get_nb_stc_day(self) -> Optional[int]:
+    async def get_nb_stc_day(self) -> Optional[int]:
         """
         Unused
 
@@ -77,13 +88,13 @@ class BlockchainClient(APIClient):
         Docs : https://www.blockchain.com/fr/explorer/api/q
         """
         try:
-            result = self.get("/q/24hrbtcsent")
+            result = await self.get("/q/24hrbtcsent")
             return int(result) if result else None
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
 
-    def get_unconfirmed_tx(self) -> Optional[int]:
+    async def get_unconfirmed_tx(self) -> Optional[int]:
         """
         Unused
 
@@ -91,7 +102,7 @@ class BlockchainClient(APIClient):
         Docs : https://www.blockchain.com/fr/explorer/api/q
         """
         try:
-            result = self.get("/q/unconfirmedcount")
+            result = await self.get("/q/unconfirmedcount")
             return int(result) if result else None
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
@@ -100,13 +111,13 @@ class BlockchainClient(APIClient):
 
     # === BITCOIN BLOCKS INFORMATIONS ===
 
-    def get_latest_block(self) -> Optional[dict]:
+    async def get_latest_block(self) -> Optional[dict]:
         """
         Returns information about the last mined block on the Bitcoin network
         Docs : "https://www.blockchain.com/fr/explorer/api/blockchain_api"
         """
         try:
-            return self.get(f"/latestblock")
+            return await self.get(f"/latestblock")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
@@ -114,18 +125,35 @@ class BlockchainClient(APIClient):
 
     # === BITCOIN ADDRESSES INFORMATIONS ===
 
-    def get_address_info(self, address) -> Optional[dict]:
+    async def get_address_info(self, address) -> Optional[dict]:
         """
         Returns the information for a Bitcoin address (param address in base58 or hash160)
         Docs : "https://www.blockchain.com/fr/explorer/api/blockchain_api"
         """
         try:
-            return self.get(f"/rawaddr/{address}")
+            return await self.get(f"/rawaddr/{address}")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
 
 
+    async def stream_address_txs(self, address: str) -> AsyncIterator[dict]:
+        """
+        Yields the transactions of a Bitcoin address while its /rawaddr document is received,
+        raises StreamInterrupted if the download fails after the first ones
+        Docs : "https://www.blockchain.com/fr/explorer/api/blockchain_api"
+        """
+        try:
+            async for tx in self.stream_items(f"/rawaddr/{address}", key="txs"):
+                yield tx
+        except StreamInterrupted as e:
+            if e.received:
+                raise # the transactions already yielded are not the whole list, the caller has to know
+            logger.error(f"Failed to fetch data from Blockchain.com : {e}")
+        except Exception as e:
+            logger.error(f"Failed to fetch data from Blockchain.com : {e}")
+
+
 # Singleton instance for the client
 _blockchain_instance = None
 
@@ -0,0 +1,241 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from src.config import Config
+
+_versions = itertools.count(1) # process-wide, a version never designates the data of two caches
+
+
+@dataclass
+class CacheEntry:
+    data: Any
+    expires_at: float
+    size: int
+    stale_until: float = 0 # served while revalidating until then
+    retain_until: float = 0 # kept as a last-resort fallback while the upstream is down, dropped afterwards
+    etag: Optional[str] = None # validators sent back to the upstream to revalidate the entry
+    last_modified: Optional[str] = None
+    body_size: int = 0 # bytes of the response body, what a 304 spares downloading again
+    version: int = 0 # set when stored, kept by a 304 : changes only with the data
+
+    def __post_init__(self):
+        self.stale_until = max(self.stale_until, self.expires_at)
+        self.retain_until = max(self.retain_until, self.stale_until)
+
+
+class ResponseCache:
+    """Bounded LRU cache with TTL expiry for upstream responses"""
+
+    def __init__(self,
+                 max_entries: int = Config.CACHE_MAX_ENTRIES,
+                 max_bytes: int = Config.CACHE_MAX_BYTES,
+                 sweep_interval: float = Config.CACHE_SWEEP_INTERVAL,
+                 fallback_ttl: float = Config.CACHE_FALLBACK_TTL):
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.sweep_interval: float = sweep_interval
+        self.fallback_ttl: float = fallback_ttl
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.RLock() # the blocking client may be shared between threads
+        self._last_sweep: float = time.time()
+
+        self.bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stale_hits: int = 0
+        self.fallback_hits: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self.conditional_requests: int = 0 # revalidations sent with If-None-Match / If-Modified-Since
+        self.not_modified: int = 0 # entries refreshed by a 304 instead of a full download
+        self.bytes_saved: int = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached data, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            now = time.time()
+            if entry.expires_at <= now:
+                if entry.retain_until <= now:
+                    self._remove(key)
+                    self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.data
+
+    def get_stale(self, key: str) -> Optional[Any]:
+        """Returns expired data still within its staleness window, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not (entry.expires_at <= time.time() < entry.stale_until):
+                return None
+
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            return entry.data
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Returns whatever data is still retained for the key, however old, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.retain_until <= time.time():
+                return None
+
+            self.fallback_hits += 1
+            return entry.data
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry itself whatever its freshness, without touching the LRU order or the counters"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self,
+            key: str,
+            data: Any,
+            ttl: float,
+            size: int,
+            stale_ttl: float = 0,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None,
+            body_size: int = 0) -> Optional[CacheEntry]:
+        """Stores data for ttl seconds (+ stale_ttl of staleness), size is the memory it holds in bytes"""
+        if ttl <= 0:
+            return None
+
+        now = time.time()
+        return self.put(key, CacheEntry(
+            data=data,
+            expires_at=now + ttl,
+            size=size,
+            stale_until=now + ttl + stale_ttl,
+            etag=etag,
+            last_modified=last_modified,
+            body_size=body_size,
+        ))
+
+    def validators(self, key: str) -> dict:
+        """Returns the conditional request headers able to revalidate the retained entry, if any"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.retain_until <= time.time():
+                return {}
+
+            headers = {}
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            if headers:
+                self.conditional_requests += 1
+            return headers
+
+    def refresh(self, key: str, ttl: float, stale_ttl: float = 0) -> Optional[CacheEntry]:
+        """Extends an entry the upstream reported unchanged (304), returns None if it is gone meanwhile"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            now = time.time()
+            entry.expires_at = now + max(ttl, 0)
+            entry.stale_until = entry.expires_at + stale_ttl
+            entry.retain_until = max(entry.retain_until, entry.stale_until + self.fallback_ttl)
+            self._entries.move_to_end(key)
+
+            self.not_modified += 1
+            self.bytes_saved += entry.body_size
+            return entry
+
+    def put(self, key: str, entry: CacheEntry) -> Optional[CacheEntry]:
+        """Stores an entry with absolute expiry times, e.g. one loaded back from another tier"""
+        if entry.size > self.max_bytes:
+            return None
+
+        entry.retain_until = max(entry.retain_until, entry.stale_until + self.fallback_ttl)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            entry.version = next(_versions)
+            self._entries[key] = entry
+            self.bytes += entry.size
+
+            self._maybe_sweep()
+            self._evict()
+            return entry
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def sweep(self) -> int:
+        """Drops every expired entry, returns the number of entries removed"""
+        with self._lock:
+            now = time.time()
+            expired = [key for key, entry in self._entries.items() if entry.retain_until <= now]
+            for key in expired:
+                self._remove(key)
+
+            self.expirations += len(expired)
+            self._last_sweep = now
+            return len(expired)
+
+    def keys(self) -> list[str]:
+        """Snapshot of the cached keys, from least to most recently used"""
+        with self._lock:
+            return list(self._entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "fallback_hits": self.fallback_hits,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "conditional_requests": self.conditional_requests,
+                "not_modified": self.not_modified,
+                "bytes_saved": self.bytes_saved,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+
+    def _maybe_sweep(self) -> None:
+        if time.time() - self._last_sweep >= self.sweep_interval:
+            self.sweep()
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self.bytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False) # least recently used first
+            self.bytes -= entry.size
+            self.evictions += 1
@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.config import Config
+
+
+class CacheBackend(ABC):
+    """
+    Second cache tier behind each client's in-memory ResponseCache.
+
+    Backends store raw response bytes with absolute expiry times so that other
+    processes (or the same process after a restart) can decode and reuse them.
+    """
+
+    # Responses living less than min_ttl seconds are not worth storing in this tier
+    min_ttl: float = 0
+    # True if operations touch the disk or the network and must run off the event loop
+    blocking: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[tuple[bytes, float, float]]:
+        """Returns (content, expires_at, stale_until), or None if missing or past its staleness window"""
+
+    @abstractmethod
+    def set(self, key: str, content: bytes, expires_at: float, stale_until: float) -> None:
+        """Stores raw content until stale_until"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Removes the entry of a key, if any"""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Returns backend counters for monitoring"""
+
+    def close(self) -> None:
+        """Releases files or connections held by the backend"""
+
+
+# Singleton instance for the backend, shared by every client of the process
+_cache_backend_instance = None
+
+def get_cache_backend() -> Optional[CacheBackend]:
+    """Get or create the cache backend configured by Config.CACHE_BACKEND, None for memory only."""
+    global _cache_backend_instance
+    if _cache_backend_instance is None:
+        if Config.CACHE_BACKEND == "disk":
+            from src.api.disk_cache import DiskCache
+            _cache_backend_instance = DiskCache()
+        elif Config.CACHE_BACKEND == "shared":
+            from src.api.shared_cache import SharedMemoryCache
+            _cache_backend_instance = SharedMemoryCache()
+        elif Config.CACHE_BACKEND != "memory":
+            raise ValueError(f"Unknown cache backend : {Config.CACHE_BACKEND}")
+    return _cache_backend_instance
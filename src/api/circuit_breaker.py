@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+from enum import Enum
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed" # requests flow normally
+    OPEN = "open" # upstream considered down, requests fail fast
+    HALF_OPEN = "half_open" # a single probe request decides whether to close again
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of one upstream.
+
+    Opens after `failure_threshold` consecutive failures, fails fast for `reset_timeout`
+    seconds, then lets one probe request through: its success closes the circuit,
+    its failure opens it again.
+    """
+
+    def __init__(self,
+                 name: str,
+                 failure_threshold: int = Config.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = Config.CIRCUIT_BREAKER_RESET_TIMEOUT):
+        self.name: str = name
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+
+        self.state: CircuitState = CircuitState.CLOSED
+        self._failures: int = 0
+        self._opened_at: float = 0
+        self._probe_started_at: float = 0
+        self._lock = threading.Lock()
+
+        self.rejected: int = 0 # requests failed fast while open
+        self.opened: int = 0 # number of times the circuit opened
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+
+            if self.state == CircuitState.CLOSED:
+                return True
+
+            if self.state == CircuitState.OPEN and now - self._opened_at >= self.reset_timeout:
+                self._set_state(CircuitState.HALF_OPEN)
+                self._probe_started_at = now
+                return True
+
+            # an unanswered probe (e.g. cancelled) must not keep the circuit half-open forever
+            if self.state == CircuitState.HALF_OPEN and now - self._probe_started_at >= self.reset_timeout:
+                self._probe_started_at = now
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            if self.state != CircuitState.CLOSED:
+                self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == CircuitState.HALF_OPEN or (self.state == CircuitState.CLOSED and self._failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self.opened += 1
+                self._set_state(CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        logger.warning(f"Circuit breaker of {self.name} : {self.state.value} -> {state.value}")
+        self.state = state
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+# One breaker per upstream base URL, shared by every client of the process
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(base_url: str) -> CircuitBreaker:
+    """Get or create the circuit breaker of an upstream."""
+    with _circuit_breakers_lock:
+        if base_url not in _circuit_breakers:
+            _circuit_breakers[base_url] = CircuitBreaker(base_url)
+        return _circuit_breakers[base_url]
+
+def get_circuit_states() -> dict:
+    """Returns the circuit breaker state of every upstream"""
+    with _circuit_breakers_lock:
+        return {base_url: breaker.stats() for base_url, breaker in _circuit_breakers.items()}
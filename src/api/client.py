@@ -1,14 +1,73 @@
+import asyncio
+import logging
 import random
+import threading
 import httpx
-from typing import Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, AsyncIterator, Iterator
 import time
 
+from src.api.cache import ResponseCache, CacheEntry
+from src.api.cache_backend import CacheBackend, get_cache_backend
+from src.api.circuit_breaker import CircuitBreaker, CircuitState, get_circuit_breaker
+from src.api.json_decoder import get_json_decoder
+from src.api.json_stream import JSONArrayStream
+from src.api.prefetch import PrefetchScheduler, get_prefetch_scheduler
+from src.api.rate_limit import RateLimiter, get_rate_limiter, parse_retry_after
+from src.api.retry import RetryBudget, get_retry_budget
+from src.api.tip_watcher import get_tip_watcher
+from src.api.transport import TransportManager, get_transport_manager
+from src.api.ttl_policy import TTLPolicy, match_policy, resolve_ttl
+from src.api.upstream_score import UpstreamScore, get_upstream_score
 from src.config import Config
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchResult:
+    """
+    Outcome of one GET, `error` tells why it failed.
+    A failed result may still carry expired cached data, served while the upstream is down (stale).
+    """
+    endpoint: str
+    data: Any = None
+    error: Optional[str] = None
+    cached: bool = False
+    latency: Optional[float] = None # round trip of the request that answered, None when no request was sent
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def stale(self) -> bool:
+        """True if the data is the expired fallback of a failed request"""
+        return self.error is not None and self.data is not None
+
+
+class StreamInterrupted(Exception):
+    """A streamed GET failed, `received` items were already yielded (the list is incomplete) unless it is 0"""
+
+    def __init__(self, reason: str, received: int = 0):
+        super().__init__(f"{reason} after {received} items" if received else reason)
+        self.reason: str = reason
+        self.received: int = received
+
+
 # docs = https://www.python-httpx.org/
-class APIClient:
-    """Basic HTTP Client"""
-    
+class BaseAPIClient:
+    """Shared configuration, cache and retry policy of the HTTP Clients"""
+
+    # Per-endpoint cache lifetimes, first match wins, Config.CACHE_TTL_TIME otherwise
+    TTL_POLICIES: tuple[TTLPolicy, ...] = ()
+    # Requests per second and burst allowed by the upstream, 0 for no limit
+    RATE_LIMIT: float = 0
+    RATE_LIMIT_BURST: int = 1
+    # Cache the raw response bodies (decoded on every hit) instead of the decoded objects
+    CACHE_RAW_BYTES: bool = Config.CACHE_RAW_BYTES
+
     def __init__(self, base_url: str):
         self.base_url: str = base_url
 
@@ -18,66 +77,696 @@ class APIClient:
             write=Config.API_WRITE_TIMEOUT,
             pool=Config.API_POOL_TIMEOUT
         )
+        self._transports: TransportManager = get_transport_manager()
+        self._transports.register(base_url, self.timeout)
+
         self.ttl: int = Config.CACHE_TTL_TIME
         self.max_retry: int = Config.MAX_RETRIES
 
         self.enable_retry: bool = Config.ENABLE_RETRY
         self.enable_cache: bool = Config.ENABLE_CACHE
+        self.enable_stale_while_revalidate: bool = Config.ENABLE_STALE_WHILE_REVALIDATE
+
+        self.json_decoder, self._loads = get_json_decoder()
+
+        self._cache: ResponseCache = ResponseCache()
+        self._backend: Optional[CacheBackend] = get_cache_backend()
+
+        self._limiter: Optional[RateLimiter] = None
+        if Config.ENABLE_RATE_LIMIT and self.RATE_LIMIT > 0:
+            self._limiter = get_rate_limiter(base_url, self.RATE_LIMIT, self.RATE_LIMIT_BURST)
 
-        self._cache: Dict[str, tuple] = {}
+        self._retry_budget: RetryBudget = get_retry_budget(base_url)
+        self._breaker: Optional[CircuitBreaker] = get_circuit_breaker(base_url) if Config.ENABLE_CIRCUIT_BREAKER else None
+        self.score: UpstreamScore = get_upstream_score(base_url)
+        self._prefetch: Optional[PrefetchScheduler] = get_prefetch_scheduler() if Config.ENABLE_PREFETCH else None
+        if any(policy.tip_dependent for policy in self.TTL_POLICIES):
+            get_tip_watcher().register(self)
 
-        self.client = httpx.Client(timeout=self.timeout)
+        self.coalesced_requests: int = 0 # callers served by an already in-flight request
+        self.revalidations: int = 0 # background refreshes started by stale-while-revalidate
+
+        with _api_clients_lock:
+            _api_clients[base_url] = self
 
     def _get_from_cache(self, key: str):
         if not self.enable_cache:
             return None
 
-        entry = self._cache.get(key)
-        if not entry:
+        return self._cached_value(self._cache.get(key))
+
+    def _get_stale_from_cache(self, key: str):
+        if not self.enable_cache or not self.enable_stale_while_revalidate:
+            return None
+
+        return self._cached_value(self._cache.get_stale(key))
+
+    def _save_to_cache(self, key: str, endpoint: str, data: Any, response: httpx.Response) -> Optional[CacheEntry]:
+        if not self.enable_cache:
+            return None
+
+        ttl, stale_ttl = resolve_ttl(self.TTL_POLICIES, self, endpoint, data, self.ttl)
+        return self._cache.set(
+            key, response.content if self.CACHE_RAW_BYTES else data, ttl, self._entry_size(response.content), stale_ttl,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            body_size=len(response.content),
+        )
+
+    def _entry_size(self, content: bytes) -> int:
+        """Memory held by the cached copy of a body, decoded documents are estimated from the body size"""
+        if self.CACHE_RAW_BYTES:
+            return len(content)
+        return int(len(content) * Config.CACHE_DECODED_SIZE_FACTOR)
+
+    def _conditional_headers(self, key: str) -> dict:
+        if not self.enable_cache:
+            return {}
+
+        return self._cache.validators(key)
+
+    def _refresh_cache(self, key: str, endpoint: str) -> Optional[Any]:
+        """304 Not Modified : the cached entry is valid again for a new TTL, returns its data"""
+        entry = self._cache.get_entry(key) if self.enable_cache else None
+        if entry is None:
             return None
 
-        data, timestamp = entry
-        if time.time() - timestamp < self.ttl:
-            return data
+        data = self._cached_value(entry.data)
+        ttl, stale_ttl = resolve_ttl(self.TTL_POLICIES, self, endpoint, data, self.ttl)
+        return data if self._cache.refresh(key, ttl, stale_ttl) is not None else None
+
+    def _needs_backend(self, key: str) -> bool:
+        """True if memory holds nothing fresh for the key, a retained expired entry may be outdated by another worker"""
+        if self._backend is None or not self.enable_cache:
+            return False
+
+        entry = self._cache.get_entry(key)
+        return entry is None or entry.expires_at <= time.time()
+
+    def _load_from_backend(self, key: str) -> None:
+        """Promotes a backend entry into the memory cache when it is newer than the one memory holds, if any"""
+        if not self._needs_backend(key):
+            return
+
+        row = self._backend.get(key)
+        if row is None:
+            return
+
+        content, expires_at, stale_until = row
+        current = self._cache.get_entry(key)
+        if current is not None and current.expires_at >= expires_at:
+            return # memory already holds this copy or a newer one
+
+        data = content if self.CACHE_RAW_BYTES else self._decode(content)
+        self._cache.put(key, CacheEntry(data=data, expires_at=expires_at, size=self._entry_size(content), stale_until=stale_until,
+                                        body_size=len(content)))
+
+    def _save_to_backend(self, key: str, entry: Optional[CacheEntry], content: bytes) -> None:
+        if self._backend is None or entry is None:
+            return
+
+        if entry.stale_until - time.time() >= self._backend.min_ttl:
+            self._backend.set(key, content, entry.expires_at, entry.stale_until)
+
+    def _is_tip_dependent(self, endpoint: str) -> bool:
+        policy, _ = match_policy(self.TTL_POLICIES, endpoint)
+        return policy is not None and policy.tip_dependent
+
+    def _invalidate_tip_dependent(self) -> list[tuple[str, str, bool]]:
+        """Drops the memory entries of tip-dependent endpoints, returns (url, endpoint, still in use) of each"""
+        invalidated = []
+        now = time.time()
+        for url in self._cache.keys():
+            if not url.startswith(self.base_url):
+                continue
+            endpoint = url[len(self.base_url):]
+            if not self._is_tip_dependent(endpoint):
+                continue
+
+            entry = self._cache.get_entry(url)
+            self._cache.delete(url)
+            invalidated.append((url, endpoint, entry is not None and entry.stale_until > now))
+        return invalidated
 
-        return None
+    def expires_in(self, endpoint: str) -> Optional[float]:
+        """Seconds until the cached entry of the endpoint expires (negative once expired), None if not cached"""
+        entry = self._cache.get_entry(f"{self.base_url}{endpoint}") if self.enable_cache else None
+        return entry.expires_at - time.time() if entry is not None else None
+
+    def cache_version(self, endpoint: str) -> Optional[int]:
+        """Version of the cached data of the endpoint, whatever its freshness, None if not cached"""
+        entry = self._cache.get_entry(f"{self.base_url}{endpoint}") if self.enable_cache else None
+        return entry.version if entry is not None else None
+
+    def cache_stats(self) -> dict:
+        """Returns hits, misses, evictions and size of this client's cache (and of the shared backend tier)"""
+        stats = self._cache.stats()
+        stats["json_decoder"] = self.json_decoder
+        if self._backend is not None:
+            stats["backend"] = self._backend.stats()
+        return stats
+
+    def _decode(self, content: bytes) -> Any:
+        try:
+            return self._loads(content)
+        except ValueError:
+            return content.decode("utf-8", errors="replace")
+
+    def _cached_value(self, data: Any) -> Any:
+        """Raw bodies are the only bytes the cache holds, decoded texts are str"""
+        return self._decode(data) if isinstance(data, bytes) else data
+
+    def rate_limit_stats(self) -> Optional[dict]:
+        """Returns the state of the upstream rate limiter, including its queue depth"""
+        return self._limiter.stats() if self._limiter is not None else None
+
+    def has_spare_capacity(self, reserve: float) -> bool:
+        """True if a request can be sent right away while keeping `reserve` of the burst for the others"""
+        return self._limiter is None or self._limiter.available() >= max(1.0, self._limiter.burst * reserve)
+
+    def circuit_stats(self) -> Optional[dict]:
+        """Returns the circuit breaker state of the upstream"""
+        return self._breaker.stats() if self._breaker is not None else None
+
+    def is_available(self) -> bool:
+        """False while the circuit breaker of the upstream is open"""
+        return self._breaker is None or self._breaker.state != CircuitState.OPEN
+
+    def _allow_request(self) -> bool:
+        return self._breaker is None or self._breaker.allow_request()
+
+    def _record_outcome(self, error: Optional[Exception], started: float) -> None:
+        """Feeds the circuit breaker and the upstream score, only timeouts, network errors and 5xx count as upstream failures"""
+        answered = error is None or isinstance(error, httpx.HTTPStatusError)
+        self.score.record(time.monotonic() - started if answered else None, error is not None and self._is_upstream_failure(error))
+
+        if self._breaker is None:
+            return
+
+        if error is None:
+            self._breaker.record_success()
+        elif self._is_upstream_failure(error):
+            self._breaker.record_failure()
+        elif not (isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429):
+            self._breaker.record_success() # the upstream answered, the request itself was wrong
+
+    @staticmethod
+    def _is_upstream_failure(error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code >= 500
+        return isinstance(error, (httpx.TimeoutException, httpx.NetworkError))
+
+    def _fallback(self, key: str) -> Optional[Any]:
+        """Expired cached data, served when the upstream is down (open circuit, 5xx, timeout) rather than nothing"""
+        if not self.enable_cache or not Config.CIRCUIT_BREAKER_SERVE_STALE:
+            return None
+        return self._cached_value(self._cache.peek(key))
+
+    def _failed(self, endpoint: str, url: str, error: Exception | str) -> FetchResult:
+        """Result of a request given up, with the fallback data when the upstream itself is at fault"""
+        if isinstance(error, str):
+            return FetchResult(endpoint, self._fallback(url), error)
+        return FetchResult(endpoint, self._fallback(url) if self._is_upstream_failure(error) else None, self._describe(error))
+
+    @staticmethod
+    def _describe(error: Exception) -> str:
+        if isinstance(error, httpx.HTTPStatusError):
+            return f"HTTP {error.response.status_code}"
+        return f"{type(error).__name__}: {error}"
+
+    def _degraded(self, result: FetchResult) -> FetchResult:
+        if result.stale:
+            logger.warning(f"Serving stale data of {self.base_url}{result.endpoint} : {result.error}")
+        return result
+
+    def retry_stats(self) -> dict:
+        """Returns retries, retry budget exhaustions and backoff sleep time of the upstream"""
+        return self._retry_budget.stats()
+
+    def stats(self) -> dict:
+        """Returns the cache, rate limit, retry and request coalescing counters of the client"""
+        return {
+            "cache": self.cache_stats(),
+            "rate_limit": self.rate_limit_stats(),
+            "retries": self.retry_stats(),
+            "coalesced_requests": self.coalesced_requests,
+            "revalidations": self.revalidations,
+        }
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status == 429 or 500 <= status < 600
+        return isinstance(error, (httpx.TimeoutException, httpx.NetworkError))
+
+    def _should_retry(self, error: Exception, attempts: int) -> bool:
+        return self.enable_retry and self._is_retryable(error) and attempts < self.max_retry
+
+    def _retry_delay(self, error: Exception, attempts: int) -> Optional[float]:
+        """Returns how long to wait before the next attempt, or None to give up"""
+        retry_after = None
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code in (429, 503):
+            retry_after = parse_retry_after(error.response)
+
+        if not self._should_retry(error, attempts):
+            return None
+        if retry_after is not None and retry_after > Config.MAX_RETRY_AFTER:
+            return None
+        if not self._retry_budget.try_spend():
+            return None
+
+        if retry_after is not None and self._limiter is not None:
+            self._limiter.pause_for(retry_after) # every caller of this upstream backs off, not only this one
+        delay = retry_after if retry_after is not None else self._backoff(attempts)
+        self._retry_budget.record_sleep(delay)
+        return delay
+
+    @staticmethod
+    def _backoff(attempts: int) -> float:
+        return min(10, random.uniform(0, 2**attempts)) # Exponential Backoff with Full Jitter
+
+
+class APIClient(BaseAPIClient):
+    """Basic HTTP Client (blocking, kept for compatibility)"""
+
+    def __init__(self, base_url: str):
+        super().__init__(base_url)
+
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Blocking client of the host's shared connection pool"""
+        return self._transports.sync_client(self.base_url)
 
-    def _save_to_cache(self, key: str, data: Any):
-        if self.enable_cache:
-            self._cache[key] = (data, time.time())
-    
     def get(self, endpoint: str) -> Optional[Dict[Any, Any]]:
-        """GET with TTL cache"""
+        """GET with TTL cache, concurrent calls for the same URL share one request"""
+        return self.get_result(endpoint).data
+
+    def get_result(self, endpoint: str) -> FetchResult:
+        """get() telling why it failed, and whether its data is a stale fallback served because it failed"""
         url = f"{self.base_url}{endpoint}"
 
-        cached = self._get_from_cache(url)
+        cached = self._lookup(url)
         if cached is not None:
-            return cached
+            return FetchResult(endpoint, cached, cached=True)
+        return self._degraded(self._get_uncached(url, endpoint))
 
-        for attempts in range(self.max_retry + 1):
+    def get_many(self, endpoints: list[str], max_concurrency: int = Config.GET_MANY_MAX_CONCURRENCY) -> list[FetchResult]:
+        """
+        GETs several endpoints through get_result(), results in the same order with per-item errors.
+        Duplicates are requested once and at most max_concurrency endpoints are read at a time,
+        each still going through the cache, coalescing, rate limit and retries.
+        """
+        def fetch(endpoint: str) -> FetchResult:
             try:
-                response = self.client.get(url)
+                return self.get_result(endpoint)
+            except Exception as e:
+                return FetchResult(endpoint, error=f"{type(e).__name__}: {e}")
+
+        unique = list(dict.fromkeys(endpoints))
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(unique)))) as pool:
+            results = dict(zip(unique, pool.map(fetch, unique)))
+        return [results[endpoint] for endpoint in endpoints]
+
+    def _lookup(self, url: str) -> Optional[Any]:
+        self._load_from_backend(url)
+        return self._get_from_cache(url)
+
+    def _get_uncached(self, url: str, endpoint: str) -> FetchResult:
+        stale = self._get_stale_from_cache(url)
+        if stale is not None:
+            if url not in self._inflight:
+                self.revalidations += 1
+                threading.Thread(target=self._shared_fetch, args=(url, endpoint), daemon=True).start()
+            return FetchResult(endpoint, stale, cached=True)
+
+        return self._shared_fetch(url, endpoint)
+
+    def _shared_fetch(self, url: str, endpoint: str) -> FetchResult:
+        with self._inflight_lock:
+            future = self._inflight.get(url)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[url] = future
+            else:
+                self.coalesced_requests += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = self._fetch(endpoint)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(url, None)
+
+    def _fetch(self, endpoint: str) -> FetchResult:
+        url = f"{self.base_url}{endpoint}"
+
+        self._retry_budget.record_request()
+        headers = self._conditional_headers(url)
+
+        attempts = 0
+        while attempts <= self.max_retry:
+            if not self._allow_request():
+                return self._failed(endpoint, url, "circuit open")
+
+            if self._limiter is not None and not self._limiter.acquire_sync(Config.RATE_LIMIT_MAX_WAIT):
+                return self._failed(endpoint, url, "rate limit wait exceeded")
+
+            started = time.monotonic()
+            try:
+                response = self.client.get(url, headers=headers)
+                if response.status_code == 304:
+                    self._record_outcome(None, started)
+                    data = self._refresh_cache(url, endpoint)
+                    if data is not None:
+                        return FetchResult(endpoint, data, latency=time.monotonic() - started)
+                    headers = {} # evicted meanwhile, downloaded again at once : not a failed attempt
+                    continue
+
                 response.raise_for_status()
+                self._record_outcome(None, started)
+
+                data = self._decode(response.content)
+                entry = self._save_to_cache(url, endpoint, data, response)
+                self._save_to_backend(url, entry, response.content)
+                return FetchResult(endpoint, data, latency=time.monotonic() - started)
+
+            except (httpx.HTTPStatusError, httpx.TimeoutException, httpx.NetworkError) as e:
+                self._record_outcome(e, started)
+                delay = self._retry_delay(e, attempts)
+                if delay is None:
+                    return self._failed(endpoint, url, e)
+
+            time.sleep(delay)
+            attempts += 1
+
+        return self._failed(endpoint, url, "retries exhausted")
+
+    def stream_items(self, endpoint: str, key: Optional[str] = None) -> Iterator[Any]:
+        """
+        GET yielding the items of a JSON array (the document, or its `key` member) as they arrive.
+        A fresh cached document, or the one of a GET of the same URL in flight, is iterated instead,
+        streamed bodies are never cached. The request is retried like get() until its first item,
+        a failure raises StreamInterrupted telling how many items were already yielded.
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        document = self._get_from_cache(url)
+        future = self._inflight.get(url) if document is None else None
+        if future is not None:
+            self.coalesced_requests += 1
+            result = future.result()
+            if not result.ok:
+                raise StreamInterrupted(result.error)
+            document = result.data
+        if document is not None:
+            yield from (document if key is None else document.get(key, []))
+            return
+
+        self._retry_budget.record_request()
+        received = 0
+
+        for attempts in range(self.max_retry + 1):
+            if not self._allow_request():
+                raise StreamInterrupted("circuit open")
+            if self._limiter is not None and not self._limiter.acquire_sync(Config.RATE_LIMIT_MAX_WAIT):
+                raise StreamInterrupted("rate limit wait exceeded")
+
+            started = time.monotonic()
+            try:
+                with self.client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    self._record_outcome(None, started)
+
+                    parser = JSONArrayStream(key)
+                    for chunk in response.iter_bytes():
+                        for item in parser.feed(chunk):
+                            received += 1
+                            yield item
+                        if parser.done:
+                            return
+                    parser.close()
+                    return
+            except httpx.HTTPError as e:
+                self._record_outcome(e, started)
+                delay = self._retry_delay(e, attempts) if not received else None # yielded items can not be taken back
+                if delay is None:
+                    raise StreamInterrupted(self._describe(e), received) from e
+            except ValueError as e: # malformed or truncated body
+                raise StreamInterrupted(f"Malformed body: {e}", received) from e
+
+            time.sleep(delay)
+
+        raise StreamInterrupted("retries exhausted")
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class AsyncAPIClient(BaseAPIClient):
+    """Asynchronous HTTP Client"""
+
+    def __init__(self, base_url: str):
+        super().__init__(base_url)
+
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._tip_generation: int = 0 # bumped on every new block
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Async client of the host's shared connection pool"""
+        return self._transports.client(self.base_url)
+
+    async def get(self, endpoint: str) -> Optional[Dict[Any, Any]]:
+        """GET with TTL cache, awaited on the event loop, concurrent calls for the same URL share one request"""
+        return (await self.get_result(endpoint)).data
+
+    async def get_result(self, endpoint: str) -> FetchResult:
+        """get() telling why it failed, and whether its data is a stale fallback served because it failed"""
+        url = f"{self.base_url}{endpoint}"
+        if self._prefetch is not None:
+            self._prefetch.touch(self, endpoint)
+
+        cached = await self._lookup(url)
+        if cached is not None:
+            return FetchResult(endpoint, cached, cached=True)
+        return self._degraded(await self._get_uncached(url, endpoint))
+
+    async def get_many(self, endpoints: list[str], max_concurrency: int = Config.GET_MANY_MAX_CONCURRENCY) -> list[FetchResult]:
+        """
+        GETs several endpoints through get_result(), results in the same order with per-item errors.
+        Duplicates are requested once and at most max_concurrency endpoints are read at a time,
+        each still going through the cache, coalescing, rate limit and retries.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
 
+        async def fetch(endpoint: str) -> FetchResult:
+            async with semaphore:
                 try:
-                    data = response.json()
-                except ValueError:
-                    data = response.text
+                    return await self.get_result(endpoint)
+                except Exception as e:
+                    return FetchResult(endpoint, error=f"{type(e).__name__}: {e}")
+
+        unique = list(dict.fromkeys(endpoints))
+        results = dict(zip(unique, await asyncio.gather(*(fetch(endpoint) for endpoint in unique))))
+        return [results[endpoint] for endpoint in endpoints]
+
+    async def refresh(self, endpoint: str) -> FetchResult:
+        """Requests the endpoint whatever the state of its cached entry, joining the request in flight if any"""
+        url = f"{self.base_url}{endpoint}"
+        task = self._inflight.get(url)
+        if task is None:
+            task = self._start_fetch(url, endpoint)
+        return await asyncio.shield(task)
+
+    async def on_new_tip(self) -> int:
+        """
+        Invalidates the tip-dependent entries (memory and backend) and downloads again those
+        still in use, returns the number of entries invalidated. Their requests already in flight
+        were sent before the block : they are no longer joined and their answer is not cached.
+        """
+        self._tip_generation += 1
+        for url in [url for url in self._inflight if self._is_tip_dependent(url[len(self.base_url):])]:
+            del self._inflight[url]
+
+        invalidated = self._invalidate_tip_dependent()
+        if self._backend is not None:
+            for url, _, _ in invalidated:
+                await self._run_backend(self._backend.delete, url)
+
+        await asyncio.gather(*(self.refresh(endpoint) for _, endpoint, in_use in invalidated if in_use), return_exceptions=True)
+        return len(invalidated)
+
+    async def _lookup(self, url: str) -> Optional[Any]:
+        if self._needs_backend(url):
+            await self._run_backend(self._load_from_backend, url)
+        return self._get_from_cache(url)
+
+    async def _get_uncached(self, url: str, endpoint: str) -> FetchResult:
+        stale = self._get_stale_from_cache(url)
+        if stale is not None:
+            if url not in self._inflight:
+                self.revalidations += 1
+                self._start_fetch(url, endpoint)
+            return FetchResult(endpoint, stale, cached=True)
+
+        task = self._inflight.get(url)
+        if task is None:
+            task = self._start_fetch(url, endpoint)
+        else:
+            self.coalesced_requests += 1
+
+        # shield: a cancelled caller must not cancel the request the others are waiting on
+        return await asyncio.shield(task)
+
+    async def _run_backend(self, func, *args) -> None:
+        """Blocking backends (disk) run in a worker thread, the others inline"""
+        if self._backend.blocking:
+            await asyncio.to_thread(func, *args)
+        else:
+            func(*args)
+
+    def _start_fetch(self, url: str, endpoint: str) -> asyncio.Task:
+        task = asyncio.ensure_future(self._fetch(endpoint, self._tip_generation))
+        self._inflight[url] = task
+
+        def done(_) -> None:
+            if self._inflight.get(url) is task: # not replaced by a request sent after a new block
+                del self._inflight[url]
+
+        task.add_done_callback(done)
+        return task
+
+    async def _fetch(self, endpoint: str, tip_generation: int) -> FetchResult:
+        """`tip_generation` of the request, a tip-dependent answer is only cached if no block arrived meanwhile"""
+        url = f"{self.base_url}{endpoint}"
+
+        self._retry_budget.record_request()
+        headers = self._conditional_headers(url)
+
+        attempts = 0
+        while attempts <= self.max_retry:
+            if not self._allow_request():
+                return self._failed(endpoint, url, "circuit open")
+
+            if self._limiter is not None and not await self._limiter.acquire(Config.RATE_LIMIT_MAX_WAIT):
+                return self._failed(endpoint, url, "rate limit wait exceeded")
+
+            started = time.monotonic()
+            try:
+                response = await self.client.get(url, headers=headers)
+                if response.status_code == 304:
+                    self._record_outcome(None, started)
+                    data = self._refresh_cache(url, endpoint)
+                    if data is not None:
+                        return FetchResult(endpoint, data, latency=time.monotonic() - started)
+                    headers = {} # evicted meanwhile, downloaded again at once : not a failed attempt
+                    continue
+
+                response.raise_for_status()
+                self._record_outcome(None, started)
+
+                data = self._decode(response.content)
+                if tip_generation != self._tip_generation and self._is_tip_dependent(endpoint):
+                    # sent before the last block, this answer describes the previous tip
+                    return FetchResult(endpoint, data, latency=time.monotonic() - started)
+
+                entry = self._save_to_cache(url, endpoint, data, response)
+                if self._backend is not None:
+                    await self._run_backend(self._save_to_backend, url, entry, response.content)
+                return FetchResult(endpoint, data, latency=time.monotonic() - started)
+
+            except (httpx.HTTPStatusError, httpx.TimeoutException, httpx.NetworkError) as e:
+                self._record_outcome(e, started)
+                delay = self._retry_delay(e, attempts)
+                if delay is None:
+                    return self._failed(endpoint, url, e)
+
+            await asyncio.sleep(delay)
+            attempts += 1
+
+        return self._failed(endpoint, url, "retries exhausted")
+
+    async def stream_items(self, endpoint: str, key: Optional[str] = None) -> AsyncIterator[Any]:
+        """
+        GET yielding the items of a JSON array (the document, or its `key` member) as they arrive.
+        A fresh cached document, or the one of a GET of the same URL in flight, is iterated instead,
+        streamed bodies are never cached. Only the item being received is held in memory, whatever
+        the size of the body. The request is retried like get() until its first item, a failure
+        raises StreamInterrupted telling how many items were already yielded.
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        document = self._get_from_cache(url)
+        task = self._inflight.get(url) if document is None else None
+        if task is not None:
+            self.coalesced_requests += 1
+            result = await asyncio.shield(task)
+            if not result.ok:
+                raise StreamInterrupted(result.error)
+            document = result.data
+        if document is not None:
+            for item in (document if key is None else document.get(key, [])):
+                yield item
+            return
+
+        self._retry_budget.record_request()
+        received = 0
+
+        for attempts in range(self.max_retry + 1):
+            if not self._allow_request():
+                raise StreamInterrupted("circuit open")
+            if self._limiter is not None and not await self._limiter.acquire(Config.RATE_LIMIT_MAX_WAIT):
+                raise StreamInterrupted("rate limit wait exceeded")
+
+            started = time.monotonic()
+            try:
+                async with self.client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    self._record_outcome(None, started)
+
+                    parser = JSONArrayStream(key)
+                    async for chunk in response.aiter_bytes():
+                        for item in parser.feed(chunk):
+                            received += 1
+                            yield item
+                        if parser.done:
+                            return # the rest of the body is dropped with the connection
+                    parser.close()
+                    return
+            except httpx.HTTPError as e:
+                self._record_outcome(e, started)
+                delay = self._retry_delay(e, attempts) if not received else None # yielded items can not be taken back
+                if delay is None:
+                    raise StreamInterrupted(self._describe(e), received) from e
+            except ValueError as e: # malformed or truncated body
+                raise StreamInterrupted(f"Malformed body: {e}", received) from e
 
-                self._save_to_cache(url, data)
-                return data
+            await asyncio.sleep(delay)
 
-            except httpx.HTTPStatusError as e:
-                status = e.response.status_code
-                retryable = 500 <= status < 600
-            except (httpx.TimeoutException, httpx.NetworkError):
-                retryable = True
+        raise StreamInterrupted("retries exhausted")
 
+    async def aclose(self) -> None:
+        await self.client.aclose()
 
-            if not self.enable_retry or not retryable or attempts >= self.max_retry:
-                return None
 
-            sleep_time = min(10, random.randint(0, 2**attempts)) # Exponential Backoff with Full Jitter
-            time.sleep(sleep_time)
+# Every client of the process by base URL, published for monitoring
+_api_clients: dict[str, BaseAPIClient] = {}
+_api_clients_lock = threading.Lock()
 
-        return None
\ No newline at end of file
+def get_client_stats() -> dict:
+    """Returns the cache, rate limit, retry and coalescing counters of every client"""
+    with _api_clients_lock:
+        clients = list(_api_clients.items())
+    return {base_url: client.stats() for base_url, client in clients}
@@ -0,0 +1,151 @@
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from src.api.cache_backend import CacheBackend
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+# docs = https://www.sqlite.org/wal.html
+class DiskCache(CacheBackend):
+    """
+    Persistent second cache tier, stores raw response bytes with their expiry in SQLite.
+
+    WAL journaling and a busy timeout make the file safe to share between server processes.
+    """
+
+    min_ttl: float = Config.DISK_CACHE_MIN_TTL
+    blocking: bool = True
+
+    def __init__(self,
+                 path: str = Config.DISK_CACHE_PATH,
+                 max_bytes: int = Config.DISK_CACHE_MAX_BYTES,
+                 compact_interval: float = Config.DISK_CACHE_COMPACT_INTERVAL):
+        self.path: Path = Path(path)
+        self.max_bytes: int = max_bytes
+        self.compact_interval: float = compact_interval
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None # opened lazily on first use
+        self._last_compaction: float = time.time()
+        self._compacting: bool = False
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.writes: int = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " content BLOB NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " stale_until REAL NOT NULL,"
+                " stored_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_stale_until ON responses(stale_until)")
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[tuple[bytes, float, float]]:
+        """Returns (content, expires_at, stale_until), or None if missing or past its staleness window"""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT content, expires_at, stale_until FROM responses WHERE key = ? AND stale_until > ?",
+                    (key, time.time())
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed : {e}")
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return bytes(row[0]), row[1], row[2]
+
+    def set(self, key: str, content: bytes, expires_at: float, stale_until: float) -> None:
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO responses (key, content, expires_at, stale_until, stored_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, content, expires_at, stale_until, time.time())
+                )
+                self.writes += 1
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache write failed : {e}")
+            return
+
+        self._maybe_compact()
+
+    def delete(self, key: str) -> None:
+        try:
+            with self._lock:
+                self._connect().execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache delete failed : {e}")
+
+    def compact(self) -> int:
+        """Drops expired rows, then the oldest rows until under max_bytes, returns the number of rows removed"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                removed = conn.execute("DELETE FROM responses WHERE stale_until <= ?", (time.time(),)).rowcount
+
+                total = conn.execute("SELECT COALESCE(SUM(LENGTH(content)), 0) FROM responses").fetchone()[0]
+                if total > self.max_bytes:
+                    rows = conn.execute("SELECT key, LENGTH(content) FROM responses ORDER BY stored_at").fetchall()
+                    for key, size in rows:
+                        if total <= self.max_bytes:
+                            break
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        total -= size
+                        removed += 1
+
+                conn.execute("PRAGMA incremental_vacuum")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                return removed
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache compaction failed : {e}")
+            return 0
+
+    def _maybe_compact(self) -> None:
+        if self._compacting or time.time() - self._last_compaction < self.compact_interval:
+            return
+
+        self._compacting = True
+        self._last_compaction = time.time()
+        threading.Thread(target=self._compact_in_background, daemon=True).start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            removed = self.compact()
+            logger.debug(f"Disk cache compacted, {removed} rows removed")
+        finally:
+            self._compacting = False
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
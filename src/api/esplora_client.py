@@ -0,0 +1,57 @@
+import logging
+from typing import Optional
+from src.api.client import AsyncAPIClient
+from src.api.ttl_policy import TTLPolicy
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+class EsploraClient(AsyncAPIClient):
+    """Self-hosted Esplora instance, same payloads as the Mempool.space REST API it derives from"""
+
+    TTL_POLICIES = (
+        TTLPolicy(r"^/blocks$", ttl=30, tip_dependent=True),
+        TTLPolicy(r"^/address/", ttl=30),
+    )
+
+    def __init__(self, base_url: str):
+        super().__init__(base_url.rstrip("/"))
+
+
+    # === BITCOIN BLOCKS INFORMATIONS ===
+
+    async def get_blocks_info(self) -> Optional[list[dict]]:
+        """
+        Returns details on the last 10 blocks, newest first
+        Docs : https://github.com/Blockstream/esplora/blob/master/API.md#get-blocksstart_height
+        """
+        try:
+            return await self.get("/blocks")
+        except Exception as e:
+            logger.error(f"Failed to fetch data from Esplora : {e}")
+            return None
+
+
+    # === BITCOIN ADDRESSES INFORMATIONS ===
+
+    async def get_address_info(self, address: str) -> Optional[dict]:
+        """
+        Returns the information for a Bitcoin address
+        Docs : https://github.com/Blockstream/esplora/blob/master/API.md#get-addressaddress
+        """
+        try:
+            return await self.get(f"/address/{address}")
+        except Exception as e:
+            logger.error(f"Failed to fetch data from Esplora : {e}")
+            return None
+
+
+# Singleton instance for the client
+_esplora_instance = None
+
+def get_esplora_client() -> Optional[EsploraClient]:
+    """Get or create the Esplora API client singleton instance, None when no instance is configured."""
+    global _esplora_instance
+    if _esplora_instance is None and Config.ESPLORA_API_URL:
+        _esplora_instance = EsploraClient(Config.ESPLORA_API_URL)
+    return _esplora_instance
@@ -0,0 +1,324 @@
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Optional
+
+from src.config import Config
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"BTCHDR02"
+# magic, lowest and highest height of the contiguous synced range, then of the older range the
+# sync is walking back to after a gap (+1, 0 while empty)
+_FILE_HEADER = struct.Struct("<8sIIII")
+# block hash, block time, present flag
+_RECORD = struct.Struct("<32sII")
+_SLOT = struct.Struct("<I") # height + 1 of the block whose hash lands in the slot, 0 when free
+
+
+# docs = https://docs.python.org/3/library/mmap.html
+class HeaderStore:
+    """
+    Block hashes and times of the whole chain, indexed by height in a memory-mapped file.
+
+    Records are fixed-size (40 bytes) and live at height * 40, followed by an open-addressing
+    hash table mapping a block hash back to its height, so both directions are a few memory
+    reads. The file is sparse and mainnet fits in about 50 MB. The contiguous range
+    [low, tip] is synced from the upstream, the blocks near the tip are re-checked on every
+    sync and overwritten when a reorg replaced them. After a downtime longer than one sync
+    budget, the range synced before it is kept aside and the following syncs walk down the gap
+    until they reach it, then both ranges are merged.
+    """
+
+    def __init__(self, path: str = Config.HEADER_STORE_PATH, capacity: int = Config.HEADER_STORE_CAPACITY):
+        self.path: Path = Path(path)
+        self.capacity: int = capacity
+        self.slots: int = 1 << (2 * capacity - 1).bit_length() # load factor below 0.5
+
+        self._records_offset: int = _FILE_HEADER.size
+        self._index_offset: int = self._records_offset + capacity * _RECORD.size
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd: int = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.pread(self._fd, len(_MAGIC), 0) not in (_MAGIC, b""):
+            os.ftruncate(self._fd, 0) # written by another version of the layout, synced again
+        size = self._index_offset + self.slots * _SLOT.size
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size) # sparse, pages are only allocated once written
+        self._mm = mmap.mmap(self._fd, size)
+
+        self._lock = threading.Lock()
+        if _FILE_HEADER.unpack_from(self._mm, 0)[0] != _MAGIC:
+            _FILE_HEADER.pack_into(self._mm, 0, _MAGIC, 0, 0, 0, 0)
+
+        self.syncs: int = 0
+        self.reorgs: int = 0 # stored blocks replaced by another block at the same height
+
+        self._task: Optional[asyncio.Task] = None
+        self._sessions: int = 0
+
+    @property
+    def low(self) -> Optional[int]:
+        """Lowest height of the synced range, read from the file as other processes may sync it"""
+        low = _FILE_HEADER.unpack_from(self._mm, 0)[1]
+        return low - 1 if low else None
+
+    @property
+    def tip(self) -> Optional[int]:
+        tip = _FILE_HEADER.unpack_from(self._mm, 0)[2]
+        return tip - 1 if tip else None
+
+    @property
+    def older(self) -> Optional[tuple[int, int]]:
+        """(low, tip) of the range synced before a gap not walked down yet, None without gap"""
+        low, tip = _FILE_HEADER.unpack_from(self._mm, 0)[3:]
+        return (low - 1, tip - 1) if low else None
+
+    # === LOOKUPS ===
+
+    def _record(self, height: int) -> Optional[tuple[bytes, int]]:
+        if not 0 <= height < self.capacity:
+            return None
+        block_hash, timestamp, present = _RECORD.unpack_from(self._mm, self._records_offset + height * _RECORD.size)
+        return (block_hash, timestamp) if present else None
+
+    def hash_at(self, height: int) -> Optional[str]:
+        record = self._record(height)
+        return record[0].hex() if record is not None else None
+
+    def timestamp_at(self, height: int) -> Optional[int]:
+        record = self._record(height)
+        return record[1] if record is not None and record[1] else None
+
+    def height_of(self, block_hash: str) -> Optional[int]:
+        try:
+            key = bytes.fromhex(block_hash)
+        except ValueError:
+            return None
+
+        for offset in self._probe(key):
+            value = _SLOT.unpack_from(self._mm, offset)[0]
+            if value == 0:
+                return None
+            record = self._record(value - 1)
+            if record is not None and record[0] == key:
+                return value - 1
+        return None
+
+    def height_at_time(self, timestamp: int) -> Optional[int]:
+        """
+        Height of the last block mined at or before the timestamp, within the synced range.
+        Block times are only roughly ordered (a block may be up to 2 hours early), so the answer
+        may be a few blocks off around that instant.
+        """
+        lo, hi = self.low, self.tip
+        if lo is None or (self.timestamp_at(lo) or 0) > timestamp:
+            return None
+
+        while lo < hi:
+            middle = (lo + hi + 1) // 2
+            block_time = self.timestamp_at(middle)
+            if block_time is None:
+                return None
+            if block_time <= timestamp:
+                lo = middle
+            else:
+                hi = middle - 1
+        return lo
+
+    def is_final(self, height: int) -> bool:
+        """True if the block is buried deep enough under the synced tip to never change"""
+        tip = self.tip
+        return tip is not None and tip - height + 1 >= Config.REORG_SAFE_DEPTH
+
+    def _probe(self, key: bytes):
+        # block hashes start with zeros in display order, their end is uniformly distributed
+        slot = int.from_bytes(key[-8:], "little") & (self.slots - 1)
+        for i in range(self.slots):
+            yield self._index_offset + ((slot + i) & (self.slots - 1)) * _SLOT.size
+
+    # === WRITES ===
+
+    def put(self, height: int, block_hash: str, timestamp: Optional[int] = None) -> bool:
+        """Stores a block, returns True if it replaced another block at that height (reorg)"""
+        if not 0 <= height < self.capacity:
+            return False
+        key = bytes.fromhex(block_hash)
+
+        with self._write_lock():
+            previous = self._record(height)
+            if previous is not None and previous[0] == key and (timestamp is None or previous[1] == timestamp):
+                return False
+
+            if timestamp is None:
+                timestamp = previous[1] if previous is not None and previous[0] == key else 0
+            _RECORD.pack_into(self._mm, self._records_offset + height * _RECORD.size, key, timestamp, 1)
+
+            for offset in self._probe(key):
+                value = _SLOT.unpack_from(self._mm, offset)[0]
+                if value == 0 or value == height + 1:
+                    _SLOT.pack_into(self._mm, offset, height + 1)
+                    break
+
+        replaced = previous is not None and previous[0] != key
+        if replaced:
+            self.reorgs += 1
+            logger.info(f"Block {height} replaced by {block_hash} (reorg)")
+        return replaced
+
+    def _set_range(self, low: int, tip: int, older: Optional[tuple[int, int]] = None) -> None:
+        older_low, older_tip = (older[0] + 1, older[1] + 1) if older is not None else (0, 0)
+        with self._write_lock():
+            _FILE_HEADER.pack_into(self._mm, 0, _MAGIC, low + 1, tip + 1, older_low, older_tip)
+
+    @contextmanager
+    def _write_lock(self):
+        """Writers of every process sharing the file take turns, readers never wait"""
+        with self._lock:
+            if fcntl is not None:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    # === SYNC ===
+
+    def _apply(self, blocks: list[dict]) -> Optional[dict]:
+        """Stores a batch of /v1/blocks items, returns its lowest block"""
+        blocks = [block for block in blocks if block.get("id") and block.get("height") is not None]
+        for block in blocks:
+            self.put(block["height"], block["id"], block.get("timestamp"))
+        return min(blocks, key=lambda block: block["height"]) if blocks else None
+
+    def _links(self, bottom: dict, synced: Optional[tuple[int, int]]) -> bool:
+        """True if the block extends the synced range (low, tip), i.e. its parent is the stored block below it"""
+        below = bottom["height"] - 1
+        return (synced is not None and synced[0] <= below <= synced[1]
+                and self.hash_at(below) == bottom.get("previousblockhash"))
+
+    def _joins(self, blocks: list[dict], synced: tuple[int, int]) -> bool:
+        """True if one of the blocks, not stored yet, is already the block stored at its height in the range (low, tip)"""
+        return any(synced[0] <= block.get("height", -1) <= synced[1] and self.hash_at(block["height"]) == block.get("id")
+                   for block in blocks)
+
+    async def sync(self, client) -> None:
+        """
+        Brings the store up to the upstream tip (Mempool.space /v1/blocks), walking down until
+        the new blocks link to the synced range (gap after a downtime, or reorg deeper than one
+        batch). A gap wider than the budget of a sync is walked down by the next ones, the range
+        synced before it kept aside until they reach it. With HEADER_STORE_BACKFILL, older blocks
+        are then downloaded while the upstream has spare rate-limit budget.
+        """
+        blocks = await client.get_blocks_info()
+        if not blocks:
+            return
+
+        low, tip, older = self.low, self.tip, self.older
+        top = max(block.get("height", 0) for block in blocks)
+        bottom = self._apply(blocks)
+        budget = Config.HEADER_SYNC_BATCHES
+
+        synced = (low, tip) if tip is not None else None
+        linked = self._links(bottom, synced)
+        while synced is not None and not linked and bottom["height"] > 0 and budget > 0:
+            lowest = self._apply(await client.get_blocks_from(bottom["height"] - 1) or [])
+            budget -= 1
+            if lowest is None:
+                break
+            bottom = lowest
+            linked = self._links(bottom, synced)
+
+        if not linked:
+            # the new blocks start a range of their own, the one synced before the gap is kept
+            # aside (a range of a previous gap, shorter than the budget, is dropped instead)
+            if older is None:
+                older = synced
+            low = bottom["height"]
+        self._set_range(low, top, older)
+
+        # walks the gap down until a downloaded block is the one stored at its height in the older range
+        while older is not None and low > 0 and budget > 0:
+            batch = await client.get_blocks_from(low - 1) or []
+            budget -= 1
+            joined = self._joins(batch, older)
+            lowest = self._apply(batch)
+            if lowest is None:
+                break
+            low = lowest["height"]
+            if joined:
+                low, older = older[0], None
+            elif low <= older[0]:
+                older = None # replaced as a whole by a reorg, synced again
+            self._set_range(low, top, older)
+
+        while Config.HEADER_STORE_BACKFILL and older is None and low > 0 and budget > 0 \
+                and client.has_spare_capacity(Config.PREFETCH_TOKEN_RESERVE):
+            lowest = self._apply(await client.get_blocks_from(low - 1) or [])
+            budget -= 1
+            if lowest is None:
+                break
+            low = lowest["height"]
+            self._set_range(low, top)
+
+        self.syncs += 1
+
+    async def run(self, client) -> None:
+        while True:
+            try:
+                await self.sync(client)
+            except Exception as e:
+                logger.error(f"Failed to sync the block headers : {e}", exc_info=True)
+            await asyncio.sleep(Config.HEADER_SYNC_INTERVAL)
+
+    @asynccontextmanager
+    async def session(self, client):
+        """Syncs the store through `client` while at least one server session runs"""
+        self._sessions += 1
+        try:
+            if self._sessions == 1:
+                self._task = asyncio.ensure_future(self.run(client))
+            yield self
+        finally:
+            self._sessions -= 1
+            if self._sessions == 0 and self._task is not None:
+                self._task.cancel()
+                await asyncio.gather(self._task, return_exceptions=True)
+                self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "low": self.low,
+            "tip": self.tip,
+            "older": self.older,
+            "syncs": self.syncs,
+            "reorgs": self.reorgs,
+            "file_bytes": os.fstat(self._fd).st_blocks * 512, # allocated, the file is sparse
+        }
+
+    def close(self) -> None:
+        self._mm.flush()
+        self._mm.close()
+        os.close(self._fd)
+
+
+# Singleton instance for the store
+_header_store_instance = None
+
+def get_header_store() -> Optional[HeaderStore]:
+    """Get or create the Header Store singleton instance, None when disabled."""
+    global _header_store_instance
+    if _header_store_instance is None and Config.ENABLE_HEADER_STORE:
+        _header_store_instance = HeaderStore()
+    return _header_store_instance
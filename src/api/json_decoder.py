@@ -0,0 +1,54 @@
+import json
+import logging
+from typing import Any, Callable
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Optional fast decoders, pip install orjson (or msgspec)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _msgspec_loads(content: bytes) -> Any:
+    try:
+        return _msgspec_decoder.decode(content)
+    except msgspec.DecodeError as e: # not a ValueError, unlike the other decoders
+        raise ValueError(str(e)) from e
+
+_msgspec_decoder = msgspec.json.Decoder() if msgspec is not None else None
+
+
+def _decoders() -> dict[str, Callable[[bytes], Any]]:
+    decoders: dict[str, Callable[[bytes], Any]] = {}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    if msgspec is not None:
+        decoders["msgspec"] = _msgspec_loads
+    decoders["json"] = json.loads
+    return decoders
+
+# Every decoder usable in this environment, fastest first
+DECODERS: dict[str, Callable[[bytes], Any]] = _decoders()
+
+
+def get_json_decoder(name: str = Config.JSON_DECODER) -> tuple[str, Callable[[bytes], Any]]:
+    """
+    Returns (name, loads) of the requested decoder, "auto" picks the fastest installed one.
+    Every decoder raises a ValueError subclass on invalid JSON.
+    """
+    if name == "auto":
+        return next(iter(DECODERS.items()))
+
+    if name not in DECODERS:
+        logger.warning(f"JSON decoder {name} is not installed, falling back to the standard library")
+        return "json", json.loads
+    return name, DECODERS[name]
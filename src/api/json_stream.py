@@ -0,0 +1,139 @@
+import codecs
+import json
+from typing import Any, Optional
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]}"
+_decoder = json.JSONDecoder()
+
+
+class JSONArrayStream:
+    """
+    Incremental parser yielding the items of one JSON array as the body arrives.
+
+    The array is either the whole document (key=None) or the value of a key of the top-level
+    object, e.g. "txs" of a Blockchain.com /rawaddr document. Only the item being received is
+    buffered, the top-level values met before the array are kept in `header`.
+    """
+
+    def __init__(self, key: Optional[str] = None):
+        self.key: Optional[str] = key
+        self.header: dict = {}
+        self.done: bool = False # the array is closed, the rest of the body can be dropped
+
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._pos: int = 0
+        self._state: str = "document" if key is not None else "array_start"
+        self._pending_key: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Adds a chunk of the body, returns the items completed by it"""
+        if self.done:
+            return []
+
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(chunk)
+        self._pos = 0
+
+        items = []
+        while not self.done and self._step(items):
+            pass
+        return items
+
+    def close(self) -> None:
+        """Raises ValueError if the body ended before the array was closed"""
+        if not self.done:
+            raise ValueError(f"JSON body ended before the end of the array ({self._state})")
+
+    def _skip_whitespace(self) -> Optional[str]:
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+            self._pos += 1
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else None
+
+    def _value(self) -> tuple[bool, Any]:
+        """Decodes the next value, (False, None) if it is not fully received yet"""
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            return False, None # incomplete, retried with the next chunk
+
+        # a number is only complete once followed by a delimiter, "1." may still become "1.5"
+        if not isinstance(value, (dict, list, str)) and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS):
+            return False, None
+
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: str) -> bool:
+        current = self._skip_whitespace()
+        if current is None:
+            return False
+        if current != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos}, got {current!r}")
+        self._pos += 1
+        return True
+
+    def _step(self, items: list) -> bool:
+        """Advances the state machine by one token, False when more data is needed"""
+        state = self._state
+
+        if state == "document":
+            if not self._expect("{"):
+                return False
+            self._state = "key"
+
+        elif state == "key":
+            current = self._skip_whitespace()
+            if current is None:
+                return False
+            if current == ",":
+                self._pos += 1
+                return True
+            if current == "}":
+                raise ValueError(f"Key {self.key!r} not found in the JSON document")
+
+            complete, key = self._value()
+            if not complete:
+                return False
+            self._pending_key = key
+            self._state = "colon"
+
+        elif state == "colon":
+            if not self._expect(":"):
+                return False
+            self._state = "array_start" if self._pending_key == self.key else "header_value"
+
+        elif state == "header_value":
+            if self._skip_whitespace() is None:
+                return False
+            complete, value = self._value()
+            if not complete:
+                return False
+            self.header[self._pending_key] = value
+            self._state = "key"
+
+        elif state == "array_start":
+            if not self._expect("["):
+                return False
+            self._state = "item"
+
+        elif state == "item":
+            current = self._skip_whitespace()
+            if current is None:
+                return False
+            if current == "]":
+                self._pos += 1
+                self.done = True
+                self._buffer = ""
+                self._pos = 0
+                return False
+            if current == ",":
+                self._pos += 1
+                return True
+
+            complete, item = self._value()
+            if not complete:
+                return False
+            items.append(item)
+
+        return True
@@ -1,59 +1,129 @@
 import logging
 from typing import Optional
-from src.api.client import APIClient
+from src.api.client import AsyncAPIClient, FetchResult
+from src.api.mempool_stream import MempoolStream, get_mempool_stream
+from src.api.ttl_policy import TTLPolicy, depth_ttl, depth_from_block_time
 from src.config import Config
 
 logger = logging.getLogger(__name__)
 
-class MempoolClient(APIClient):
+
+# === CACHE TTL RESOLVERS ===
+
+def _tip_height_ttl(client, match, data) -> float:
+    client.tip_height = int(data)
+    return 10
+
+def _blocks_ttl(client, match, data) -> float:
+    if data:
+        client.tip_height = max(client.tip_height or 0, max(block.get("height", 0) for block in data))
+    return 30
+
+def _block_height_ttl(client, match, data) -> float:
+    if client.tip_height is None:
+        return Config.CACHE_TTL_TIME
+    return depth_ttl(client.tip_height - int(match.group("height")) + 1)
+
+def _tx_ttl(client, match, data) -> float:
+    status: dict = data.get("status", {}) if isinstance(data, dict) else {}
+    if not status.get("confirmed"):
+        return 30
+
+    if client.tip_height is not None and status.get("block_height") is not None:
+        return depth_ttl(client.tip_height - status["block_height"] + 1)
+    return depth_ttl(depth_from_block_time(status.get("block_time")))
+
+
+class MempoolClient(AsyncAPIClient):
+    TTL_POLICIES = (
+        TTLPolicy(r"^/blocks/tip/height$", resolver=_tip_height_ttl, tip_dependent=True),
+        TTLPolicy(r"^/blocks/tip/hash$", ttl=10),
+        TTLPolicy(r"^/block-height/(?P<height>\d+)$", resolver=_block_height_ttl),
+        TTLPolicy(r"^/v1/blocks$", resolver=_blocks_ttl, tip_dependent=True),
+        TTLPolicy(r"^/v1/blocks/\d+$", ttl=0), # read once into the header store, not worth the cache space
+        TTLPolicy(r"^/v1/fees/recommended$", ttl=15, tip_dependent=True),
+        TTLPolicy(r"^/mempool$", ttl=15, tip_dependent=True),
+        TTLPolicy(r"^/address/", ttl=30),
+        TTLPolicy(r"^/tx/(?P<txid>[0-9a-fA-F]{64})$", resolver=_tx_ttl),
+        TTLPolicy(r"^/v1/mining/pools/all$", ttl=3600), # a new pool is only missing from it until the next refresh
+        TTLPolicy(r"^/v1/mining/", ttl=600),
+    )
+    RATE_LIMIT = Config.MEMPOOL_RATE_LIMIT
+    RATE_LIMIT_BURST = Config.MEMPOOL_RATE_BURST
+
     def __init__(self):
         super().__init__(Config.MEMPOOL_API_URL)
+        self.tip_height: Optional[int] = None # last known chain tip, used to tell immutable data apart
+        self.stream: Optional[MempoolStream] = get_mempool_stream() # pushed data, when the WebSocket feed is enabled
+
+    async def get_result(self, endpoint: str) -> FetchResult:
+        """GET answered from the WebSocket feed when it holds the endpoint, over HTTP otherwise"""
+        if self.stream is not None:
+            if self.stream.tip_height is not None:
+                # the TTL resolvers of the tip endpoints do not run while the feed answers them
+                self.tip_height = self.stream.tip_height
+            data = self.stream.lookup(endpoint)
+            if data is not None:
+                return FetchResult(endpoint, data, cached=True)
+        return await super().get_result(endpoint)
 
 
     # === BITCOIN BLOCKS INFORMATIONS ===
 
-    def get_block_tip_height(self) -> Optional[int]:
+    async def get_block_tip_height(self) -> Optional[int]:
         """
         Returns the height of the last block mined on the Bitcoin network
         Docs : https://mempool.space/docs/api/rest#get-block-tip-height
         """
         try:
-            result = self.get("/blocks/tip/height")
+            result = await self.get("/blocks/tip/height")
             return str(result) if result else None
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
 
-    def get_block_tip_hash(self) -> Optional[int]:
+    async def get_block_tip_hash(self) -> Optional[int]:
         """
         Returns the hash of the last block mined on the Bitcon network
         Docs : https://mempool.space/docs/api/rest#get-block-tip-hash
         """
         try:
-            result = self.get("/blocks/tip/hash",)
+            result = await self.get("/blocks/tip/hash",)
             return str(result) if result else None
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
 
-    def get_block_height(self, height: int) -> Optional[str]:
+    async def get_block_height(self, height: int) -> Optional[str]:
         """
         Returns the hash of a block whose height is passed as a parameter
         Docs : https://mempool.space/docs/api/rest#get-block-height
         """
         try:
-            return str(self.get(f"/block-height/{height}"))
+            return str(await self.get(f"/block-height/{height}"))
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
 
-    def get_blocks_info(self) -> Optional[list[dict]]:
+    async def get_blocks_info(self) -> Optional[list[dict]]:
         """
         Returns information about the last 10 blocks mined on the Bitcoin network
         Docs : https://mempool.space/docs/api/rest#get-blocks
         """
         try:
-            return self.get("/v1/blocks")
+            return await self.get("/v1/blocks")
+        except Exception as e:
+            logger.error(f"Failed to fetch data from Mempool.space : {e}")
+            return None
+
+
+    async def get_blocks_from(self, height: int) -> Optional[list[dict]]:
+        """
+        Returns information about the 15 blocks mined at and below the given height
+        Docs : https://mempool.space/docs/api/rest#get-blocks
+        """
+        try:
+            return await self.get(f"/v1/blocks/{height}")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
@@ -61,13 +131,13 @@ class MempoolClient(APIClient):
 
     # === BITCOIN FEES INFORMATIONS ===
 
-    def get_recommended_fees(self) -> Optional[dict]:
+    async def get_recommended_fees(self) -> Optional[dict]:
         """
         Returns the recommended transaction fee ratio for a Bitcoin transaction
         Docs : https://mempool.space/docs/api/rest#get-recommended-fees-precise
         """
         try:
-            return self.get("/v1/fees/recommended")
+            return await self.get("/v1/fees/recommended")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
@@ -75,13 +145,13 @@ class MempoolClient(APIClient):
 
     # === BITCOIN ADDRESSES INFORMATIONS ===
 
-    def get_address_info(self, address: str) -> Optional[dict]:
+    async def get_address_info(self, address: str) -> Optional[dict]:
         """
         Returns the information for a Bitcoin address
         Docs : https://mempool.space/docs/api/rest#get-address
         """
         try:
-            return self.get(f"/address/{address}")
+            return await self.get(f"/address/{address}")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
@@ -89,13 +159,13 @@ class MempoolClient(APIClient):
 
     # === BITCOIN TRANSACTIONS INFORMATIONS ===
 
-    def get_tx_info(self, txid: str) -> Optional[dict]:
+    async def get_tx_info(self, txid: str) -> Optional[dict]:
         """
         Returns information about a Bitcoin transaction
         Docs : https://mempool.space/docs/api/rest#get-transaction
         """
         try:
-            return self.get(f"/tx/{txid}")
+            return await self.get(f"/tx/{txid}")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
@@ -103,35 +173,46 @@ class MempoolClient(APIClient):
 
     # === BITCOIN MINING POOLS INFORMATIONS ===
 
-    def get_mining_pools_rank(self) -> Optional[dict]:
+    async def get_mining_pools_rank(self) -> Optional[dict]:
         """
         Returns the ranking of the best Bitcoin network mining pools for the last 3 months
         Docs : https://mempool.space/docs/api/rest#get-mining-pools
         """
         try:
-            return self.get("/v1/mining/pools/3m")
+            return await self.get("/v1/mining/pools/3m")
+        except Exception as e:
+            logger.error(f"Failed to fetch data from Mempool.space : {e}")
+            return None
+
+    async def get_mining_pools_all(self) -> Optional[dict]:
+        """
+        Returns every mining pool that ever mined a block, with its all-time block count
+        Docs : https://mempool.space/docs/api/rest#get-mining-pools
+        """
+        try:
+            return await self.get("/v1/mining/pools/all")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
 
-    def get_mining_pools_hashrate(self) -> Optional[list]:
+    async def get_mining_pools_hashrate(self) -> Optional[list]:
         """
         Renvoie le hashrate des meilleures mining pools du réseau bitcoin depuis 3 mois
         Docs : https://mempool.space/docs/api/rest#get-mining-pool-hashrates
         """
         try:
-            return self.get("/v1/mining/hashrate/pools/3m")
+            return await self.get("/v1/mining/hashrate/pools/3m")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
 
-    def get_mining_pool_info_by_slug(self, slug: str) -> Optional[dict]:
+    async def get_mining_pool_info_by_slug(self, slug: str) -> Optional[dict]:
         """
         Returns information about a mining pool via its slug
         Docs : https://mempool.space/docs/api/rest#get-mining-pool
         """
         try:
-            return self.get(f"/v1/mining/pool/{slug}")
+            return await self.get(f"/v1/mining/pool/{slug}")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
@@ -139,13 +220,13 @@ class MempoolClient(APIClient):
 
     # === BITCOIN NETWORK INFORMATIONS (MEMPOOL) ===
 
-    def get_mempool_info(self) -> Optional[dict]:
+    async def get_mempool_info(self) -> Optional[dict]:
         """
         Returns information about the mempool of mempool.space
         Docs : https://mempool.space/docs/api/rest#get-mempool
         """
         try:
-            return self.get("/mempool")
+            return await self.get("/mempool")
         except Exception as e:
             logger.error(f"Failed to fetch data from Mempool.space : {e}")
             return None
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+from src.api.tip_watcher import get_tip_watcher
+from src.config import Config
+
+# Optional push feed, pip install websockets
+try:
+    from websockets.asyncio.client import connect
+    from websockets.exceptions import WebSocketException
+except ImportError:
+    connect = None
+    WebSocketException = None
+
+logger = logging.getLogger(__name__)
+
+if Config.ENABLE_MEMPOOL_WS and connect is None:
+    logger.warning("websockets is not installed, the Mempool.space feed is disabled")
+
+
+# docs = https://mempool.space/docs/api/websocket
+class MempoolStream:
+    """
+    Live Mempool.space data pushed over its WebSocket feed (want: blocks, stats, mempool-blocks).
+
+    The latest blocks, recommended fees, mempool stats and projected mempool blocks are kept in
+    memory and answer the matching MempoolClient reads without any HTTP request while the feed
+    is connected and recent. New blocks are pushed to the tip watcher, which then stops polling.
+    The connection is retried forever with exponential backoff and full jitter.
+    """
+
+    WANT: tuple = ("blocks", "stats", "mempool-blocks")
+
+    def __init__(self, url: str = Config.MEMPOOL_WS_URL):
+        self.url: str = url
+
+        self.blocks: list[dict] = [] # most recent first, like /v1/blocks
+        self.fees: Optional[dict] = None # same shape as /v1/fees/recommended
+        self.mempool_info: Optional[dict] = None
+        self.mempool_blocks: Optional[list] = None # projected blocks of the mempool
+
+        self.connected: bool = False
+        self.connections: int = 0
+        self.messages: int = 0
+        self.ignored: int = 0 # malformed or unexpected messages
+        self.served: int = 0 # reads answered from the feed
+
+        self._last_message: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._sessions: int = 0
+
+    @property
+    def live(self) -> bool:
+        """True while the feed is connected and has pushed something recently"""
+        return (self.connected and self._last_message is not None
+                and time.monotonic() - self._last_message <= Config.MEMPOOL_WS_STALE_AFTER)
+
+    @property
+    def tip_height(self) -> Optional[int]:
+        """Height of the latest pushed block while the feed is live"""
+        return self.blocks[0].get("height") if self.live and self.blocks else None
+
+    def lookup(self, endpoint: str) -> Optional[Any]:
+        """Returns the pushed data equivalent to a GET of the endpoint, None to fall back on HTTP"""
+        if not self.live:
+            return None
+
+        data = None
+        if endpoint == "/v1/fees/recommended":
+            data = self.fees
+        elif endpoint == "/v1/blocks":
+            data = self.blocks or None
+        elif endpoint == "/blocks/tip/height" and self.blocks:
+            data = self.blocks[0].get("height")
+        elif endpoint == "/blocks/tip/hash" and self.blocks:
+            data = self.blocks[0].get("id")
+
+        if data is not None:
+            self.served += 1
+        return data
+
+    async def handle(self, message: dict) -> None:
+        """Applies one pushed message, a single message may carry several kinds of update"""
+        self._last_message = time.monotonic()
+        self.messages += 1
+
+        if "blocks" in message:
+            self.blocks = sorted(message["blocks"], key=lambda b: b.get("height", 0), reverse=True)[:Config.MEMPOOL_WS_BLOCKS]
+        if "block" in message:
+            block = message["block"]
+            # a block at an already known height replaces it (reorg)
+            others = [b for b in self.blocks if b.get("height") != block.get("height")]
+            self.blocks = sorted([block, *others], key=lambda b: b.get("height", 0), reverse=True)[:Config.MEMPOOL_WS_BLOCKS]
+        if "fees" in message:
+            self.fees = message["fees"]
+        if "mempoolInfo" in message:
+            self.mempool_info = message["mempoolInfo"]
+        if "mempool-blocks" in message:
+            self.mempool_blocks = message["mempool-blocks"]
+
+        if self.blocks and self.blocks[0].get("id"):
+            await get_tip_watcher().observe(self.blocks[0]["id"], pushed=True)
+
+    async def _consume(self) -> None:
+        async with connect(self.url, open_timeout=Config.API_CONNECT_TIMEOUT) as websocket:
+            await websocket.send(json.dumps({"action": "want", "data": list(self.WANT)}))
+            self.connected = True
+            self.connections += 1
+            logger.info(f"Connected to the Mempool.space feed {self.url}")
+
+            async for raw in websocket:
+                try:
+                    message = json.loads(raw)
+                    if isinstance(message, dict):
+                        await self.handle(message)
+                except Exception:
+                    # a single bad message must not drop the connection nor the data already received
+                    self.ignored += 1
+                    logger.warning("Ignored a malformed message of the Mempool.space feed", exc_info=True)
+
+    async def run(self) -> None:
+        attempts = 0
+        while True:
+            started = time.monotonic()
+            try:
+                await self._consume()
+            except (OSError, asyncio.TimeoutError, WebSocketException) as e:
+                logger.warning(f"Mempool.space feed disconnected : {e}")
+            except Exception as e:
+                # the feed is optional, reconnect rather than leave it down until a restart
+                logger.error(f"Mempool.space feed failed : {e}", exc_info=True)
+            finally:
+                self.connected = False
+
+            if time.monotonic() - started > Config.MEMPOOL_WS_MAX_BACKOFF:
+                attempts = 0 # the connection held, this is a new outage
+            delay = min(Config.MEMPOOL_WS_MAX_BACKOFF, random.uniform(0, 2**attempts)) # Exponential Backoff with Full Jitter
+            attempts += 1
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.connected = False
+
+    @asynccontextmanager
+    async def session(self):
+        """Keeps the feed connected while at least one server session runs"""
+        self._sessions += 1
+        try:
+            if self._sessions == 1:
+                self._task = asyncio.ensure_future(self.run())
+            yield self
+        finally:
+            self._sessions -= 1
+            if self._sessions == 0:
+                await self.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "live": self.live,
+            "connections": self.connections,
+            "messages": self.messages,
+            "ignored": self.ignored,
+            "served": self.served,
+            "tip_height": self.blocks[0].get("height") if self.blocks else None,
+        }
+
+
+# Singleton instance for the feed
+_mempool_stream_instance = None
+
+def get_mempool_stream() -> Optional[MempoolStream]:
+    """Get or create the Mempool.space feed singleton instance, None when disabled or websockets is not installed."""
+    global _mempool_stream_instance
+    if not Config.ENABLE_MEMPOOL_WS or connect is None:
+        return None
+    if _mempool_stream_instance is None:
+        _mempool_stream_instance = MempoolStream()
+    return _mempool_stream_instance
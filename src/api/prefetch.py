@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefetchTarget:
+    client: Any # AsyncAPIClient owning the cached entry
+    endpoint: str
+    last_used: float
+    lead: float # refreshed when the entry expires in less than that, redrawn after each refresh
+    not_before: float = 0 # a failed refresh is not retried before the next expiry window
+    task: Optional[asyncio.Task] = None
+    refreshes: int = 0
+    failures: int = 0
+    skipped: int = 0 # refreshes given up to leave the rate-limit budget to the callers
+
+
+class PrefetchScheduler:
+    """
+    Keeps the hot endpoints warm in the cache of their client.
+
+    An endpoint of the whitelist becomes a target the first time a caller reads it. Its entry is
+    then refreshed a few seconds (plus jitter) before it expires, so callers keep hitting the
+    cache, as long as the upstream has spare rate-limit tokens. A target nobody read for
+    PREFETCH_IDLE_TIMEOUT is paused until the next read.
+    """
+
+    def __init__(self, endpoints: tuple = Config.PREFETCH_ENDPOINTS):
+        self.endpoints: tuple = tuple(endpoints)
+
+        self._targets: dict[str, PrefetchTarget] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._sessions: int = 0
+
+    def touch(self, client, endpoint: str) -> None:
+        """Records a read of the endpoint, called by the client on every GET"""
+        if not endpoint.startswith(self.endpoints):
+            return
+
+        key = f"{client.base_url}{endpoint}"
+        target = self._targets.get(key)
+        if target is None:
+            self._targets[key] = PrefetchTarget(client, endpoint, time.monotonic(), self._lead())
+        else:
+            target.last_used = time.monotonic()
+
+    @staticmethod
+    def _lead() -> float:
+        return Config.PREFETCH_LEAD + random.uniform(0, Config.PREFETCH_JITTER)
+
+    def _is_idle(self, target: PrefetchTarget, now: float) -> bool:
+        return now - target.last_used > Config.PREFETCH_IDLE_TIMEOUT
+
+    def tick(self) -> None:
+        """Starts the refresh of every active target about to expire"""
+        now = time.monotonic()
+        for target in self._targets.values():
+            if self._is_idle(target, now) or now < target.not_before:
+                continue
+            if target.task is not None and not target.task.done():
+                continue
+
+            expires_in = target.client.expires_in(target.endpoint)
+            if expires_in is None or not 0 < expires_in <= target.lead:
+                continue # not cached (callers fetch it), already expired (stale-while-revalidate) or not due yet
+
+            if not target.client.is_available() or not target.client.has_spare_capacity(Config.PREFETCH_TOKEN_RESERVE):
+                target.skipped += 1
+                target.not_before = now + expires_in
+                continue
+
+            target.task = asyncio.ensure_future(self._refresh(target, now + expires_in))
+
+    async def _refresh(self, target: PrefetchTarget, window_end: float) -> None:
+        try:
+            result = await target.client.refresh(target.endpoint)
+            error = result.error
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+        if error is None:
+            target.refreshes += 1
+        else:
+            target.failures += 1
+            target.not_before = window_end
+            logger.warning(f"Failed to prefetch {target.endpoint} : {error}")
+        target.lead = self._lead()
+
+    async def run(self) -> None:
+        logger.info(f"Prefetching {', '.join(self.endpoints)}")
+        while True:
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error(f"Prefetch tick failed : {e}", exc_info=True)
+            await asyncio.sleep(Config.PREFETCH_INTERVAL)
+
+    async def aclose(self) -> None:
+        tasks = [self._task] if self._task is not None else []
+        tasks += [target.task for target in self._targets.values() if target.task is not None]
+        self._task = None
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @asynccontextmanager
+    async def session(self):
+        """Runs the scheduler while at least one server session runs"""
+        self._sessions += 1
+        try:
+            if self._sessions == 1:
+                self._task = asyncio.ensure_future(self.run())
+            yield self
+        finally:
+            self._sessions -= 1
+            if self._sessions == 0:
+                await self.aclose()
+
+    def stats(self) -> dict:
+        """Returns the refreshes, failures and skips of every target, and whether it is paused"""
+        now = time.monotonic()
+        stats = {}
+        for key, target in self._targets.items():
+            expires_in = target.client.expires_in(target.endpoint)
+            stats[key] = {
+                "active": not self._is_idle(target, now),
+                "expires_in": round(expires_in, 3) if expires_in is not None and expires_in != float("inf") else None,
+                "refreshes": target.refreshes,
+                "failures": target.failures,
+                "skipped": target.skipped,
+            }
+        return stats
+
+
+# Singleton instance for the scheduler
+_prefetch_scheduler_instance = None
+
+def get_prefetch_scheduler() -> PrefetchScheduler:
+    """Get or create the Prefetch Scheduler singleton instance."""
+    global _prefetch_scheduler_instance
+    if _prefetch_scheduler_instance is None:
+        _prefetch_scheduler_instance = PrefetchScheduler()
+    return _prefetch_scheduler_instance
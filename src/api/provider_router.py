@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from src.api.client import BaseAPIClient, FetchResult
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Provider:
+    """One upstream able to serve a route, `path` builds its endpoint and `normalize` turns its payload into the route's shape"""
+    name: str
+    client: BaseAPIClient
+    path: Callable[..., str]
+    normalize: Callable[[Any], Any]
+
+
+class LatencyTracker:
+    """Rolling window of the request latencies of one provider, cache hits excluded"""
+
+    def __init__(self, window: int = Config.HEDGE_LATENCY_WINDOW):
+        self._samples: deque = deque(maxlen=window)
+        self.failures: int = 0
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+
+    def percentile(self, percentile: float = Config.HEDGE_LATENCY_PERCENTILE) -> Optional[float]:
+        """Returns the latency percentile, or None until enough samples were collected"""
+        if len(self._samples) < Config.HEDGE_MIN_SAMPLES:
+            return None
+
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percentile))]
+
+    def stats(self) -> dict:
+        p95 = self.percentile()
+        return {
+            "samples": len(self._samples),
+            "p95": round(p95, 3) if p95 is not None else None,
+            "failures": self.failures,
+        }
+
+
+class ProviderRouter:
+    """
+    Serves one kind of data from several equivalent providers.
+
+    Providers are tried from the currently fastest healthy upstream (see UpstreamScore),
+    the next one is used when a provider fails, and when hedging is enabled a second
+    request is sent to the next provider once the first is slower than its usual p95:
+    the first answer wins. The stale data of a failed provider is only served once every
+    provider failed.
+    """
+
+    def __init__(self, name: str, providers: list[Provider], hedge: bool = Config.ENABLE_HEDGED_REQUESTS):
+        self.name: str = name
+        self.providers: list[Provider] = providers
+        self.hedge: bool = hedge
+
+        self._latency: dict[str, LatencyTracker] = {provider.name: LatencyTracker() for provider in providers}
+
+        self.requests: int = 0
+        self.failovers: int = 0 # providers tried because the previous ones failed
+        self.hedged: int = 0 # hedged requests sent
+        self.hedge_wins: int = 0 # hedged requests that answered first
+        self.stale_answers: int = 0 # every provider failed, expired data served
+
+    def _ordered(self) -> list[Provider]:
+        """Healthy providers first, each group from the lowest upstream cost"""
+        return sorted(self.providers, key=lambda provider: (
+            not (provider.client.is_available() and provider.client.score.healthy),
+            provider.client.score.cost,
+        ))
+
+    async def _call(self, provider: Provider, *args) -> FetchResult:
+        """Result of the provider with its data normalized, failed if it erred or had nothing"""
+        endpoint = provider.path(*args)
+        try:
+            result = await provider.client.get_result(endpoint)
+            data = provider.normalize(result.data) if result.data is not None else None
+        except Exception as e:
+            result, data = FetchResult(endpoint, error=f"{type(e).__name__}: {e}"), None
+
+        tracker = self._latency[provider.name]
+        if not result.ok or data is None:
+            tracker.failures += 1
+            return FetchResult(result.endpoint, data, result.error or "no data")
+
+        if result.latency is not None and not result.cached:
+            tracker.record(result.latency) # network round trips only, cache hits would drag the p95 down
+        return FetchResult(result.endpoint, data, cached=result.cached, latency=result.latency)
+
+    def _hedge_delay(self, provider: Provider) -> Optional[float]:
+        p95 = self._latency[provider.name].percentile()
+        return max(p95, Config.HEDGE_MIN_DELAY) if p95 is not None else None
+
+    async def fetch(self, *args) -> Optional[Any]:
+        """
+        Returns the normalized payload of the first provider that answers, the stale data of
+        the first failed provider that had some once all failed, or None.
+        """
+        self.requests += 1
+        remaining = self._ordered()
+        pending: dict[asyncio.Task, Provider] = {}
+        started: dict[asyncio.Task, float] = {}
+        hedges: set[asyncio.Task] = set()
+        fallback: Optional[FetchResult] = None
+
+        try:
+            while remaining or pending:
+                if not pending:
+                    if len(remaining) < len(self.providers):
+                        self.failovers += 1
+                    provider = remaining.pop(0)
+                    task = asyncio.ensure_future(self._call(provider, *args))
+                    pending[task], started[task] = provider, time.monotonic()
+
+                timeout = None
+                if self.hedge and remaining and len(pending) == 1:
+                    timeout = self._hedge_delay(next(iter(pending.values())))
+
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    provider = remaining.pop(0)
+                    task = asyncio.ensure_future(self._call(provider, *args))
+                    pending[task], started[task] = provider, time.monotonic()
+                    hedges.add(task)
+                    self.hedged += 1
+                    continue
+
+                for task in done:
+                    provider = pending.pop(task)
+                    result = task.result()
+                    if result.ok:
+                        if task in hedges:
+                            self.hedge_wins += 1
+                        return result.data
+                    if fallback is None and result.stale:
+                        fallback = result
+                    logger.warning(f"{self.name} : {provider.name} failed ({result.error}), trying the next provider")
+
+            if fallback is not None:
+                self.stale_answers += 1
+                logger.warning(f"{self.name} : every provider failed, serving stale data of {fallback.endpoint}")
+                return fallback.data
+            return None
+        finally:
+            now = time.monotonic()
+            for task, provider in pending.items():
+                task.cancel()
+                # a lower bound of the loser's latency : leaving the slow answers out would bias low the p95 setting the hedge delay
+                self._latency[provider.name].record(now - started[task])
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "failovers": self.failovers,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "stale_answers": self.stale_answers,
+            "order": [provider.name for provider in self._ordered()],
+            "providers": {name: tracker.stats() for name, tracker in self._latency.items()},
+        }
+
+
+# Every router of the process, published for monitoring
+_routers: dict[str, ProviderRouter] = {}
+_routers_lock = threading.Lock()
+
+def get_provider_router(name: str, providers: Callable[[], list[Provider]]) -> ProviderRouter:
+    """Get or create the router of a route, `providers` is only called on creation."""
+    with _routers_lock:
+        if name not in _routers:
+            _routers[name] = ProviderRouter(name, providers())
+        return _routers[name]
+
+def get_router_stats() -> dict:
+    """Returns failovers, hedges and provider latencies of every route"""
+    with _routers_lock:
+        return {name: router.stats() for name, router in _routers.items()}
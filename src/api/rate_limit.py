@@ -0,0 +1,172 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+
+class RateLimiter:
+    """
+    Token bucket limiting the requests sent to one upstream.
+
+    Waiting callers are served first come first served (async callers through the FIFO
+    asyncio.Lock, threads through tickets) and may give up after a timeout, and the whole
+    bucket can be paused when the upstream answers with Retry-After.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate: float = rate # tokens per second
+        self.burst: int = burst
+
+        self._tokens: float = burst
+        self._updated_at: float = time.monotonic()
+        self._paused_until: float = 0
+
+        self._state_lock = threading.Lock()
+        self._async_turn: Optional[asyncio.Lock] = None
+        self._thread_turn = threading.Condition()
+        self._next_ticket: int = 0
+        self._serving: int = 0
+        self._abandoned: set[int] = set() # tickets of threads that gave up waiting for their turn
+
+        self.queue_depth: int = 0
+        self.throttled: int = 0 # requests that had to wait for a token
+        self.wait_time: float = 0
+        self.timeouts: int = 0 # requests given up because no token came in time
+
+    def _reserve(self) -> float:
+        """Takes a token and returns 0, or returns how long to wait before trying again"""
+        with self._state_lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    async def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Waits for a token, returns False without taking one if it would take longer than timeout seconds"""
+        if self._async_turn is None:
+            self._async_turn = asyncio.Lock()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        self.queue_depth += 1
+        try:
+            try:
+                await asyncio.wait_for(self._async_turn.acquire(), timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                return False
+
+            try:
+                waited = False
+                while (delay := self._reserve()) > 0:
+                    if deadline is not None and time.monotonic() + delay > deadline:
+                        self.timeouts += 1
+                        return False
+                    waited = True
+                    self.wait_time += delay
+                    await asyncio.sleep(delay)
+                if waited:
+                    self.throttled += 1
+                return True
+            finally:
+                self._async_turn.release()
+        finally:
+            self.queue_depth -= 1
+
+    def acquire_sync(self, timeout: Optional[float] = None) -> bool:
+        """Blocking acquire(), for threads"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        with self._thread_turn:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self.queue_depth += 1
+            if not self._thread_turn.wait_for(lambda: self._serving == ticket, timeout):
+                self._abandoned.add(ticket) # skipped when its turn comes
+                self.queue_depth -= 1
+                self.timeouts += 1
+                return False
+
+        try:
+            waited = False
+            while (delay := self._reserve()) > 0:
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    self.timeouts += 1
+                    return False
+                waited = True
+                self.wait_time += delay
+                time.sleep(delay)
+            if waited:
+                self.throttled += 1
+            return True
+        finally:
+            with self._thread_turn:
+                self._serving += 1
+                while self._serving in self._abandoned:
+                    self._abandoned.discard(self._serving)
+                    self._serving += 1
+                self.queue_depth -= 1
+                self._thread_turn.notify_all()
+
+    def available(self) -> float:
+        """Tokens that could be taken right now without waiting, 0 while paused or with callers queued"""
+        with self._state_lock:
+            now = time.monotonic()
+            if now < self._paused_until or self.queue_depth > 0:
+                return 0
+            return min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+
+    def pause_for(self, seconds: float) -> None:
+        """Holds every request to this upstream for the given time (Retry-After)"""
+        with self._state_lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "queue_depth": self.queue_depth,
+            "throttled": self.throttled,
+            "wait_time": round(self.wait_time, 3),
+            "timeouts": self.timeouts,
+            "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 3),
+        }
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Returns the Retry-After delay in seconds (delta-seconds or HTTP-date form), or None"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# One limiter per upstream base URL, shared by every client instance targeting it
+_rate_limiters: dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(base_url: str, rate: float, burst: int) -> RateLimiter:
+    """Get or create the rate limiter of an upstream."""
+    with _rate_limiters_lock:
+        if base_url not in _rate_limiters:
+            _rate_limiters[base_url] = RateLimiter(rate, burst)
+        return _rate_limiters[base_url]
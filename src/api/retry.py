@@ -0,0 +1,79 @@
+import threading
+import time
+
+from src.config import Config
+
+
+class RetryBudget:
+    """
+    Caps the retries sent to one upstream to a share of its requests.
+
+    Every request deposits `ratio` tokens and every retry spends one, so when an upstream
+    degrades the clients stop piling retries on it instead of multiplying the load.
+    A small time-based refill keeps a few retries possible under low traffic.
+    """
+
+    def __init__(self,
+                 ratio: float = Config.RETRY_BUDGET_RATIO,
+                 min_per_second: float = Config.RETRY_BUDGET_MIN_PER_SECOND,
+                 max_tokens: float = Config.RETRY_BUDGET_MAX_TOKENS):
+        self.ratio: float = ratio
+        self.min_per_second: float = min_per_second
+        self.max_tokens: float = max_tokens
+
+        self._tokens: float = max_tokens
+        self._updated_at: float = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.requests: int = 0
+        self.retries: int = 0
+        self.exhausted: int = 0 # retries refused because the budget was spent
+        self.sleep_time: float = 0
+
+    def _refill(self, amount: float) -> None:
+        now = time.monotonic()
+        amount += (now - self._updated_at) * self.min_per_second
+        self._updated_at = now
+        self._tokens = min(self.max_tokens, self._tokens + amount)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self._refill(self.ratio)
+
+    def try_spend(self) -> bool:
+        """Returns True and spends a token if a retry is allowed"""
+        with self._lock:
+            self._refill(0)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.retries += 1
+                return True
+
+            self.exhausted += 1
+            return False
+
+    def record_sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.sleep_time += seconds
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "budget_exhausted": self.exhausted,
+            "budget_tokens": round(self._tokens, 2),
+            "sleep_time": round(self.sleep_time, 3),
+        }
+
+
+# One budget per upstream base URL, shared by every client of the process
+_retry_budgets: dict[str, RetryBudget] = {}
+_retry_budgets_lock = threading.Lock()
+
+def get_retry_budget(base_url: str) -> RetryBudget:
+    """Get or create the retry budget of an upstream."""
+    with _retry_budgets_lock:
+        if base_url not in _retry_budgets:
+            _retry_budgets[base_url] = RetryBudget()
+        return _retry_budgets[base_url]
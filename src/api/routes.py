@@ -0,0 +1,117 @@
+from typing import Optional
+
+from src.api.blockchain_client import get_blockchain_client
+from src.api.esplora_client import get_esplora_client
+from src.api.mempool_client import get_mempool_client
+from src.api.provider_router import Provider, ProviderRouter, get_provider_router
+
+
+# === ENDPOINTS ===
+
+def _address_path(address: str) -> str:
+    return f"/address/{address}"
+
+def _rawaddr_path(address: str) -> str:
+    return f"/rawaddr/{address}"
+
+
+# === PAYLOAD NORMALIZERS ===
+# Esplora payloads are the Mempool.space ones, both share the same normalizers
+
+def _address_from_mempool(data: dict) -> dict:
+    chain_stats: dict = data.get("chain_stats", {})
+    mempool_stats: dict = data.get("mempool_stats", {})
+
+    # Blockchain.com totals include unconfirmed transactions
+    received: int = chain_stats.get("funded_txo_sum", 0) + mempool_stats.get("funded_txo_sum", 0)
+    sent: int = chain_stats.get("spent_txo_sum", 0) + mempool_stats.get("spent_txo_sum", 0)
+
+    return {
+        "address": data.get("address"),
+        "final_balance": received - sent,
+        "total_received": received,
+        "total_sent": sent,
+        "n_tx": chain_stats.get("tx_count", 0) + mempool_stats.get("tx_count", 0),
+    }
+
+def _unchanged(data: dict) -> dict:
+    return data
+
+def _address_from_blockchain(data: dict) -> dict:
+    return {
+        "address": data.get("address"),
+        "final_balance": data.get("final_balance", 0),
+        "total_received": data.get("total_received", 0),
+        "total_sent": data.get("total_sent", 0),
+        "n_tx": data.get("n_tx", 0),
+    }
+
+def _latest_block_from_mempool(data: list) -> Optional[dict]:
+    if not data:
+        return None
+
+    tip: dict = data[0]
+    return {
+        "hash": tip.get("id"),
+        "height": tip.get("height"),
+        "time": tip.get("timestamp"),
+    }
+
+def _latest_block_from_blockchain(data: dict) -> dict:
+    return {
+        "hash": data.get("hash"),
+        "height": data.get("height"),
+        "time": data.get("time"),
+        "block_index": data.get("block_index"),
+    }
+
+
+# === ROUTES ===
+# A self-hosted Esplora (Config.ESPLORA_API_URL) joins every route it can serve
+
+def get_address_info_router() -> ProviderRouter:
+    """Detailed address stats (confirmed / mempool split), /address on Mempool.space or Esplora."""
+    mempool = get_mempool_client()
+    esplora = get_esplora_client()
+
+    def providers() -> list[Provider]:
+        result = [Provider("mempool.space", mempool, _address_path, _unchanged)]
+        if esplora is not None:
+            result.append(Provider("esplora", esplora, _address_path, _unchanged))
+        return result
+
+    return get_provider_router("address_info", providers)
+
+def get_address_overview_router() -> ProviderRouter:
+    """Address balance and totals (Blockchain.com shape), /rawaddr on Blockchain.com or /address on Mempool.space and Esplora."""
+    blockchain = get_blockchain_client()
+    mempool = get_mempool_client()
+    esplora = get_esplora_client()
+
+    def providers() -> list[Provider]:
+        result = [
+            Provider("blockchain.info", blockchain, _rawaddr_path, _address_from_blockchain),
+            Provider("mempool.space", mempool, _address_path, _address_from_mempool),
+        ]
+        if esplora is not None:
+            result.append(Provider("esplora", esplora, _address_path, _address_from_mempool))
+        return result
+
+    return get_provider_router("address_overview", providers)
+
+def get_latest_block_router() -> ProviderRouter:
+    """Chain tip (Blockchain.com shape), /latestblock on Blockchain.com or the newest block listed by Mempool.space and Esplora."""
+    blockchain = get_blockchain_client()
+    mempool = get_mempool_client()
+    esplora = get_esplora_client()
+
+    def providers() -> list[Provider]:
+        result = [
+            Provider("blockchain.info", blockchain, lambda: "/latestblock", _latest_block_from_blockchain),
+            Provider("mempool.space", mempool, lambda: "/v1/blocks", _latest_block_from_mempool),
+        ]
+        if esplora is not None:
+            result.append(Provider("esplora", esplora, lambda: "/blocks", _latest_block_from_mempool))
+        return result
+
+    return get_provider_router("latest_block", providers)
@@ -0,0 +1,129 @@
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from src.api.cache_backend import CacheBackend
+from src.config import Config
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# key digest, expires_at, stale_until, key length, content length
+_HEADER = struct.Struct("<8sddII")
+
+
+# docs = https://docs.python.org/3/library/mmap.html
+class SharedMemoryCache(CacheBackend):
+    """
+    Cache shared by every server process of a host, backed by a memory-mapped file.
+
+    The file is split into fixed-size slots, a key lives in the slot picked by its hash
+    (a newer key simply replaces an older one on collision). Each slot is guarded by a
+    POSIX byte-range lock, so workers read and write without any outside service.
+    """
+
+    def __init__(self,
+                 path: str = Config.SHARED_CACHE_PATH,
+                 slots: int = Config.SHARED_CACHE_SLOTS,
+                 slot_size: int = Config.SHARED_CACHE_SLOT_SIZE):
+        if fcntl is None:
+            raise RuntimeError("The shared cache backend requires POSIX file locks (fcntl)")
+
+        self.path: Path = Path(path)
+        self.slots: int = slots
+        self.slot_size: int = slot_size
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd: int = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = slots * slot_size
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size) # sparse, pages are only allocated once written
+        self._mm = mmap.mmap(self._fd, size)
+
+        self._lock = threading.Lock() # fcntl locks are per process, threads need their own
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.writes: int = 0
+        self.collisions: int = 0
+        self.too_large: int = 0
+
+    def _slot(self, key: bytes) -> tuple[bytes, int]:
+        digest = hashlib.blake2b(key, digest_size=8).digest()
+        return digest, (int.from_bytes(digest, "little") % self.slots) * self.slot_size
+
+    @contextmanager
+    def _locked(self, offset: int, exclusive: bool):
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH, self.slot_size, offset)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, self.slot_size, offset)
+
+    def get(self, key: str) -> Optional[tuple[bytes, float, float]]:
+        key_bytes = key.encode()
+        digest, offset = self._slot(key_bytes)
+
+        with self._locked(offset, exclusive=False):
+            slot_digest, expires_at, stale_until, key_len, content_len = _HEADER.unpack_from(self._mm, offset)
+            start = offset + _HEADER.size
+            if slot_digest != digest or stale_until <= time.time() or self._mm[start:start + key_len] != key_bytes:
+                self.misses += 1
+                return None
+
+            content = self._mm[start + key_len:start + key_len + content_len]
+
+        self.hits += 1
+        return content, expires_at, stale_until
+
+    def set(self, key: str, content: bytes, expires_at: float, stale_until: float) -> None:
+        key_bytes = key.encode()
+        if _HEADER.size + len(key_bytes) + len(content) > self.slot_size:
+            self.too_large += 1
+            return
+
+        digest, offset = self._slot(key_bytes)
+        start = offset + _HEADER.size
+
+        with self._locked(offset, exclusive=True):
+            slot_digest, _, slot_stale_until, _, _ = _HEADER.unpack_from(self._mm, offset)
+            if slot_digest not in (digest, bytes(8)) and slot_stale_until > time.time():
+                self.collisions += 1
+
+            self._mm[start:start + len(key_bytes) + len(content)] = key_bytes + content
+            _HEADER.pack_into(self._mm, offset, digest, expires_at, stale_until, len(key_bytes), len(content))
+
+        self.writes += 1
+
+    def delete(self, key: str) -> None:
+        key_bytes = key.encode()
+        digest, offset = self._slot(key_bytes)
+
+        with self._locked(offset, exclusive=True):
+            if _HEADER.unpack_from(self._mm, offset)[0] == digest:
+                _HEADER.pack_into(self._mm, offset, bytes(8), 0, 0, 0, 0)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "collisions": self.collisions,
+            "too_large": self.too_large,
+        }
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
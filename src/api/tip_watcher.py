@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class TipWatcher:
+    """
+    Follows the chain tip and invalidates the cached data depending on it.
+
+    The tip hash is polled (GET /blocks/tip/hash, a few bytes) or pushed through observe(), the
+    polling pauses while a push source is active. On a new hash, every registered client drops
+    its entries whose TTL policy is tip_dependent and downloads again the ones still in use. While the watcher is live those entries are cached
+    for TIP_DEPENDENT_TTL, they are fresh right after a block without being polled in between.
+    """
+
+    def __init__(self):
+        self.tip_hash: Optional[str] = None
+        self.new_tips: int = 0
+        self.invalidations: int = 0 # entries dropped because a block arrived
+
+        self._clients: list[Any] = [] # AsyncAPIClient instances with tip-dependent policies
+        self._last_seen: Optional[float] = None
+        self._last_pushed: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._sessions: int = 0
+
+    @property
+    def live(self) -> bool:
+        """True while the tip is known to be current, i.e. a new block would be noticed"""
+        return self._last_seen is not None and time.monotonic() - self._last_seen <= Config.TIP_POLL_INTERVAL * 3
+
+    def register(self, client) -> None:
+        """Declares a client whose cache holds tip-dependent entries"""
+        if client not in self._clients:
+            self._clients.append(client)
+
+    @property
+    def pushed(self) -> bool:
+        """True while a push source reports the tip, polling is useless meanwhile"""
+        return self._last_pushed is not None and time.monotonic() - self._last_pushed <= Config.TIP_POLL_INTERVAL * 3
+
+    async def observe(self, tip_hash: str, pushed: bool = False) -> bool:
+        """Records the current tip hash, invalidates the tip-dependent entries if it changed"""
+        self._last_seen = time.monotonic()
+        if pushed:
+            self._last_pushed = self._last_seen
+        previous, self.tip_hash = self.tip_hash, tip_hash
+        if previous is None or previous == tip_hash:
+            return False
+
+        self.new_tips += 1
+        results = await asyncio.gather(*(client.on_new_tip() for client in self._clients), return_exceptions=True)
+
+        invalidated = 0
+        for client, result in zip(self._clients, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to invalidate the cache of {client.base_url} : {result}")
+            else:
+                invalidated += result
+        self.invalidations += invalidated
+
+        logger.info(f"New chain tip {tip_hash}, {invalidated} cached entries invalidated")
+        return True
+
+    async def run(self, client) -> None:
+        """Polls the tip hash of the given (Mempool.space / Esplora) client"""
+        while True:
+            if self.pushed:
+                await asyncio.sleep(Config.TIP_POLL_INTERVAL)
+                continue
+
+            try:
+                result = await client.refresh("/blocks/tip/hash")
+                if result.ok and isinstance(result.data, str):
+                    await self.observe(result.data.strip())
+                else:
+                    logger.debug(f"Failed to poll the chain tip : {result.error}")
+            except Exception as e:
+                logger.error(f"Failed to poll the chain tip : {e}", exc_info=True)
+            await asyncio.sleep(Config.TIP_POLL_INTERVAL)
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._last_seen = None
+
+    @asynccontextmanager
+    async def session(self, client):
+        """Polls the tip through `client` while at least one server session runs"""
+        self._sessions += 1
+        try:
+            if self._sessions == 1 and Config.ENABLE_TIP_WATCHER:
+                self._task = asyncio.ensure_future(self.run(client))
+            yield self
+        finally:
+            self._sessions -= 1
+            if self._sessions == 0:
+                await self.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "live": self.live,
+            "pushed": self.pushed,
+            "tip_hash": self.tip_hash,
+            "new_tips": self.new_tips,
+            "invalidations": self.invalidations,
+            "clients": [client.base_url for client in self._clients],
+        }
+
+
+# Singleton instance for the watcher
+_tip_watcher_instance = None
+
+def get_tip_watcher() -> TipWatcher:
+    """Get or create the Tip Watcher singleton instance."""
+    global _tip_watcher_instance
+    if _tip_watcher_instance is None:
+        _tip_watcher_instance = TipWatcher()
+    return _tip_watcher_instance
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import httpx
+
+from src.config import Config
+
+try:
+    import h2 # noqa: F401 - only needed by httpx to speak HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError: # pip install "httpx[http2]"
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _origin(base_url: str) -> str:
+    url = httpx.URL(base_url)
+    return f"{url.scheme}://{url.host}:{url.port or (443 if url.scheme == 'https' else 80)}"
+
+
+# docs = https://www.python-httpx.org/advanced/transports/ , https://www.python-httpx.org/http2/
+class TransportManager:
+    """
+    Connection pools of the process, one per upstream host and shared by every client of that host.
+
+    Each pool has its own connection and keep-alive limits and negotiates HTTP/2 when h2 is
+    installed and the host supports it, so concurrent requests to one host are multiplexed
+    instead of opening more connections. Pools are pre-warmed (TCP + TLS) when the server app
+    starts, stay open across MCP sessions and are closed at shutdown.
+    """
+
+    def __init__(self):
+        self.http2: bool = Config.ENABLE_HTTP2 and HTTP2_AVAILABLE
+        self.limits: httpx.Limits = httpx.Limits(
+            max_connections=Config.HTTP_MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_PER_HOST,
+            keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY,
+        )
+
+        self._hosts: dict[str, str] = {} # origin -> base URL used to pre-warm it
+        self._timeouts: dict[str, httpx.Timeout] = {}
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._transports: dict[str, httpx.AsyncHTTPTransport] = {}
+        self._sync_clients: dict[str, httpx.Client] = {}
+        self._lock = threading.Lock()
+        self._prewarm_task: Optional[asyncio.Task] = None
+
+        if Config.ENABLE_HTTP2 and not HTTP2_AVAILABLE:
+            logger.info("h2 is not installed, upstream connections use HTTP/1.1")
+
+    def register(self, base_url: str, timeout: httpx.Timeout) -> None:
+        """Declares an upstream, the first timeout registered for a host is the one its pool uses"""
+        origin = _origin(base_url)
+        with self._lock:
+            self._hosts.setdefault(origin, base_url)
+            self._timeouts.setdefault(origin, timeout)
+
+    def client(self, base_url: str) -> httpx.AsyncClient:
+        """Returns the shared async client of the upstream host, created on first use"""
+        origin = _origin(base_url)
+        with self._lock:
+            client = self._clients.get(origin)
+            if client is None or client.is_closed:
+                transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits)
+                client = httpx.AsyncClient(transport=transport, timeout=self._timeouts.get(origin), http2=self.http2)
+                self._transports[origin] = transport
+                self._clients[origin] = client
+            return client
+
+    def sync_client(self, base_url: str) -> httpx.Client:
+        """Returns the shared blocking client of the upstream host, created on first use"""
+        origin = _origin(base_url)
+        with self._lock:
+            client = self._sync_clients.get(origin)
+            if client is None or client.is_closed:
+                client = httpx.Client(timeout=self._timeouts.get(origin), limits=self.limits, http2=self.http2)
+                self._sync_clients[origin] = client
+            return client
+
+    def set_client(self, base_url: str, client: httpx.AsyncClient) -> None:
+        """Replaces the async client of a host, e.g. with one built on httpx.MockTransport"""
+        with self._lock:
+            self._clients[_origin(base_url)] = client
+
+    async def prewarm(self) -> None:
+        """Opens a connection (and TLS session) to every registered host, failures are only logged"""
+        async def warm(origin: str, base_url: str) -> None:
+            try:
+                await self.client(base_url).head(base_url)
+            except httpx.HTTPError as e:
+                logger.warning(f"Failed to pre-warm {origin} : {e}")
+
+        with self._lock:
+            hosts = list(self._hosts.items())
+        await asyncio.gather(*(warm(origin, base_url) for origin, base_url in hosts))
+        logger.info(f"Pre-warmed connections to {len(hosts)} hosts")
+
+    async def aclose(self) -> None:
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+            self._prewarm_task = None
+
+        with self._lock:
+            clients = list(self._clients.values())
+            sync_clients = list(self._sync_clients.values())
+            self._clients.clear()
+            self._transports.clear()
+            self._sync_clients.clear()
+
+        for client in clients:
+            await client.aclose()
+        for client in sync_clients:
+            client.close()
+
+    @asynccontextmanager
+    async def lifespan(self):
+        """Keeps the pools open for the life of the server, pre-warms them in the background at startup"""
+        if Config.HTTP_PREWARM:
+            self._prewarm_task = asyncio.ensure_future(self.prewarm())
+        try:
+            yield self
+        finally:
+            await self.aclose()
+
+    def stats(self) -> dict:
+        """Returns the connections of every pool: total, busy, idle and how many speak HTTP/2"""
+        stats = {}
+        with self._lock:
+            transports = list(self._transports.items())
+
+        for origin, transport in transports:
+            connections = transport._pool.connections # httpcore exposes no public accessor on the transport
+            stats[origin] = {
+                "connections": len(connections),
+                "active": sum(1 for connection in connections if not connection.is_idle() and not connection.is_closed()),
+                "idle": sum(1 for connection in connections if connection.is_idle()),
+                "http2": sum(1 for connection in connections if connection.info().startswith("HTTP/2")),
+                "max_connections": self.limits.max_connections,
+            }
+        return stats
+
+
+# Singleton instance for the manager
+_transport_manager_instance = None
+
+def get_transport_manager() -> TransportManager:
+    """Get or create the Transport Manager singleton instance."""
+    global _transport_manager_instance
+    if _transport_manager_instance is None:
+        _transport_manager_instance = TransportManager()
+    return _transport_manager_instance
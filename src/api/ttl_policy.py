@@ -0,0 +1,72 @@
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from src.api.tip_watcher import get_tip_watcher
+from src.config import Config
+
+FOREVER: float = float("inf") # immutable data, only evicted by the LRU
+
+
+@dataclass(frozen=True)
+class TTLPolicy:
+    """
+    Cache lifetime of the endpoints matching a pattern.
+
+    Either a fixed ttl, or a resolver(client, match, data) computing the ttl from the response
+    (e.g. a transaction becomes immutable once buried under enough blocks).
+    stale_ttl is how long past its ttl an entry may still be served while it is refreshed in the background.
+    tip_dependent data only changes with a new block : it is invalidated by the tip watcher and,
+    while the watcher is live, cached for at least TIP_DEPENDENT_TTL.
+    """
+    pattern: str
+    ttl: Optional[float] = None
+    resolver: Optional[Callable[[Any, re.Match, Any], float]] = None
+    stale_ttl: float = 0
+    tip_dependent: bool = False
+
+    regex: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "regex", re.compile(self.pattern))
+
+    def ttl_for(self, client, match: re.Match, data: Any) -> float:
+        if self.resolver is not None:
+            return self.resolver(client, match, data)
+        return self.ttl
+
+
+def match_policy(policies: tuple, endpoint: str) -> tuple[Optional[TTLPolicy], Optional[re.Match]]:
+    """Returns the first policy matching the endpoint and its match, or (None, None)"""
+    for policy in policies:
+        match = policy.regex.match(endpoint)
+        if match:
+            return policy, match
+    return None, None
+
+
+def resolve_ttl(policies: tuple, client, endpoint: str, data: Any, default: float) -> tuple[float, float]:
+    """Returns (ttl, stale_ttl) of the first policy matching the endpoint, or the default ttl"""
+    policy, match = match_policy(policies, endpoint)
+    if policy is None:
+        return default, 0
+
+    ttl = policy.ttl_for(client, match, data)
+    if policy.tip_dependent and get_tip_watcher().live:
+        ttl = max(ttl, Config.TIP_DEPENDENT_TTL) # the watcher invalidates it as soon as a block arrives
+    return ttl, policy.stale_ttl
+
+
+def depth_ttl(depth: Optional[int]) -> float:
+    """Cache forever once past the reorg threshold, otherwise keep the default ttl"""
+    if depth is not None and depth >= Config.REORG_SAFE_DEPTH:
+        return FOREVER
+    return Config.CACHE_TTL_TIME
+
+
+def depth_from_block_time(block_time: Optional[int]) -> Optional[int]:
+    """Conservative depth estimate when the tip height is unknown (half the expected block rate)"""
+    if not block_time:
+        return None
+    return int((time.time() - block_time) / (Config.BLOCK_INTERVAL * 2))
@@ -0,0 +1,74 @@
+import threading
+import time
+from typing import Optional
+
+from src.config import Config
+
+
+class UpstreamScore:
+    """
+    EWMA latency and error rate of one upstream, fed by every request that reached the network.
+
+    The cost used to rank providers is the latency inflated by the error rate, an upstream
+    erring more than ROUTING_MAX_ERROR_RATE is considered unhealthy. A score left without
+    samples for ROUTING_SCORE_EXPIRY is forgotten, so a demoted upstream gets probed again.
+    """
+
+    def __init__(self, alpha: float = Config.ROUTING_EWMA_ALPHA):
+        self.alpha: float = alpha
+
+        self.latency: Optional[float] = None # seconds, None until the first answer
+        self.error_rate: float = 0
+        self.samples: int = 0
+        self._updated_at: float = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: Optional[float], failed: bool) -> None:
+        """`latency` is None when no answer came back (timeout, network error)"""
+        with self._lock:
+            self.samples += 1
+            self._updated_at = time.monotonic()
+            self.error_rate += self.alpha * ((1 if failed else 0) - self.error_rate)
+            if latency is not None:
+                self.latency = latency if self.latency is None else self.latency + self.alpha * (latency - self.latency)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() - self._updated_at > Config.ROUTING_SCORE_EXPIRY
+
+    @property
+    def healthy(self) -> bool:
+        return self.expired or self.error_rate < Config.ROUTING_MAX_ERROR_RATE
+
+    @property
+    def cost(self) -> float:
+        if self.latency is None or self.expired:
+            return 0 # unknown or outdated, try it to learn its latency
+        return self.latency * (1 + Config.ROUTING_ERROR_PENALTY * self.error_rate)
+
+    def stats(self) -> dict:
+        return {
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "cost": round(self.cost, 3),
+            "healthy": self.healthy,
+            "samples": self.samples,
+        }
+
+
+# One score per upstream base URL, shared by every client of the process
+_upstream_scores: dict[str, UpstreamScore] = {}
+_upstream_scores_lock = threading.Lock()
+
+def get_upstream_score(base_url: str) -> UpstreamScore:
+    """Get or create the score of an upstream."""
+    with _upstream_scores_lock:
+        if base_url not in _upstream_scores:
+            _upstream_scores[base_url] = UpstreamScore()
+        return _upstream_scores[base_url]
+
+def get_upstream_scores() -> dict:
+    """Returns the scoring table of every upstream, cheapest first"""
+    with _upstream_scores_lock:
+        ranked = sorted(_upstream_scores.items(), key=lambda item: (not item[1].healthy, item[1].cost))
+        return {base_url: score.stats() for base_url, score in ranked}
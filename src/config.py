@@ -1,6 +1,8 @@
 import os
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 @dataclass
 class Config:
@@ -10,17 +12,127 @@ class Config:
     BLOCKCHAIN_INFO_API_URL: str = "https://blockchain.info"
     HIRO_API_URL: str = "https://api.hiro.so"
     ALTERNATIVE_API_URL: str = "https://api.alternative.me"
+    ESPLORA_API_URL: Optional[str] = None # self-hosted Esplora, e.g. "http://localhost:3000/api"
 
     SATOSHI: int = 100_000_000
 
     # Retry & Cache
     ENABLE_CACHE: bool = True
     ENABLE_RETRY: bool = True
+    ENABLE_STALE_WHILE_REVALIDATE: bool = True
+    ENABLE_RATE_LIMIT: bool = True
+    ENABLE_CIRCUIT_BREAKER: bool = True
+    ENABLE_HEDGED_REQUESTS: bool = True
+    ENABLE_HTTP2: bool = True # used when the optional h2 package is installed
 
     # APIs Management
 
     CACHE_TTL_TIME: int = 60
+    CACHE_MAX_ENTRIES: int = 2048
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024 # 64 MB of cached data per client, decoded documents included
+    CACHE_DECODED_SIZE_FACTOR: float = 2.5 # memory of a decoded document per byte of its body (~2.3 in benchmarks/json_decode.py)
+    CACHE_SWEEP_INTERVAL: int = 30
+    CACHE_STALE_TTL_TIME: int = 300 # hard ceiling on staleness for stale-while-revalidate endpoints
+    CACHE_FALLBACK_TTL: int = 1800 # how long expired data is kept to answer while an upstream is down
+    CACHE_RAW_BYTES: bool = False # keep the compact response bodies in cache and decode them on every hit
+
+    # "auto" (orjson, then msgspec, then the standard library), "orjson", "msgspec" or "json"
+    JSON_DECODER: str = "auto"
+
+    # Second cache tier behind the in-memory cache : "memory" (none), "disk" (SQLite, survives restarts)
+    # or "shared" (memory-mapped file shared by every worker of the host)
+    CACHE_BACKEND: str = "memory"
+
+    DISK_CACHE_PATH: str = "../cache/responses.sqlite3"
+    DISK_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    DISK_CACHE_MIN_TTL: int = 60 # shorter-lived responses are kept in memory only
+    DISK_CACHE_COMPACT_INTERVAL: int = 600
+
+    SHARED_CACHE_PATH: str = os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "bitcoin_mcp_cache")
+    SHARED_CACHE_SLOTS: int = 512
+    SHARED_CACHE_SLOT_SIZE: int = 256 * 1024 # larger responses stay private to each worker
+
     MAX_RETRIES: int = 3
+    GET_MANY_MAX_CONCURRENCY: int = 8 # requests in flight per get_many call
+    MAX_RETRY_AFTER: int = 60 # give up instead of waiting longer than this on 429/503
+
+    # Circuit Breaker (per upstream)
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_RESET_TIMEOUT: int = 30
+    CIRCUIT_BREAKER_SERVE_STALE: bool = True # answer with expired cached data while the upstream is down (open circuit, 5xx, timeout), flagged stale
+
+    # Provider routing : a hedged request goes to the next provider when the first one is slower than its p95
+    HEDGE_LATENCY_PERCENTILE: float = 0.95
+    HEDGE_LATENCY_WINDOW: int = 200 # latency samples kept per provider
+    HEDGE_MIN_SAMPLES: int = 20 # no hedging until the percentile is meaningful
+    HEDGE_MIN_DELAY: float = 0.1 # never hedge sooner than this
+
+    # Provider selection : each upstream is ranked by EWMA latency inflated by its EWMA error rate
+    ROUTING_EWMA_ALPHA: float = 0.2
+    ROUTING_ERROR_PENALTY: float = 4 # a 25% error rate doubles the cost of an upstream
+    ROUTING_MAX_ERROR_RATE: float = 0.5 # above, the upstream is only used when nothing else answers
+    ROUTING_SCORE_EXPIRY: int = 120 # seconds without traffic before an upstream is measured again
+
+    # Retry Budget (per upstream, shared by the whole process)
+    RETRY_BUDGET_RATIO: float = 0.1 # at most ~10% of the requests get retried
+    RETRY_BUDGET_MIN_PER_SECOND: float = 0.2
+    RETRY_BUDGET_MAX_TOKENS: float = 10
+
+    # Rate Limits (requests per second, burst size) per upstream
+    MEMPOOL_RATE_LIMIT: float = 10
+    MEMPOOL_RATE_BURST: int = 20
+    COINGECKO_RATE_LIMIT: float = 0.2 # the public tier allows a few calls per minute
+    COINGECKO_RATE_BURST: int = 3
+    BLOCKCHAIN_INFO_RATE_LIMIT: float = 1
+    BLOCKCHAIN_INFO_RATE_BURST: int = 5
+    ALTERNATIVE_RATE_LIMIT: float = 1
+    ALTERNATIVE_RATE_BURST: int = 5
+    RATE_LIMIT_MAX_WAIT: float = 30 # give up instead of queueing longer than this for a token
+
+    # Background prefetch : hot endpoints are refreshed shortly before they expire while callers keep reading them
+    ENABLE_PREFETCH: bool = True
+    PREFETCH_ENDPOINTS: tuple = ("/simple/price", "/v1/fees/recommended", "/blocks/tip/height", "/stats")
+    PREFETCH_LEAD: float = 3 # seconds before expiry
+    PREFETCH_JITTER: float = 2 # random extra lead, spreads the refreshes of the replicas
+    PREFETCH_INTERVAL: float = 1
+    PREFETCH_IDLE_TIMEOUT: int = 300 # an endpoint nobody read for that long is no longer refreshed
+    PREFETCH_TOKEN_RESERVE: float = 0.5 # share of the rate-limit burst left to the callers
+
+    # Tip watcher : data depending on the chain tip is invalidated on every new block instead of expiring on a timer
+    ENABLE_TIP_WATCHER: bool = True
+    TIP_POLL_INTERVAL: float = 5 # /blocks/tip/hash polling
+    TIP_DEPENDENT_TTL: int = 120 # between two blocks, only while the watcher is live
+
+    # Mempool.space WebSocket feed (optional, pip install websockets) : blocks, fees and mempool stats pushed in memory
+    ENABLE_MEMPOOL_WS: bool = False
+    MEMPOOL_WS_URL: str = "wss://mempool.space/api/v1/ws"
+    MEMPOOL_WS_BLOCKS: int = 15 # latest blocks kept, as many as /v1/blocks returns
+    MEMPOOL_WS_STALE_AFTER: int = 60 # pushed data is no longer served after that long without a message
+    MEMPOOL_WS_MAX_BACKOFF: int = 60
+
+    # Live MCP resources (bitcoin://tip, bitcoin://fees, bitcoin://price/usd), polled once for every subscriber
+    LIVE_POLL_INTERVAL: float = 5
+
+    # Local block header store : height <-> hash and block times answered from a memory-mapped file
+    ENABLE_HEADER_STORE: bool = True
+    HEADER_STORE_PATH: str = "../cache/headers.bin"
+    HEADER_STORE_CAPACITY: int = 1_200_000 # heights, 48 MB of records + a 16 MB hash index (sparse)
+    HEADER_SYNC_INTERVAL: int = 60
+    HEADER_SYNC_BATCHES: int = 20 # /v1/blocks/:height requests per sync, 15 blocks each
+    HEADER_STORE_BACKFILL: bool = False # walk down to the genesis block with the spare rate-limit budget (~58k requests)
+
+    # Rows listed by the address transactions tool, the /rawaddr body is not read any further
+    ADDRESS_TRANSACTIONS_LIMIT: int = 50
+
+    # Blocks buried deeper than this are treated as immutable by the cache
+    REORG_SAFE_DEPTH: int = 6
+    BLOCK_INTERVAL: int = 600
+
+    # Connection pools (per upstream host)
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_MAX_KEEPALIVE_PER_HOST: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 60
+    HTTP_PREWARM: bool = True # open the connections and TLS sessions at startup
 
     # Timeout
     API_CONNECT_TIMEOUT: int = 5.0
@@ -2,6 +2,7 @@ import logging
 from typing import Optional
 from src.api.blockchain_client import get_blockchain_client
 from src.api.mempool_client import get_mempool_client
+from src.api.routes import get_address_info_router, get_address_overview_router
 from src.data.addresses_dataclasses import DataOverviewAddress, DataInfosAddress
 from src.config import Config
 
@@ -17,8 +18,10 @@ class AddressAnalyzer:
         """
         self.blockchain = get_blockchain_client()
         self.mempool = get_mempool_client()
+        self.info_router = get_address_info_router()
+        self.overview_router = get_address_overview_router()
 
-    def get_address_info(self, address: str) -> Optional[str]:
+    async def get_address_info(self, address: str) -> Optional[str]:
         """
         Retrieves a complete summary of a Bitcoin address.
 
@@ -34,7 +37,7 @@ class AddressAnalyzer:
             Returns None if an API error occurs or the address is not found.
         """
         try:
-            data: dict = self.mempool.get_address_info(address)
+            data: dict = await self.info_router.fetch(address)
             if not data:
                 return None
 
@@ -91,7 +94,7 @@ class AddressAnalyzer:
             logger.error(f"Failed to process: {e}", extra={"address": address}, exc_info=True)
             return None
 
-    def get_address_info_overview(self, address: str) -> Optional[str]:
+    async def get_address_info_overview(self, address: str) -> Optional[str]:
         """
         Retrieves a high-level overview of a Bitcoin address.
 
@@ -106,7 +109,7 @@ class AddressAnalyzer:
             Returns None if an API error occurs or data is missing.
         """
         try:
-            data: dict = self.blockchain.get_address_info(address)
+            data: dict = await self.overview_router.fetch(address)
             if not data:
                 return None
 
@@ -3,7 +3,9 @@ from typing import Optional
 from datetime import datetime, timedelta
 
 from src.api.blockchain_client import get_blockchain_client
+from src.api.header_store import HeaderStore, get_header_store
 from src.api.mempool_client import get_mempool_client
+from src.api.routes import get_latest_block_router
 
 from src.data.blocks_dataclasses import DataLatestBlock, DataLatestBlocks
 
@@ -19,8 +21,10 @@ class BlockAnalyzer:
         """
         self.mempool = get_mempool_client()
         self.blockchain = get_blockchain_client()
+        self.latest_block_router = get_latest_block_router()
+        self.headers: Optional[HeaderStore] = get_header_store() # local height <-> hash index of the synced chain
 
-    def get_latest_block_summary(self) -> Optional[str]:
+    async def get_latest_block_summary(self) -> Optional[str]:
         """
         Retrieves a summary of the most recently mined block.
 
@@ -32,7 +36,7 @@ class BlockAnalyzer:
             Returns None if an API error occurs or data is missing.
         """
         try:
-            data: dict = self.blockchain.get_latest_block()
+            data: dict = await self.latest_block_router.fetch()
             if not data:
                 return None
 
@@ -47,7 +51,7 @@ class BlockAnalyzer:
                 f"Height: {infos.height}\n"
                 f"Hash: {infos.hash}\n"
                 f"Timestamp: {date_str} ({time_ago_str} ago)\n"
-                f"Block Index: {infos.block_index}"
+                f"Block Index: {infos.block_index if infos.block_index else 'N/A'}"
             )
             return result
 
@@ -56,7 +60,7 @@ class BlockAnalyzer:
             logger.error(f"Failed to process: {e}", exc_info=True)
             return None
 
-    def get_block_by_height(self, height: int) -> Optional[str]:
+    async def get_block_by_height(self, height: int) -> Optional[str]:
         """
         Retrieves the block hash for a specific block height.
 
@@ -68,9 +72,16 @@ class BlockAnalyzer:
             Returns None if the block is not found or an API error occurs.
         """
         try:
-            block_hash: str = self.mempool.get_block_height(height)
+            block_hash: Optional[str] = None
+            if self.headers is not None and self.headers.is_final(height):
+                block_hash = self.headers.hash_at(height) # buried blocks never change, no request needed
+
             if not block_hash:
-                return None
+                block_hash = await self.mempool.get_block_height(height)
+                if not block_hash:
+                    return None
+                if self.headers is not None and self.headers.is_final(height):
+                    self.headers.put(height, block_hash)
 
             return f"Hash du bloc #{height:,}: {block_hash}"
 
@@ -79,7 +90,7 @@ class BlockAnalyzer:
             logger.error(f"Failed to process: {e}", extra={"height": height}, exc_info=True)
             return None
 
-    def get_latest_blocks_info(self) -> Optional[str]:
+    async def get_latest_blocks_info(self) -> Optional[str]:
         """
         Retrieves detailed information and statistics for the last 10 mined blocks.
 
@@ -91,7 +102,7 @@ class BlockAnalyzer:
             Returns None if an API error occurs or data is empty.
         """
         try:
-            data: list = self.mempool.get_blocks_info()
+            data: list = await self.mempool.get_blocks_info()
             if not data:
                 return None
 
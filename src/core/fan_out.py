@@ -0,0 +1,62 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable
+
+logger = logging.getLogger(__name__)
+
+
+async def fan_out(label: str, **fetches: Awaitable) -> dict[str, Any]:
+    """
+    Runs the independent upstream fetches of one analyzer method concurrently.
+
+    Args:
+        label: Name of the analyzer method, used by the timings.
+        fetches: The awaitables to run, by name.
+
+    Returns:
+        Their results by name. The first exception raised by a fetch is raised again once all
+        of them are done, like the sequential awaits it replaces.
+    """
+    durations: dict[str, float] = {}
+
+    async def timed(name: str, fetch: Awaitable) -> Any:
+        started = time.monotonic()
+        try:
+            return await fetch
+        finally:
+            durations[name] = time.monotonic() - started
+
+    started = time.monotonic()
+    results = await asyncio.gather(*(timed(name, fetch) for name, fetch in fetches.items()), return_exceptions=True)
+    _record(label, time.monotonic() - started, durations)
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return dict(zip(fetches, results))
+
+
+# Timings of the last fan-out of every analyzer method, published for monitoring
+_timings: dict[str, dict] = {}
+_timings_lock = threading.Lock()
+
+def _record(label: str, total: float, durations: dict[str, float]) -> None:
+    critical_path = max(durations, key=durations.get)
+    branches = ", ".join(f"{name} {duration:.3f}s" for name, duration in durations.items())
+    logger.debug(f"{label} : {total:.3f}s, critical path {critical_path} ({branches})")
+
+    with _timings_lock:
+        timing = _timings.setdefault(label, {"calls": 0})
+        timing["calls"] += 1
+        timing["last_total"] = round(total, 3)
+        timing["critical_path"] = critical_path
+        timing["branches"] = {name: round(duration, 3) for name, duration in durations.items()}
+        # time saved against running the same fetches one after another
+        timing["saved"] = round(sum(durations.values()) - total, 3)
+
+def get_fan_out_timings() -> dict:
+    """Returns the last timings and critical path of every fanned-out analyzer method"""
+    with _timings_lock:
+        return {label: dict(timing) for label, timing in _timings.items()}
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Optional
+
+from src.api.coingecko_client import get_coingecko_client
+from src.api.mempool_client import get_mempool_client
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+async def _read_tip() -> Optional[dict]:
+    height, tip_hash = await get_mempool_client().get_many(["/blocks/tip/height", "/blocks/tip/hash"])
+    if height.data is None or tip_hash.data is None:
+        return None
+    return {"height": int(height.data), "hash": tip_hash.data}
+
+async def _read_fees() -> Optional[dict]:
+    return await get_mempool_client().get_recommended_fees()
+
+async def _read_price_usd() -> Optional[dict]:
+    data = await get_coingecko_client().get_btc_price_usd()
+    usd = data.get("bitcoin", {}).get("usd") if data else None
+    if usd is None:
+        return None
+    return {"usd": usd}
+
+
+class LivePoller:
+    """
+    Single background poller behind the live MCP resources.
+
+    Every subscribed resource is read once per LIVE_POLL_INTERVAL through the API clients (so
+    mostly from their cache, the prefetcher and the tip watcher keep it fresh) whatever the
+    number of subscribers, and an update notification is sent to each of its subscribers only
+    when the value changed. Resources nobody subscribed to are not polled, their last value is
+    dropped and read again by the next subscription.
+    """
+
+    def __init__(self):
+        self.readers: dict[str, Callable[[], Awaitable[Any]]] = {
+            "bitcoin://tip": _read_tip,
+            "bitcoin://fees": _read_fees,
+            "bitcoin://price/usd": _read_price_usd,
+        }
+
+        self._values: dict[str, Any] = {}
+        self._subscribers: dict[str, set] = {uri: set() for uri in self.readers} # uri -> server sessions
+        self._task: Optional[asyncio.Task] = None
+        self._sessions: int = 0
+
+        self.polls: int = 0
+        self.notifications: int = 0
+
+    async def read(self, uri: str) -> Any:
+        """Returns the last polled value of a subscribed resource, reads the others now"""
+        if self._subscribers[uri] and uri in self._values:
+            return self._values[uri]
+        return await self.readers[uri]()
+
+    async def subscribe(self, uri: str, session) -> bool:
+        """Adds a subscriber, returns True if it is the first subscription of that session"""
+        if uri not in self._subscribers:
+            raise ValueError(f"Unknown resource {uri}")
+
+        first = not any(session in sessions for sessions in self._subscribers.values())
+        if not self._subscribers[uri]:
+            await self._refresh(uri) # not polled until now, the value to compare the next polls with
+        self._subscribers[uri].add(session)
+        return first
+
+    def unsubscribe(self, uri: str, session) -> None:
+        sessions = self._subscribers.get(uri)
+        if sessions is None:
+            return
+
+        sessions.discard(session)
+        if not sessions:
+            self._values.pop(uri, None) # no longer polled, it would only go stale
+
+    def forget(self, session) -> None:
+        """Drops every subscription of a session that ended"""
+        for uri in self._subscribers:
+            self.unsubscribe(uri, session)
+
+    async def _refresh(self, uri: str) -> None:
+        try:
+            value = await self.readers[uri]()
+        except Exception as e:
+            logger.error(f"Failed to read {uri} : {e}")
+            return
+        if value is not None:
+            self._values[uri] = value
+
+    async def poll(self) -> None:
+        """Reads every subscribed resource once, notifies its subscribers if its value changed"""
+        uris = [uri for uri, sessions in self._subscribers.items() if sessions]
+        values = await asyncio.gather(*(self.readers[uri]() for uri in uris), return_exceptions=True)
+        self.polls += 1
+
+        for uri, value in zip(uris, values):
+            if isinstance(value, BaseException):
+                logger.error(f"Failed to poll {uri} : {value}")
+                continue
+            if value is None or not self._subscribers[uri] or self._same(self._values.get(uri), value):
+                continue # nothing read, unsubscribed meanwhile or unchanged
+
+            first = uri not in self._values # nothing changed for the subscribers yet
+            self._values[uri] = value
+            if not first:
+                await self._notify(uri)
+
+    @staticmethod
+    def _same(previous: Any, value: Any) -> bool:
+        return previous is not None and json.dumps(previous, sort_keys=True) == json.dumps(value, sort_keys=True)
+
+    async def _notify(self, uri: str) -> None:
+        for session in list(self._subscribers[uri]):
+            try:
+                await session.send_resource_updated(uri)
+                self.notifications += 1
+            except Exception as e: # the client went away without unsubscribing
+                logger.info(f"Dropped a subscriber of {uri} : {e}")
+                self.unsubscribe(uri, session)
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.error(f"Failed to poll the live resources : {e}", exc_info=True)
+            await asyncio.sleep(Config.LIVE_POLL_INTERVAL)
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    @asynccontextmanager
+    async def session(self):
+        """Runs the poller while at least one server session runs"""
+        self._sessions += 1
+        try:
+            if self._sessions == 1:
+                self._task = asyncio.ensure_future(self.run())
+            yield self
+        finally:
+            self._sessions -= 1
+            if self._sessions == 0:
+                await self.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": {uri: len(sessions) for uri, sessions in self._subscribers.items()},
+            "polls": self.polls,
+            "notifications": self.notifications,
+        }
+
+
+# Singleton instance for the poller
+_live_poller_instance = None
+
+def get_live_poller() -> LivePoller:
+    """Get or create the Live Poller singleton instance."""
+    global _live_poller_instance
+    if _live_poller_instance is None:
+        _live_poller_instance = LivePoller()
+    return _live_poller_instance
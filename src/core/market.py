@@ -3,6 +3,9 @@ from typing import Optional
 
 from src.api.coingecko_client import get_coingecko_client
 from src.api.alternative_client import get_alternative_client
+from src.core.fan_out import fan_out
+
+from src.data.model_cache import get_model_cache
 
 from src.data.market_dataclasses import DataMarketOverview, DataBitcoinOverview, DataBitcoinMarket, \
     DataBitcoinMarketSentiment, DataTrendingCategories, DataTrendingCoins, DataTrendingNFTs, DataBitcoinPriceUSD
@@ -19,8 +22,9 @@ class MarketAnalyzer:
         """
         self.coingecko = get_coingecko_client()
         self.alternative = get_alternative_client()
+        self.models = get_model_cache() # /search/trending is parsed once per refresh for the three trending tools
 
-    def get_global_cryptomarket_data(self) -> Optional[str]:
+    async def get_global_cryptomarket_data(self) -> Optional[str]:
         """
         Retrieves a global overview of the cryptocurrency market.
 
@@ -33,7 +37,7 @@ class MarketAnalyzer:
             Returns None if an API error occurs or data is missing.
         """
         try:
-            data: dict = self.coingecko.get_global_market_data()
+            data: dict = await self.coingecko.get_global_market_data()
             if not data:
                 return None
 
@@ -78,7 +82,7 @@ class MarketAnalyzer:
             logger.error(f"Failed to process: {e}", exc_info=True)
             return None
 
-    def get_btc_price_usd(self) -> Optional[str]:
+    async def get_btc_price_usd(self) -> Optional[str]:
         """
         Retrieves the current Bitcoin price in USD.
 
@@ -88,7 +92,7 @@ class MarketAnalyzer:
             Returns None if an API error occurs or data is missing.
         """
         try:
-            data: dict = self.coingecko.get_btc_price_usd()
+            data: dict = await self.coingecko.get_btc_price_usd()
             if not data:
                 return None
 
@@ -101,7 +105,7 @@ class MarketAnalyzer:
             logger.error(f"Failed to process: {e}", exc_info=True)
             return None
 
-    def get_btc_market_data(self) -> Optional[str]:
+    async def get_btc_market_data(self) -> Optional[str]:
         """
         Retrieves a technical and financial report for Bitcoin.
 
@@ -116,7 +120,7 @@ class MarketAnalyzer:
             Returns None if an API error occurs or data is missing
         """
         try:
-            data: dict = self.coingecko.get_btc_market_data()
+            data: dict = await self.coingecko.get_btc_market_data()
             if not data:
                 return None
 
@@ -179,7 +183,7 @@ class MarketAnalyzer:
             return None
 
 
-    def get_market_sentiment(self) -> Optional[str]:
+    async def get_market_sentiment(self) -> Optional[str]:
         """
         Analyzes current market psychology and sentiment.
 
@@ -190,9 +194,14 @@ class MarketAnalyzer:
             Returns None if API data from Alternative.me or CoinGecko is missing.
         """
         try:
-            alternative_data: dict = self.alternative.get_fear_greed_index()
-            coingecko_data: dict = self.coingecko.get_btc_market_data()
-            if not alternative_data | coingecko_data:
+            results: dict = await fan_out(
+                "market_sentiment",
+                alternative=self.alternative.get_fear_greed_index(),
+                coingecko=self.coingecko.get_btc_market_data(),
+            )
+            alternative_data: dict = results["alternative"]
+            coingecko_data: dict = results["coingecko"]
+            if not alternative_data or not coingecko_data:
                 return None
 
             infos: DataBitcoinMarketSentiment = DataBitcoinMarketSentiment.from_data(alternative_data, coingecko_data)
@@ -237,7 +246,7 @@ class MarketAnalyzer:
             return None
 
 
-    def get_trending_coins(self) -> Optional[str]:
+    async def get_trending_coins(self) -> Optional[str]:
         """
         Retrieves the list of currently trending cryptocurrencies.
 
@@ -251,11 +260,11 @@ class MarketAnalyzer:
             Returns None if an API error occurs or data is empty.
         """
         try:
-            data: dict = self.coingecko.get_market_trend()
+            data: dict = await self.coingecko.get_market_trend()
             if not data:
                 return None
 
-            infos: DataTrendingCoins = DataTrendingCoins.from_data(data)
+            infos: DataTrendingCoins = self.models.get(DataTrendingCoins, data, self.coingecko.cache_version("/search/trending"))
 
             result: list = ["=== Trending Coins ==="]
 
@@ -277,7 +286,7 @@ class MarketAnalyzer:
             logger.error(f"Failed to process: {e}", exc_info=True)
             return None
 
-    def get_trending_categories(self) -> Optional[str]:
+    async def get_trending_categories(self) -> Optional[str]:
         """
         Retrieves the list of currently trending cryptocurrency categories.
 
@@ -290,11 +299,11 @@ class MarketAnalyzer:
             Returns None if an API error occurs or data is empty.
         """
         try:
-            data: dict = self.coingecko.get_market_trend()
+            data: dict = await self.coingecko.get_market_trend()
             if not data:
                 return None
 
-            infos: DataTrendingCategories = DataTrendingCategories.from_data(data)
+            infos: DataTrendingCategories = self.models.get(DataTrendingCategories, data, self.coingecko.cache_version("/search/trending"))
 
             result: list = ["=== Trending Categories ==="]
 
@@ -314,7 +323,7 @@ class MarketAnalyzer:
             logger.error(f"Failed to process: {e}", exc_info=True)
             return None
 
-    def get_trending_nfts(self) -> Optional[str]:
+    async def get_trending_nfts(self) -> Optional[str]:
         """
         Retrieves the list of currently trending NFT collections.
 
@@ -327,11 +336,11 @@ class MarketAnalyzer:
             Returns None if an API error occurs or data is empty.
         """
         try:
-            data: dict = self.coingecko.get_market_trend()
+            data: dict = await self.coingecko.get_market_trend()
             if not data:
                 return None
 
-            infos: DataTrendingNFTs = DataTrendingNFTs.from_data(data)
+            infos: DataTrendingNFTs = self.models.get(DataTrendingNFTs, data, self.coingecko.cache_version("/search/trending"))
 
             result: list = ["=== Trending NFTs ==="]
 
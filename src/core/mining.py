@@ -3,7 +3,8 @@ from typing import Optional
 
 from src.api.mempool_client import get_mempool_client
 
-from src.data.mining_dataclasses import DataRankingMiningPools, DataHashratesMiningPools, DataMiningPoolBySlug
+from src.data.model_cache import get_model_cache
+from src.data.mining_dataclasses import MiningPoolIndex, MiningPoolSlugs, DataHashratesMiningPools, DataMiningPoolBySlug
 
 
 logger = logging.getLogger(__name__)
@@ -16,9 +17,10 @@ class MiningPoolAnalyzer:
         Initialize Mining Pools Analyzer.
         """
         self.mempool = get_mempool_client() # le client mempool
+        self.models = get_model_cache() # /v1/mining/pools/3m is indexed once per refresh
 
 
-    def get_mining_pools_ranking(self) -> Optional[str]:
+    async def get_mining_pools_ranking(self) -> Optional[str]:
         """
         Retrieves the top 10 Bitcoin mining pools based on 3-month performance.
 
@@ -30,20 +32,20 @@ class MiningPoolAnalyzer:
             Returns None if an API error occurs or data is empty.
         """
         try:
-            data: dict = self.mempool.get_mining_pools_rank()
+            data: dict = await self.mempool.get_mining_pools_rank()
             if not data:
                 return None
 
-            infos: DataRankingMiningPools = DataRankingMiningPools.from_data(data)
+            index: MiningPoolIndex = self.models.get(MiningPoolIndex, data, self.mempool.cache_version("/v1/mining/pools/3m"))
 
-            total_blocks = sum(p.get("blockCount", 0) for p in infos.top10_pools)
+            total_blocks: int = index.top_blocks(10)
 
             result: str = "## Top Mining Pools (3-Month Hashrate)\n"
 
-            for i, pool in enumerate(infos.top10_pools, 1):
+            for i, pool in enumerate(index.top(10), 1):
                 name: str = pool.get('name', 'Unknown')
                 block_count: int = pool.get('blockCount', 0)
-                percentage: int = (block_count / total_blocks * 100) if total_blocks > 0 else 0
+                percentage: float = index.share(block_count, total_blocks)
 
                 result += f"#{i} {name}\n"
                 result += f"Blocks: {block_count} ({percentage:.2f}%)\n"
@@ -55,7 +57,7 @@ class MiningPoolAnalyzer:
             logger.error(f"Failed to process: {e}", exc_info=True)
             return None
 
-    def get_mining_pool_hashrates(self) -> Optional[str]:
+    async def get_mining_pool_hashrates(self) -> Optional[str]:
         """
         Retrieves the estimated hashrate for the top 10 mining pools over 3 months.
 
@@ -67,7 +69,7 @@ class MiningPoolAnalyzer:
             Returns None if an API error occurs or data is empty.
         """
         try:
-            data: list = self.mempool.get_mining_pools_hashrate()
+            data: list = await self.mempool.get_mining_pools_hashrate()
             if not data:
                 return None
 
@@ -93,7 +95,7 @@ class MiningPoolAnalyzer:
             logger.error(f"Failed to process: {e}", exc_info=True)
             return None
 
-    def get_top_pool(self) -> Optional[str]:
+    async def get_top_pool(self) -> Optional[str]:
         """
         Retrieves detailed information for the #1 ranked Bitcoin mining pool.
 
@@ -106,21 +108,22 @@ class MiningPoolAnalyzer:
             Returns None if an API error occurs or data is missing.
         """
         try:
-            data: dict = self.mempool.get_mining_pools_rank()
+            data: dict = await self.mempool.get_mining_pools_rank()
             if not data:
                 return None
 
-            infos: DataRankingMiningPools = DataRankingMiningPools.from_data(data)
+            index: MiningPoolIndex = self.models.get(MiningPoolIndex, data, self.mempool.cache_version("/v1/mining/pools/3m"))
+            if index.top_pool is None:
+                return None
 
-            top_pool: dict = infos.pools[0]
+            top_pool: dict = index.top_pool
 
             top_pool_name: str = top_pool.get('name', 'Unknown')
             top_pool_slug: str = top_pool.get('slug', 'Unknown')
             top_pool_block_count: int = top_pool.get('blockCount', 0)
             top_pool_link: str = top_pool.get('link', "")
 
-            total_blocks: int = sum(p.get('blockCount', 0) for p in infos.pools)
-            dominance_percentage: float = (top_pool_block_count / total_blocks * 100) if total_blocks > 0 else 0
+            dominance_percentage: float = index.share(top_pool_block_count)
 
             result: str = (
                 f"## Top Mining Pool\n"
@@ -136,7 +139,7 @@ class MiningPoolAnalyzer:
             logger.error(f"Failed to process: {e}", exc_info=True)
             return None
 
-    def get_pool_by_slug(self, pool_slug: str) -> Optional[str]:
+    async def get_pool_by_slug(self, pool_slug: str) -> Optional[str]:
         """
         Retrieves detailed information for a specific mining pool using its slug.
 
@@ -152,7 +155,15 @@ class MiningPoolAnalyzer:
             Returns None if the pool is not found or an API error occurs.
         """
         try:
-            data: dict = self.mempool.get_mining_pool_info_by_slug(pool_slug.lower())
+            # the all-time list (cached for an hour) names every pool the upstream knows, defunct ones included
+            pools: Optional[dict] = await self.mempool.get_mining_pools_all()
+            if pools:
+                known: MiningPoolSlugs = self.models.get(MiningPoolSlugs, pools, self.mempool.cache_version("/v1/mining/pools/all"))
+                if known.slugs and pool_slug.lower() not in known.slugs:
+                    logger.info(f"Unknown mining pool slug : {pool_slug}")
+                    return None
+
+            data: dict = await self.mempool.get_mining_pool_info_by_slug(pool_slug.lower())
             if not data:
                 return None
 
@@ -190,7 +201,7 @@ class MiningPoolAnalyzer:
             return None
 
 
-    def get_mining_statistics(self) -> Optional[str]:
+    async def get_mining_statistics(self) -> Optional[str]:
         """
         Retrieves global statistics and distribution metrics for Bitcoin mining.
 
@@ -202,25 +213,23 @@ class MiningPoolAnalyzer:
             Returns None if an API error occurs or data is empty.
         """
         try:
-            data: dict = self.mempool.get_mining_pools_rank()
+            data: dict = await self.mempool.get_mining_pools_rank()
             if not data:
                 return None
 
-            infos: DataRankingMiningPools = DataRankingMiningPools.from_data(data)
-
-            num_pools: int = len(infos.pools)
-
-            total_blocks: int = sum(p.get("blockCount", 0) for p in infos.pools)
-            avg_blocks_per_pool: int = total_blocks / num_pools if num_pools > 0 else 0
+            index: MiningPoolIndex = self.models.get(MiningPoolIndex, data, self.mempool.cache_version("/v1/mining/pools/3m"))
+            if index.top_pool is None:
+                return None
 
-            top_pool: dict = max(infos.pools, key=lambda x: x.get('blockCount', 0))
-            top_pool_name: str = top_pool.get('name', 'Unknown')
-            top_pool_blocks: int = top_pool.get('blockCount', 0)
+            num_pools: int = index.num_pools
+            total_blocks: int = index.total_blocks
+            avg_blocks_per_pool: float = index.avg_blocks_per_pool
 
-            bottom_pool: dict = min(infos.pools, key=lambda x: x.get('blockCount', 0))
-            bottom_pool_blocks: int = bottom_pool.get('blockCount', 0)
+            top_pool_name: str = index.top_pool.get('name', 'Unknown')
+            top_pool_blocks: int = index.top_pool.get('blockCount', 0)
+            bottom_pool_blocks: int = index.bottom_pool.get('blockCount', 0)
 
-            dominance_percentage: int = (top_pool_blocks / total_blocks * 100) if total_blocks > 0 else 0
+            dominance_percentage: float = index.share(top_pool_blocks)
 
             result: str = (
                 f"## Global Mining Statistics (Bitcoin)\n"
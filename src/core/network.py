@@ -4,7 +4,7 @@ from typing import Optional
 from src.api.mempool_client import get_mempool_client
 from src.api.blockchain_client import get_blockchain_client
 
-from data.network_dataclasses import DataNetworkFees, DataNetworkStats
+from src.data.network_dataclasses import DataNetworkFees, DataNetworkStats
 
 from src.config import Config
 
@@ -20,7 +20,7 @@ class NetworkAnalyzer:
         self.mempool = get_mempool_client()
         self.blockchain = get_blockchain_client()
 
-    def get_network_stats(self) -> Optional[str]:
+    async def get_network_stats(self) -> Optional[str]:
         """
         Retrieves current recommended Bitcoin transaction fees.
 
@@ -31,7 +31,7 @@ class NetworkAnalyzer:
             Returns None if an API error occurs or data is missing.
         """
         try:
-            data: dict = self.blockchain.get_network_stats()
+            data: dict = await self.blockchain.get_network_stats()
             if not data:
                 return None
 
@@ -66,7 +66,7 @@ class NetworkAnalyzer:
             return None
 
 
-    def get_network_recommended_fees(self) -> Optional[str]:
+    async def get_network_recommended_fees(self) -> Optional[str]:
         """
         Retrieves current recommended Bitcoin transaction fees.
 
@@ -77,7 +77,7 @@ class NetworkAnalyzer:
             Returns None if an API error occurs or data is missing.
         """
         try:
-            data: dict = self.mempool.get_recommended_fees()
+            data: dict = await self.mempool.get_recommended_fees()
             if not data:
                 return None
 
@@ -106,7 +106,7 @@ class NetworkAnalyzer:
             return None
 
 
-    def get_network_health(self) -> Optional[str]:
+    async def get_network_health(self) -> Optional[str]:
         """
         Evaluates the overall health and stability of the Bitcoin network.
 
@@ -118,7 +118,7 @@ class NetworkAnalyzer:
             Returns None if an API error occurs or data is missing.
         """
         try:
-            data: dict = self.blockchain.get_network_stats()
+            data: dict = await self.blockchain.get_network_stats()
             if not data:
                 return None
 
@@ -1,12 +1,13 @@
 import logging
 from typing import Optional
 from datetime import datetime
+from contextlib import aclosing
 
+from src.api.client import StreamInterrupted
 from src.api.mempool_client import get_mempool_client
 from src.api.blockchain_client import get_blockchain_client
 
 from src.data.transactions_dataclasses import DataTransactionInfo, DataTxInOut, DataTxOutput, DataTxInput
-from src.data.transactions_dataclasses import DataTransactionsAddress
 
 from src.config import Config
 
@@ -23,7 +24,7 @@ class TransactionAnalyzer:
         self.mempool = get_mempool_client()
         self.blockchain = get_blockchain_client()
 
-    def get_tx_info(self, txid: str) -> Optional[str]:
+    async def get_tx_info(self, txid: str) -> Optional[str]:
         """
         Retrieves detailed information for a specific Bitcoin transaction.
 
@@ -39,7 +40,7 @@ class TransactionAnalyzer:
             Returns None if the transaction is not found or an API error occurs.
         """
         try:
-            data: dict = self.mempool.get_tx_info(txid)
+            data: dict = await self.mempool.get_tx_info(txid)
             if not data:
                 return None
 
@@ -90,7 +91,7 @@ class TransactionAnalyzer:
             return None
 
 
-    def get_tx_inputs_outputs(self, txid: str) -> Optional[str]:
+    async def get_tx_inputs_outputs(self, txid: str) -> Optional[str]:
         """
         Retrieves the detailed input and output flow of a transaction.
 
@@ -105,7 +106,7 @@ class TransactionAnalyzer:
             Returns None if the transaction is not found or an API error occurs.
         """
         try:
-            data: dict = self.mempool.get_tx_info(txid)
+            data: dict = await self.mempool.get_tx_info(txid)
             if not data:
                 return None
 
@@ -168,63 +169,56 @@ class TransactionAnalyzer:
             return None
 
 
-    def get_address_transactions(self, address: str) -> Optional[str]:
+    async def get_address_transactions(self, address: str, limit: int = Config.ADDRESS_TRANSACTIONS_LIMIT) -> Optional[str]:
         """
         Retrieves the transaction history for a specific Bitcoin address.
 
         Args:
             address: The Bitcoin address to query.
+            limit: Maximum number of transactions listed, the download stops once reached.
 
         Returns:
             A formatted string listing recent transactions, including:
             - Transaction ID (TXID).
             - Confirmation date and time.
             - The specific amount sent by this address in each transaction (sats).
+            - A final INCOMPLETE line if the download failed midway.
             Returns None if the address has no history or an API error occurs.
         """
         try:
-            data: dict = self.blockchain.get_address_info(address)
-            if not data:
+            rows: list = []
+            interrupted: Optional[StreamInterrupted] = None
+
+            # single pass over the streamed transactions, only one of them is held in memory at a time
+            try:
+                async with aclosing(self.blockchain.stream_address_txs(address)) as txs:
+                    async for tx in txs:
+                        amount_sent: int = sum(
+                            vin.get("prev_out", {}).get("value", 0)
+                            for vin in tx.get("inputs", [])
+                            if vin.get("prev_out", {}).get("addr") == address
+                        )
+
+                        rows.append(
+                            f"TXID: {tx['hash']}\n"
+                            f"Date: {datetime.fromtimestamp(tx['time'])}\n"
+                            f"Amount: {amount_sent} sat\n"
+                        )
+                        if len(rows) >= limit:
+                            break
+            except StreamInterrupted as e:
+                if not rows:
+                    raise
+                interrupted = e
+                logger.warning(f"Incomplete transaction list : {e}", extra={"address": address})
+
+            if not rows:
                 return None
 
-            infos: DataTransactionsAddress = DataTransactionsAddress.from_data(data)
-
-            len_txs: int = len(infos.txs)
-
-            txs_hash: list = [tx["hash"] for tx in infos.txs]
-            txs_date: list = [datetime.fromtimestamp(tx["time"]) for tx in infos.txs]
-
-            amount_sent: list = [
-                sum(
-                    vin.get("prev_out", {}).get("value", 0)
-                    for vin in tx.get("inputs", [])
-                    if vin.get("prev_out", {}).get("addr") == address
-                )
-                for tx in infos.txs
-            ]
-
-            # Destinations (adresse + montant)
-            # Enlevé car trop de tokens
-            # destinations: list = [
-            #     [
-            #         (o.get("addr", ""), o.get("value", 0))
-            #         for o in tx.get("out", [])
-            #     ]
-            #     for tx in infos.txs
-            # ]
-
-            result: str = ""
-            for i in range(len_txs):
-                result += f"TXID: {txs_hash[i]}\n"
-                result += f"Date: {txs_date[i]}\n"
-                result += f"Amount: {amount_sent[i]} sat\n"
-                # result += "Destinations :\n"
-
-                # for addr, value in destinations[i]:
-                #     result += f"  → {addr} : {value} sats\n"
-                # result += "\n"
+            if interrupted is not None:
+                rows.append(f"INCOMPLETE: the download failed after {len(rows)} transactions ({interrupted.reason}), older ones are missing\n")
 
-            return result
+            return "".join(rows)
 
 
         except Exception as e:
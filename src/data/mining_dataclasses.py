@@ -1,5 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from itertools import accumulate
+from typing import Optional
 
 @dataclass
 class DataRankingMiningPools:
@@ -16,6 +18,59 @@ class DataRankingMiningPools:
         )
 
 
+@dataclass
+class MiningPoolIndex:
+    """Aggregates of a /v1/mining/pools/3m document, computed once per refresh"""
+    data: dict
+
+    def __post_init__(self):
+        pools: list = self.data.get("pools", [])
+
+        self.ranking: list = sorted(pools, key=lambda p: p.get("blockCount", 0), reverse=True)
+        self.block_counts: list = [p.get("blockCount", 0) for p in self.ranking]
+        self.prefix_blocks: list = [0, *accumulate(self.block_counts)] # prefix_blocks[n] = blocks of the top n pools
+
+        self.num_pools: int = len(self.ranking)
+        self.total_blocks: int = self.prefix_blocks[-1]
+        self.avg_blocks_per_pool: float = self.total_blocks / self.num_pools if self.num_pools > 0 else 0
+
+        self.top_pool: Optional[dict] = self.ranking[0] if self.ranking else None
+        self.bottom_pool: Optional[dict] = self.ranking[-1] if self.ranking else None
+
+    def top(self, n: int) -> list:
+        return self.ranking[:n]
+
+    def top_blocks(self, n: int) -> int:
+        """Blocks mined by the top n pools together"""
+        return self.prefix_blocks[min(max(n, 0), self.num_pools)]
+
+    def share(self, block_count: int, total: Optional[int] = None) -> float:
+        """Percentage of `total` (all pools by default) represented by block_count"""
+        total = self.total_blocks if total is None else total
+        return (block_count / total * 100) if total > 0 else 0
+
+    @classmethod
+    def from_data(cls, data: dict) -> MiningPoolIndex:
+        return cls(
+            data = data
+        )
+
+
+@dataclass
+class MiningPoolSlugs:
+    """Slugs of a /v1/mining/pools/all document, every pool that ever mined a block"""
+    data: dict
+
+    def __post_init__(self):
+        self.slugs: frozenset = frozenset(p.get("slug") for p in self.data.get("pools", []) if p.get("slug"))
+
+    @classmethod
+    def from_data(cls, data: dict) -> MiningPoolSlugs:
+        return cls(
+            data = data
+        )
+
+
 @dataclass
 class DataHashratesMiningPools:
     data: list
@@ -0,0 +1,64 @@
+import threading
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ModelCache:
+    """
+    Parsed dataclasses of the last upstream payload, one per model.
+
+    The API clients return the very same object while a response stays cached, so the payload
+    itself is its version : a model is rebuilt only when a refresh brings a new document and is
+    shared meanwhile by every tool reading that endpoint. The payload is kept referenced next to
+    its model so its identity can not be reused by another object. Clients caching raw bytes
+    decode a new object on every hit, their callers pass the cache version of the endpoint instead.
+    Cached models are shared, they must not be modified by the analyzers.
+    """
+
+    def __init__(self):
+        self._models: dict[type, tuple[Any, Optional[int], Any]] = {} # model class -> (payload, version, parsed model)
+        self._lock = threading.Lock()
+
+        self.hits: int = 0
+        self.parses: int = 0
+
+    def get(self, model: type[T], payload: Any, version: Optional[int] = None) -> T:
+        """
+        Returns model.from_data(payload), parsed only if the payload changed since the last call.
+        `version` is the client's cache_version() of the endpoint, read as soon as it returned the payload.
+        """
+        with self._lock:
+            cached: Optional[tuple[Any, Optional[int], Any]] = self._models.get(model)
+            if cached is not None and (cached[0] is payload or (version is not None and cached[1] == version)):
+                self.hits += 1
+                return cached[2]
+
+        parsed = model.from_data(payload)
+        with self._lock:
+            self._models[model] = (payload, version, parsed)
+            self.parses += 1
+        return parsed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "models": sorted(model.__name__ for model in self._models),
+                "hits": self.hits,
+                "parses": self.parses,
+            }
+
+
+# Singleton instance for the cache
+_model_cache_instance = None
+
+def get_model_cache() -> ModelCache:
+    """Get or create the Model Cache singleton instance."""
+    global _model_cache_instance
+    if _model_cache_instance is None:
+        _model_cache_instance = ModelCache()
+    return _model_cache_instance
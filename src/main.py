@@ -7,6 +7,8 @@ sys.path.append(ROOT)
 
 import logging
 import argparse
+from contextlib import AsyncExitStack, asynccontextmanager
+import anyio
 import uvicorn
 from starlette.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
@@ -19,7 +21,21 @@ from src.tools.addresses_tools import register_addresses_tools
 from src.tools.market_tools import register_market_tools
 from src.tools.mining_tools import register_mining_tools
 from src.tools.blocks_tools import register_blocks_tools
+from src.tools.live_resources import register_live_resources
 
+from src.api.circuit_breaker import get_circuit_states
+from src.api.client import get_client_stats
+from src.api.header_store import get_header_store
+from src.api.mempool_client import get_mempool_client
+from src.api.mempool_stream import get_mempool_stream
+from src.api.prefetch import get_prefetch_scheduler
+from src.api.tip_watcher import get_tip_watcher
+from src.api.provider_router import get_router_stats
+from src.api.transport import get_transport_manager
+from src.api.upstream_score import get_upstream_scores
+from src.core.fan_out import get_fan_out_timings
+from src.core.live_poller import get_live_poller
+from src.data.model_cache import get_model_cache
 from src.log import get_logger
 
 
@@ -27,7 +43,33 @@ get_logger = get_logger()
 logger = logging.getLogger(__name__)
 logger.info("Server starting...")
 
-mcp = FastMCP("bitcoin_mcp_server")
+@asynccontextmanager
+async def app_lifespan(app=None):
+    # upstream connections are pre-warmed at startup and kept open between MCP sessions
+    async with get_transport_manager().lifespan():
+        yield
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    # FastMCP enters it once per session : the background services run while at least one session does,
+    # the hot endpoints are kept warm in cache meanwhile and the tip-dependent ones follow the chain tip
+    async with AsyncExitStack() as stack:
+        await stack.enter_async_context(get_prefetch_scheduler().session())
+        await stack.enter_async_context(get_tip_watcher().session(get_mempool_client()))
+
+        stream = get_mempool_stream()
+        if stream is not None:
+            await stack.enter_async_context(stream.session())
+
+        # one poller feeds the live resources of every subscribed client
+        await stack.enter_async_context(get_live_poller().session())
+
+        headers = get_header_store()
+        if headers is not None:
+            await stack.enter_async_context(headers.session(get_mempool_client()))
+        yield
+
+mcp = FastMCP("bitcoin_mcp_server", lifespan=lifespan)
 logger.info("FastMCP instance initialized")
 
 logger.info("Initializing Tools...")
@@ -39,9 +81,30 @@ register_mining_tools(mcp)
 register_blocks_tools(mcp)
 logger.info("Tools Initialized")
 
+logger.info("Initializing Resources...")
+register_live_resources(mcp)
+logger.info("Resources Initialized")
+
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request):
-    return JSONResponse({"status": "healthy", "service": "bitcoin_mcp_server"})
+    stream = get_mempool_stream()
+    headers = get_header_store()
+    return JSONResponse({
+        "status": "healthy",
+        "service": "bitcoin_mcp_server",
+        "upstreams": get_circuit_states(),
+        "clients": get_client_stats(),
+        "routes": get_router_stats(),
+        "scores": get_upstream_scores(),
+        "pools": get_transport_manager().stats(),
+        "fan_out": get_fan_out_timings(),
+        "prefetch": get_prefetch_scheduler().stats(),
+        "tip": get_tip_watcher().stats(),
+        "mempool_ws": stream.stats() if stream is not None else None,
+        "live": get_live_poller().stats(),
+        "headers": headers.stats() if headers is not None else None,
+        "models": get_model_cache().stats(),
+    })
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run MCP Server")
@@ -51,6 +114,7 @@ if __name__ == "__main__":
     if args.port:
         logger.info(f"Server ready, starting HTTP MCP Server on port {args.port}...")
         app = mcp.sse_app()
+        app.router.lifespan_context = app_lifespan
 
         app.add_middleware(
             CORSMiddleware,
@@ -63,4 +127,9 @@ if __name__ == "__main__":
         uvicorn.run(app, host="0.0.0.0", port=args.port)
     else:
         logger.info("Server ready, starting STDIO MCP Server")
-        mcp.run()
\ No newline at end of file
+
+        async def run_stdio() -> None:
+            async with app_lifespan():
+                await mcp.run_stdio_async()
+
+        anyio.run(run_stdio)
\ No newline at end of file
@@ -0,0 +1,70 @@
+import json
+import logging
+from mcp.server.fastmcp import FastMCP
+from src.core.live_poller import get_live_poller
+
+logger = logging.getLogger(__name__)
+
+
+async def get_tip_resource() -> str:
+    """
+    Current tip of the Bitcoin blockchain, as JSON : {"height": ..., "hash": ...}.
+    Subscribe to be notified of every new block instead of polling.
+    """
+    return json.dumps(await get_live_poller().read("bitcoin://tip"))
+
+
+async def get_fees_resource() -> str:
+    """
+    Recommended Bitcoin transaction fees in sat/vB, as JSON (fastestFee, halfHourFee, hourFee, economyFee, minimumFee).
+    Subscribe to be notified when the recommendation changes.
+    """
+    return json.dumps(await get_live_poller().read("bitcoin://fees"))
+
+
+async def get_price_usd_resource() -> str:
+    """
+    Current Bitcoin price in US dollars, as JSON : {"usd": ...}.
+    Subscribe to be notified when the price changes.
+    """
+    return json.dumps(await get_live_poller().read("bitcoin://price/usd"))
+
+
+def _enable_subscriptions(mcp: FastMCP) -> None:
+    """Routes resources/subscribe and resources/unsubscribe to the shared poller"""
+    server = mcp._mcp_server # FastMCP has no public API for subscriptions
+    poller = get_live_poller()
+
+    @server.subscribe_resource()
+    async def subscribe(uri) -> None:
+        session = server.request_context.session
+        if await poller.subscribe(str(uri), session):
+            # dropped when the client disconnects, not after the next change fails to reach it
+            session._exit_stack.callback(poller.forget, session)
+
+    @server.unsubscribe_resource()
+    async def unsubscribe(uri) -> None:
+        poller.unsubscribe(str(uri), server.request_context.session)
+
+    # the low-level server always advertises subscribe=False
+    get_capabilities = server.get_capabilities
+
+    def get_capabilities_with_subscriptions(*args, **kwargs):
+        capabilities = get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    server.get_capabilities = get_capabilities_with_subscriptions
+
+
+def register_live_resources(mcp: FastMCP):
+    """Registers the live Bitcoin resources and their subscriptions"""
+    logger.info("Registering Live Resources...")
+
+    mcp.resource("bitcoin://tip", name="tip", mime_type="application/json")(get_tip_resource)
+    mcp.resource("bitcoin://fees", name="fees", mime_type="application/json")(get_fees_resource)
+    mcp.resource("bitcoin://price/usd", name="price_usd", mime_type="application/json")(get_price_usd_resource)
+    _enable_subscriptions(mcp)
+
+    logger.info("Live Resources Registered")
@@ -0,0 +1,4 @@
+import logging
+
+# the clients log every failure they recover from, keep the test output readable
+logging.getLogger().addHandler(logging.NullHandler())
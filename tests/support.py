@@ -0,0 +1,55 @@
+import itertools
+from typing import Any, Awaitable, Callable, Union
+
+import httpx
+
+from src.api.client import AsyncAPIClient
+from src.api.transport import get_transport_manager
+
+_upstream_ids = itertools.count()
+
+
+def upstream_url() -> str:
+    """Unique base URL, the rate limiter, breaker and retry budget of each upstream are process-wide"""
+    return f"http://upstream-{next(_upstream_ids)}.test"
+
+
+class FakeUpstream:
+    """
+    httpx.MockTransport handler answering each path with a JSON body (200) or a callable(request)
+    returning the response, a coroutine function (e.g. holding the request open) included.
+    Counts the requests it received.
+    """
+
+    def __init__(self, routes: dict[str, Union[Any, Callable[[httpx.Request], Union[httpx.Response, Awaitable[httpx.Response]]]]]):
+        self.routes = routes
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request):
+        self.requests.append(request)
+        route = self.routes.get(request.url.path)
+        if route is None:
+            return httpx.Response(404)
+        return route(request) if callable(route) else httpx.Response(200, json=route)
+
+    def count(self, path: str) -> int:
+        return sum(1 for request in self.requests if request.url.path == path)
+
+
+def versioned(counter: list):
+    """Route answering {"version": n}, n counting the requests it served"""
+    def route(request):
+        counter[0] += 1
+        return httpx.Response(200, json={"version": counter[0]})
+    return route
+
+
+def make_client(upstream: FakeUpstream, client_class: type = AsyncAPIClient, base_url: str = None, **attributes) -> AsyncAPIClient:
+    """Client of `client_class` whose host pool is the fake upstream, class attributes (TTL_POLICIES...) overridden"""
+    base_url = base_url or upstream_url()
+    if attributes:
+        client_class = type(client_class.__name__, (client_class,), attributes)
+
+    client = client_class(base_url)
+    get_transport_manager().set_client(base_url, httpx.AsyncClient(transport=httpx.MockTransport(upstream)))
+    return client
@@ -0,0 +1,390 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+import httpx
+
+from src.api.cache import ResponseCache
+from src.api.client import StreamInterrupted
+from src.api.disk_cache import DiskCache
+from src.api.shared_cache import SharedMemoryCache
+from src.api.ttl_policy import TTLPolicy
+from src.config import Config
+from tests.support import FakeUpstream, make_client, upstream_url, versioned
+
+
+class CoalescingTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_gets_share_one_request(self):
+        release = asyncio.Event()
+
+        async def slow(request):
+            await release.wait()
+            return httpx.Response(200, json={"tip": 1})
+
+        upstream = FakeUpstream({"/tip": slow})
+        client = make_client(upstream)
+
+        callers = [asyncio.ensure_future(client.get("/tip")) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+
+        self.assertEqual(await asyncio.gather(*callers), [{"tip": 1}] * 5)
+        self.assertEqual(upstream.count("/tip"), 1)
+        self.assertEqual(client.coalesced_requests, 4)
+
+    async def test_cancelled_caller_does_not_cancel_the_shared_request(self):
+        release = asyncio.Event()
+
+        async def slow(request):
+            await release.wait()
+            return httpx.Response(200, json={"tip": 1})
+
+        upstream = FakeUpstream({"/tip": slow})
+        client = make_client(upstream)
+
+        first = asyncio.ensure_future(client.get("/tip"))
+        second = asyncio.ensure_future(client.get("/tip"))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        release.set()
+
+        self.assertEqual(await second, {"tip": 1})
+        self.assertTrue(first.cancelled())
+        self.assertEqual(upstream.count("/tip"), 1)
+
+
+class GetManyTest(unittest.IsolatedAsyncioTestCase):
+    async def test_reads_in_order_with_bounded_concurrency_and_coalescing(self):
+        in_flight, peak = [0], [0]
+        release = asyncio.Event()
+
+        async def slow(request):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await release.wait()
+            in_flight[0] -= 1
+            return httpx.Response(200, json={"path": request.url.path})
+
+        paths = [f"/block/{n}" for n in range(6)]
+        upstream = FakeUpstream({path: slow for path in paths} | {"/cached": {"path": "/cached"}})
+        client = make_client(upstream)
+        await client.get("/cached")
+
+        joined = asyncio.ensure_future(client.get("/block/0")) # already in flight when get_many starts
+        await asyncio.sleep(0.01)
+        many = asyncio.ensure_future(client.get_many(["/cached", *paths, "/block/1"], max_concurrency=2))
+        await asyncio.sleep(0.05)
+        release.set()
+
+        results = await many
+        self.assertEqual([result.data["path"] for result in results], ["/cached", *paths, "/block/1"])
+        self.assertTrue(results[0].cached)
+        self.assertEqual(await joined, {"path": "/block/0"})
+
+        self.assertEqual(peak[0], 2) # the get it joined and the second slot of get_many, the others wait
+        self.assertEqual(client.coalesced_requests, 1)
+        self.assertEqual([upstream.count(path) for path in ["/cached", *paths]], [1] * 7)
+
+    async def test_failed_item_does_not_fail_the_others(self):
+        upstream = FakeUpstream({"/a": {"ok": True}, "/b": lambda request: httpx.Response(404)})
+        client = make_client(upstream)
+
+        a, b = await client.get_many(["/a", "/b"])
+
+        self.assertEqual((a.data, a.error), ({"ok": True}, None))
+        self.assertEqual((b.data, b.error), (None, "HTTP 404"))
+
+
+class StaleWhileRevalidateTest(unittest.IsolatedAsyncioTestCase):
+    async def test_expired_entry_is_served_while_refreshed_once(self):
+        counter = [0]
+        upstream = FakeUpstream({"/stats": versioned(counter)})
+        client = make_client(upstream, TTL_POLICIES=(TTLPolicy(r"^/stats$", ttl=0.2, stale_ttl=10),))
+
+        self.assertEqual(await client.get("/stats"), {"version": 1})
+        await asyncio.sleep(0.3)
+
+        # both callers get the stale copy right away, a single refresh runs behind them
+        self.assertEqual(await asyncio.gather(client.get("/stats"), client.get("/stats")), [{"version": 1}] * 2)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(await client.get("/stats"), {"version": 2})
+        self.assertEqual(upstream.count("/stats"), 2)
+        self.assertEqual(client.revalidations, 1)
+
+    async def test_entry_past_its_staleness_window_is_fetched(self):
+        counter = [0]
+        upstream = FakeUpstream({"/stats": versioned(counter)})
+        client = make_client(upstream, TTL_POLICIES=(TTLPolicy(r"^/stats$", ttl=0.1, stale_ttl=0.1),))
+
+        await client.get("/stats")
+        await asyncio.sleep(0.3)
+
+        self.assertEqual(await client.get("/stats"), {"version": 2})
+        self.assertEqual(client.revalidations, 0)
+
+
+class EvictionTest(unittest.IsolatedAsyncioTestCase):
+    def test_least_recently_used_entry_goes_past_max_entries(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", 1, ttl=60, size=1)
+        cache.set("b", 2, ttl=60, size=1)
+        cache.get("a")
+        cache.set("c", 3, ttl=60, size=1)
+
+        self.assertEqual(cache.keys(), ["a", "c"])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_entries_are_evicted_past_max_bytes(self):
+        cache = ResponseCache(max_bytes=100)
+        for key in ("a", "b", "c"):
+            cache.set(key, key, ttl=60, size=40)
+
+        self.assertEqual(cache.keys(), ["b", "c"])
+        self.assertEqual(cache.bytes, 80)
+        self.assertIsNone(cache.set("huge", "", ttl=60, size=101))
+        self.assertEqual(cache.keys(), ["b", "c"])
+
+    async def test_decoded_documents_are_counted_larger_than_their_body(self):
+        body = b'{"txs": [1, 2, 3]}'
+        for raw in (False, True):
+            with self.subTest(raw=raw):
+                client = make_client(FakeUpstream({"/doc": lambda request: httpx.Response(200, content=body)}), CACHE_RAW_BYTES=raw)
+
+                self.assertEqual(await client.get("/doc"), {"txs": [1, 2, 3]})
+                expected = len(body) if raw else int(len(body) * Config.CACHE_DECODED_SIZE_FACTOR)
+                self.assertEqual(client.cache_stats()["bytes"], expected)
+
+
+class NewTipTest(unittest.IsolatedAsyncioTestCase):
+    async def test_request_sent_before_the_block_is_not_joined_nor_cached(self):
+        release = asyncio.Event()
+        counter = [0]
+
+        async def fees(request):
+            counter[0] += 1
+            version = counter[0]
+            if version == 1:
+                await release.wait() # answer computed for the previous tip
+            return httpx.Response(200, json={"version": version})
+
+        upstream = FakeUpstream({"/fees": fees})
+        client = make_client(upstream, TTL_POLICIES=(TTLPolicy(r"^/fees$", ttl=60, tip_dependent=True),))
+
+        before = asyncio.ensure_future(client.get("/fees"))
+        await asyncio.sleep(0.05)
+        await client.on_new_tip()
+        self.assertEqual(await client.get("/fees"), {"version": 2})
+
+        release.set()
+        self.assertEqual(await before, {"version": 1})
+        self.assertEqual(await client.get("/fees"), {"version": 2})
+        self.assertEqual(upstream.count("/fees"), 2)
+
+
+class StaleFallbackTest(unittest.IsolatedAsyncioTestCase):
+    def failing_after_first(self, status: int):
+        answers = iter([httpx.Response(200, json={"version": 1})])
+        return lambda request: next(answers, httpx.Response(status))
+
+    async def test_upstream_failure_serves_the_expired_entry_flagged_stale(self):
+        upstream = FakeUpstream({"/stats": self.failing_after_first(503)})
+        client = make_client(upstream, TTL_POLICIES=(TTLPolicy(r"^/stats$", ttl=0.1),))
+        client.enable_retry = False
+
+        await client.get("/stats")
+        await asyncio.sleep(0.2)
+
+        result = await client.get_result("/stats")
+        self.assertEqual((result.data, result.error, result.stale), ({"version": 1}, "HTTP 503", True))
+        with self.assertLogs("src.api.client", "WARNING"):
+            self.assertEqual(await client.get("/stats"), {"version": 1})
+
+    async def test_client_error_serves_nothing(self):
+        upstream = FakeUpstream({"/stats": self.failing_after_first(404)})
+        client = make_client(upstream, TTL_POLICIES=(TTLPolicy(r"^/stats$", ttl=0.1),))
+
+        await client.get("/stats")
+        await asyncio.sleep(0.2)
+
+        result = await client.get_result("/stats")
+        self.assertEqual((result.data, result.error, result.stale), (None, "HTTP 404", False))
+
+
+class ConditionalRequestTest(unittest.IsolatedAsyncioTestCase):
+    def etag_route(self, counter: list, on_revalidation=None):
+        """Answers 304 to a request carrying the current ETag, {"version": n} with ETag "vn" otherwise"""
+        def route(request):
+            if counter[0] and request.headers.get("If-None-Match") == f'"v{counter[0]}"':
+                if on_revalidation is not None:
+                    return on_revalidation(request)
+                return httpx.Response(304)
+            counter[0] += 1
+            return httpx.Response(200, json={"version": counter[0]}, headers={"ETag": f'"v{counter[0]}"'})
+        return route
+
+    async def test_not_modified_answer_extends_the_entry(self):
+        upstream = FakeUpstream({"/stats": self.etag_route([0])})
+        client = make_client(upstream, TTL_POLICIES=(TTLPolicy(r"^/stats$", ttl=0.1),))
+
+        await client.get("/stats")
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(await client.get("/stats"), {"version": 1})
+        self.assertEqual(upstream.requests[1].headers.get("If-None-Match"), '"v1"')
+        self.assertGreater(client.expires_in("/stats"), 0)
+
+        stats = client.cache_stats()
+        self.assertEqual((stats["conditional_requests"], stats["not_modified"]), (1, 1))
+        self.assertEqual(stats["bytes_saved"], len(b'{"version":1}'))
+
+    async def test_entry_evicted_before_the_304_is_downloaded_again(self):
+        counter = [0]
+        client = None
+
+        def evicted(request):
+            client._cache.clear()
+            return httpx.Response(304)
+
+        upstream = FakeUpstream({"/stats": self.etag_route(counter, on_revalidation=evicted)})
+        client = make_client(upstream, TTL_POLICIES=(TTLPolicy(r"^/stats$", ttl=0.1),))
+        client.max_retry = 0 # the second download is not a retry
+
+        await client.get("/stats")
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(await client.get("/stats"), {"version": 2})
+        self.assertEqual(upstream.count("/stats"), 3)
+        self.assertNotIn("If-None-Match", upstream.requests[2].headers)
+        self.assertEqual(client._retry_budget.retries, 0)
+
+
+class BrokenBody(httpx.AsyncByteStream):
+    """Body sending its first chunk, then dropping the connection"""
+
+    def __init__(self, chunk: bytes):
+        self.chunk = chunk
+
+    async def __aiter__(self):
+        yield self.chunk
+        raise httpx.ReadError("connection reset")
+
+
+class StreamItemsTest(unittest.IsolatedAsyncioTestCase):
+    async def collect(self, client, endpoint: str) -> list:
+        return [item async for item in client.stream_items(endpoint, key="txs")]
+
+    async def test_failure_before_the_first_item_is_retried(self):
+        answers = iter([httpx.Response(503), httpx.Response(200, json={"txs": [1, 2, 3]})])
+        upstream = FakeUpstream({"/rawaddr/a": lambda request: next(answers)})
+        client = make_client(upstream)
+        client._backoff = lambda attempts: 0
+
+        self.assertEqual(await self.collect(client, "/rawaddr/a"), [1, 2, 3])
+        self.assertEqual(upstream.count("/rawaddr/a"), 2)
+
+    async def test_failure_after_the_first_items_reports_the_truncation(self):
+        upstream = FakeUpstream({"/rawaddr/a": lambda request: httpx.Response(200, stream=BrokenBody(b'{"txs": [1, 2, '))})
+        client = make_client(upstream)
+
+        received = []
+        with self.assertRaises(StreamInterrupted) as raised:
+            async for item in client.stream_items("/rawaddr/a", key="txs"):
+                received.append(item)
+
+        self.assertEqual(received, [1, 2])
+        self.assertEqual(raised.exception.received, 2)
+        self.assertEqual(upstream.count("/rawaddr/a"), 1)
+
+    async def test_client_error_is_not_retried(self):
+        upstream = FakeUpstream({"/rawaddr/a": lambda request: httpx.Response(400)})
+        client = make_client(upstream)
+
+        with self.assertRaises(StreamInterrupted) as raised:
+            await self.collect(client, "/rawaddr/a")
+        self.assertEqual((raised.exception.reason, raised.exception.received), ("HTTP 400", 0))
+
+    async def test_joins_a_get_of_the_same_url_in_flight(self):
+        release = asyncio.Event()
+
+        async def slow(request):
+            await release.wait()
+            return httpx.Response(200, json={"txs": [1, 2]})
+
+        upstream = FakeUpstream({"/rawaddr/a": slow})
+        client = make_client(upstream)
+
+        get = asyncio.ensure_future(client.get("/rawaddr/a"))
+        await asyncio.sleep(0.05)
+        stream = asyncio.ensure_future(self.collect(client, "/rawaddr/a"))
+        await asyncio.sleep(0.05)
+        release.set()
+
+        self.assertEqual(await stream, [1, 2])
+        self.assertEqual(await get, {"txs": [1, 2]})
+        self.assertEqual(upstream.count("/rawaddr/a"), 1)
+
+
+class BackendTierTest(unittest.IsolatedAsyncioTestCase):
+    """Two clients on one backend stand for two workers of a host, each with its own memory cache"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def backends(self):
+        shared = SharedMemoryCache(str(Path(self.directory.name) / "shared"), slots=16, slot_size=4096)
+        self.addCleanup(shared.close)
+        disk = DiskCache(str(Path(self.directory.name) / "responses.sqlite3"))
+        disk.min_ttl = 0
+        return {"shared": shared, "disk": disk}
+
+    def workers(self, upstream: FakeUpstream, backend):
+        base_url = upstream_url()
+        policies = (TTLPolicy(r"^/price$", ttl=0.3),)
+        workers = [make_client(upstream, base_url=base_url, TTL_POLICIES=policies) for _ in range(2)]
+        for worker in workers:
+            worker._backend = backend
+        return workers
+
+    async def test_peer_response_is_reused(self):
+        for name, backend in self.backends().items():
+            with self.subTest(backend=name):
+                counter = [0]
+                upstream = FakeUpstream({"/price": versioned(counter)})
+                first, second = self.workers(upstream, backend)
+
+                self.assertEqual(await first.get("/price"), {"version": 1})
+                self.assertEqual(await second.get("/price"), {"version": 1})
+                self.assertEqual(upstream.count("/price"), 1)
+
+    async def test_fresh_peer_copy_replaces_an_expired_memory_entry(self):
+        for name, backend in self.backends().items():
+            with self.subTest(backend=name):
+                counter = [0]
+                upstream = FakeUpstream({"/price": versioned(counter)})
+                first, second = self.workers(upstream, backend)
+
+                await first.get("/price")
+                await second.get("/price")
+                await asyncio.sleep(0.4) # both memory entries expired, still retained as fallbacks
+
+                self.assertEqual(await first.get("/price"), {"version": 2})
+                self.assertEqual(await second.get("/price"), {"version": 2})
+                self.assertEqual(upstream.count("/price"), 2)
+
+    async def test_fresh_memory_entry_skips_the_backend(self):
+        backend = self.backends()["shared"]
+        upstream = FakeUpstream({"/price": versioned([0])})
+        first, _ = self.workers(upstream, backend)
+
+        await first.get("/price")
+        lookups = backend.hits + backend.misses
+        await first.get("/price")
+
+        self.assertEqual(backend.hits + backend.misses, lookups)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.api.header_store import HeaderStore
+from src.config import Config
+
+BATCH = 15 # blocks per /v1/blocks answer
+
+
+def block_hash(height: int, fork: int = 0) -> str:
+    return f"{fork:08x}{height:056x}"
+
+
+class FakeChain:
+    """Stands for the MempoolClient the store syncs through, serving /v1/blocks and /v1/blocks/:height"""
+
+    def __init__(self, tip: int):
+        self.blocks: dict[int, dict] = {}
+        self.requested: list[int] = [] # heights asked to /v1/blocks/:height
+        self.extend(tip)
+
+    def extend(self, tip: int, fork: int = 0, start: int = 0) -> None:
+        """(Re)mines the blocks from `start` to `tip`, on another branch if `fork` is set"""
+        for height in range(start, tip + 1):
+            self.blocks[height] = {
+                "id": block_hash(height, fork),
+                "height": height,
+                "timestamp": 1_000_000 + height * 600,
+                "previousblockhash": self.blocks[height - 1]["id"] if height else None,
+            }
+        for height in [height for height in self.blocks if height > tip]:
+            del self.blocks[height]
+
+    def _from(self, height: int) -> list[dict]:
+        return [self.blocks[h] for h in range(height, max(-1, height - BATCH), -1)]
+
+    async def get_blocks_info(self):
+        return self._from(max(self.blocks))
+
+    async def get_blocks_from(self, height: int):
+        self.requested.append(height)
+        return self._from(height)
+
+    def has_spare_capacity(self, reserve: float) -> bool:
+        return True
+
+
+class HeaderStoreTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = str(Path(directory.name) / "headers.bin")
+
+        batches = mock.patch.object(Config, "HEADER_SYNC_BATCHES", 3)
+        batches.start()
+        self.addCleanup(batches.stop)
+
+    def open(self) -> HeaderStore:
+        store = HeaderStore(self.path, capacity=1000)
+        self.addCleanup(store.close)
+        return store
+
+    async def test_initial_sync_indexes_the_latest_blocks(self):
+        store, chain = self.open(), FakeChain(100)
+
+        await store.sync(chain)
+
+        self.assertEqual((store.low, store.tip, store.older), (86, 100, None))
+        self.assertEqual(chain.requested, []) # no backfill unless enabled
+        self.assertEqual(store.hash_at(90), block_hash(90))
+        self.assertEqual(store.height_of(block_hash(90)), 90)
+        self.assertEqual(store.timestamp_at(90), 1_000_000 + 90 * 600)
+        self.assertEqual(store.height_at_time(1_000_000 + 90 * 600 + 300), 90)
+        self.assertIsNone(store.hash_at(85))
+        self.assertTrue(store.is_final(86))
+        self.assertFalse(store.is_final(100))
+
+    async def test_backfill_walks_down_when_enabled(self):
+        store, chain = self.open(), FakeChain(100)
+
+        with mock.patch.object(Config, "HEADER_STORE_BACKFILL", True):
+            await store.sync(chain)
+
+        self.assertEqual((store.low, store.tip), (86 - 3 * BATCH, 100))
+        self.assertEqual(chain.requested, [85, 70, 55])
+
+    async def test_reorg_replaces_the_blocks_and_their_index_entries(self):
+        store, chain = self.open(), FakeChain(100)
+        await store.sync(chain)
+
+        chain.extend(101, fork=1, start=99)
+        await store.sync(chain)
+
+        self.assertEqual(store.tip, 101)
+        self.assertEqual(store.reorgs, 2)
+        self.assertEqual(store.hash_at(100), block_hash(100, fork=1))
+        self.assertEqual(store.height_of(block_hash(100, fork=1)), 100)
+        self.assertIsNone(store.height_of(block_hash(100)))
+        self.assertEqual(store.height_of(block_hash(98)), 98)
+
+    async def test_gap_wider_than_a_sync_is_walked_down_to_the_older_range(self):
+        store, chain = self.open(), FakeChain(100)
+        await store.sync(chain)
+
+        chain.extend(300)
+        await store.sync(chain)
+        self.assertEqual(store.older, (86, 100))
+        self.assertEqual(store.low, 300 - BATCH + 1 - 3 * BATCH)
+
+        for _ in range(5):
+            await store.sync(chain)
+            if store.older is None:
+                break
+
+        self.assertEqual((store.low, store.tip, store.older), (86, 300, None))
+        self.assertGreaterEqual(min(chain.requested), 86 - BATCH) # nothing below the older range
+        self.assertTrue(all(store.hash_at(height) == block_hash(height) for height in range(86, 301)))
+
+        # merged, the next syncs no longer walk down
+        requested = len(chain.requested)
+        await store.sync(chain)
+        self.assertEqual(len(chain.requested), requested)
+
+    async def test_reopened_file_keeps_the_synced_range(self):
+        store, chain = HeaderStore(self.path, capacity=1000), FakeChain(100)
+        await store.sync(chain)
+        chain.extend(300)
+        await store.sync(chain)
+        low = store.low
+        store.close()
+
+        reopened = self.open()
+
+        self.assertEqual((reopened.low, reopened.tip, reopened.older), (low, 300, (86, 100)))
+        self.assertEqual(reopened.hash_at(95), block_hash(95))
+        self.assertEqual(reopened.height_of(block_hash(250)), 250)
+
+
+if __name__ == "__main__":
+    unittest.main()
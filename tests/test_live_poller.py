@@ -0,0 +1,79 @@
+import unittest
+from contextlib import AsyncExitStack
+
+from src.core.live_poller import LivePoller
+
+
+class FakeSession:
+    """Server session recording the update notifications it was sent"""
+
+    def __init__(self):
+        self.updated: list[str] = []
+        self._exit_stack = AsyncExitStack() # closed by the MCP session when the client disconnects
+
+    async def send_resource_updated(self, uri: str) -> None:
+        self.updated.append(uri)
+
+
+class LivePollerTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.values = {"bitcoin://fees": {"fastestFee": 5}}
+        self.reads: list[str] = []
+        self.poller = LivePoller()
+        self.poller.readers = {uri: self.reader(uri) for uri in self.poller.readers}
+
+    def reader(self, uri: str):
+        async def read():
+            self.reads.append(uri)
+            return self.values.get(uri)
+        return read
+
+    async def test_subscribers_are_notified_only_when_the_value_changed(self):
+        session = FakeSession()
+        await self.poller.subscribe("bitcoin://fees", session)
+
+        await self.poller.poll()
+        self.values["bitcoin://fees"] = {"fastestFee": 6}
+        await self.poller.poll()
+        await self.poller.poll()
+
+        self.assertEqual(session.updated, ["bitcoin://fees"])
+        self.assertEqual(self.reads, ["bitcoin://fees"] * 4) # only the subscribed resource is polled
+        self.assertEqual(await self.poller.read("bitcoin://fees"), {"fastestFee": 6})
+
+    async def test_unsubscribed_resource_is_no_longer_polled_and_read_again_on_resubscribe(self):
+        session = FakeSession()
+        await self.poller.subscribe("bitcoin://fees", session)
+        self.poller.unsubscribe("bitcoin://fees", session)
+
+        self.values["bitcoin://fees"] = {"fastestFee": 9}
+        await self.poller.poll()
+        self.assertEqual(len(self.reads), 1)
+
+        await self.poller.subscribe("bitcoin://fees", session)
+        self.assertEqual(await self.poller.read("bitcoin://fees"), {"fastestFee": 9})
+        self.assertEqual(session.updated, [])
+
+    async def test_sessions_are_dropped_when_they_end(self):
+        session = FakeSession()
+        for uri in ("bitcoin://fees", "bitcoin://tip"):
+            if await self.poller.subscribe(uri, session):
+                session._exit_stack.callback(self.poller.forget, session)
+
+        await session._exit_stack.aclose()
+
+        self.assertEqual(self.poller.stats()["subscribers"], {uri: 0 for uri in self.poller.readers})
+
+    async def test_missing_readings_are_skipped(self):
+        session = FakeSession()
+        await self.poller.subscribe("bitcoin://fees", session)
+
+        self.values["bitcoin://fees"] = None
+        await self.poller.poll()
+
+        self.assertEqual(await self.poller.read("bitcoin://fees"), {"fastestFee": 5})
+        self.assertEqual(session.updated, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
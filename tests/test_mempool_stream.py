@@ -0,0 +1,90 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest import mock
+
+import httpx
+from websockets.asyncio.server import serve
+
+from src.api.mempool_client import MempoolClient
+from src.api.mempool_stream import MempoolStream
+from src.api.transport import get_transport_manager
+from src.config import Config
+from tests.support import FakeUpstream, upstream_url
+
+
+class ReconnectTest(unittest.IsolatedAsyncioTestCase):
+    async def test_bad_messages_are_skipped_and_a_dropped_feed_reconnects(self):
+        sessions = []
+        hold = asyncio.Event()
+
+        async def feed(websocket):
+            await websocket.recv() # the "want" request
+            sessions.append(websocket)
+            if len(sessions) == 1:
+                for message in ("not json", {"block": "garbage"}, {"blocks": None}, {"block": {"height": 1}}):
+                    await websocket.send(message if isinstance(message, str) else json.dumps(message))
+                return # drops the connection
+            await websocket.send(json.dumps({"block": {"height": 2}}))
+            await hold.wait()
+
+        async with serve(feed, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            stream = MempoolStream(f"ws://127.0.0.1:{port}")
+
+            with mock.patch.object(Config, "MEMPOOL_WS_MAX_BACKOFF", 0.05):
+                task = asyncio.ensure_future(stream.run())
+                for _ in range(100):
+                    if stream.blocks and stream.blocks[0]["height"] == 2:
+                        break
+                    await asyncio.sleep(0.02)
+
+            self.assertFalse(task.done())
+            self.assertEqual([block["height"] for block in stream.blocks], [2, 1])
+            self.assertEqual((stream.connections, stream.ignored), (2, 3))
+            self.assertTrue(stream.live)
+
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            hold.set()
+
+
+class PushedTipTest(unittest.IsolatedAsyncioTestCase):
+    def client(self, upstream: FakeUpstream) -> MempoolClient:
+        """MempoolClient on a fake upstream, its feed connected"""
+        base_url = upstream_url()
+        with mock.patch.object(Config, "MEMPOOL_API_URL", base_url):
+            client = MempoolClient()
+        get_transport_manager().set_client(base_url, httpx.AsyncClient(transport=httpx.MockTransport(upstream)))
+
+        client.stream = MempoolStream("ws://feed.test")
+        client.stream.connected = True
+        return client
+
+    async def test_pushed_blocks_keep_the_depth_based_ttls(self):
+        upstream = FakeUpstream({"/block-height/100": "00" * 32})
+        client = self.client(upstream)
+        await client.stream.handle({"blocks": [{"height": height} for height in range(100, 111)]})
+
+        self.assertEqual(await client.get("/blocks/tip/height"), 110)
+        self.assertEqual(client.tip_height, 110)
+        self.assertEqual(upstream.count("/blocks/tip/height"), 0)
+
+        await client.get("/block-height/100") # 11 blocks deep, immutable
+        self.assertGreater(client.expires_in("/block-height/100"), Config.CACHE_TTL_TIME)
+
+    async def test_get_many_reads_the_feed(self):
+        upstream = FakeUpstream({})
+        client = self.client(upstream)
+        client.stream.blocks = [{"height": 110, "id": "ab" * 32}]
+        client.stream._last_message = time.monotonic()
+
+        height, tip_hash = await client.get_many(["/blocks/tip/height", "/blocks/tip/hash"])
+
+        self.assertEqual((height.data, tip_hash.data), (110, "ab" * 32))
+        self.assertEqual(upstream.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
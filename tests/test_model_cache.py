@@ -0,0 +1,42 @@
+import asyncio
+import unittest
+
+from src.api.ttl_policy import TTLPolicy
+from src.data.model_cache import ModelCache
+from tests.support import FakeUpstream, make_client, versioned
+
+
+class Parsed:
+    def __init__(self, data: dict):
+        self.version = data["version"]
+
+    @classmethod
+    def from_data(cls, data: dict):
+        return cls(data)
+
+
+class ModelCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def read(self, client, models: ModelCache) -> Parsed:
+        data = await client.get("/doc")
+        return models.get(Parsed, data, client.cache_version("/doc"))
+
+    async def test_model_is_parsed_once_per_refresh_in_both_cache_modes(self):
+        for raw in (False, True):
+            with self.subTest(raw=raw):
+                upstream = FakeUpstream({"/doc": versioned([0])})
+                client = make_client(upstream, CACHE_RAW_BYTES=raw, TTL_POLICIES=(TTLPolicy(r"^/doc$", ttl=0.2),))
+                models = ModelCache()
+
+                for _ in range(4):
+                    self.assertEqual((await self.read(client, models)).version, 1)
+
+                await asyncio.sleep(0.3)
+                self.assertEqual((await self.read(client, models)).version, 2)
+                self.assertEqual((await self.read(client, models)).version, 2)
+
+                self.assertEqual(upstream.count("/doc"), 2)
+                self.assertEqual((models.parses, models.hits), (2, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+
+from src.api.provider_router import Provider, ProviderRouter
+from src.api.ttl_policy import TTLPolicy
+from src.config import Config
+from tests.support import FakeUpstream, make_client
+
+POLICIES = (TTLPolicy(r"^/tip$", ttl=0.1),)
+
+
+def tip(height: int):
+    return lambda request: httpx.Response(200, json={"height": height})
+
+def broken_after_first(height: int):
+    """Answers once, then fails with 503"""
+    answers = iter([httpx.Response(200, json={"height": height})])
+    return lambda request: next(answers, httpx.Response(503))
+
+
+class FailoverTest(unittest.IsolatedAsyncioTestCase):
+    async def providers(self, primary_route, secondary_route):
+        """Two providers, the primary one primed (its entry expired since) and ranked first"""
+        primary = make_client(FakeUpstream({"/tip": primary_route}), TTL_POLICIES=POLICIES)
+        secondary = make_client(FakeUpstream({"/tip": secondary_route}), TTL_POLICIES=POLICIES)
+        for client in (primary, secondary):
+            client.enable_retry = False
+
+        await primary.get("/tip")
+        await asyncio.sleep(0.2)
+        secondary.score.record(5.0, False) # slower, tried second
+
+        return [
+            Provider("primary", primary, lambda: "/tip", dict),
+            Provider("secondary", secondary, lambda: "/tip", dict),
+        ]
+
+    async def test_failed_provider_with_stale_data_fails_over(self):
+        router = ProviderRouter("tip", await self.providers(broken_after_first(1), tip(2)), hedge=False)
+
+        self.assertEqual(await router.fetch(), {"height": 2})
+        self.assertEqual(router.failovers, 1)
+        self.assertEqual(router.stale_answers, 0)
+
+    async def test_stale_data_is_the_last_resort(self):
+        router = ProviderRouter("tip", await self.providers(broken_after_first(1), lambda request: httpx.Response(503)), hedge=False)
+
+        self.assertEqual(await router.fetch(), {"height": 1})
+        self.assertEqual(router.failovers, 1)
+        self.assertEqual(router.stale_answers, 1)
+
+    async def test_nothing_when_every_provider_failed_without_data(self):
+        providers = await self.providers(broken_after_first(1), lambda request: httpx.Response(503))
+        for provider in providers:
+            provider.client._cache.clear()
+        router = ProviderRouter("tip", providers, hedge=False)
+
+        self.assertIsNone(await router.fetch())
+
+
+class LatencyTest(unittest.IsolatedAsyncioTestCase):
+    async def test_cache_hits_are_not_latency_samples(self):
+        async def slow(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"height": 1})
+
+        client = make_client(FakeUpstream({"/tip": slow}), TTL_POLICIES=(TTLPolicy(r"^/tip$", ttl=60),))
+        router = ProviderRouter("tip", [Provider("only", client, lambda: "/tip", dict)], hedge=False)
+
+        for _ in range(5):
+            self.assertEqual(await router.fetch(), {"height": 1})
+
+        latency = router._latency["only"]
+        self.assertEqual(len(latency._samples), 1)
+        self.assertGreaterEqual(latency._samples[0], 0.05)
+
+    async def test_cancelled_hedge_loser_records_its_elapsed_time(self):
+        async def slow(request):
+            await asyncio.sleep(0.5)
+            return httpx.Response(200, json={"height": 1})
+
+        primary = make_client(FakeUpstream({"/tip": slow}), TTL_POLICIES=POLICIES)
+        secondary = make_client(FakeUpstream({"/tip": tip(2)}), TTL_POLICIES=POLICIES)
+        secondary.score.record(5.0, False) # slower, tried second
+        router = ProviderRouter("tip", [
+            Provider("primary", primary, lambda: "/tip", dict),
+            Provider("secondary", secondary, lambda: "/tip", dict),
+        ], hedge=True)
+
+        latency = router._latency["primary"]
+        with mock.patch.object(Config, "HEDGE_MIN_SAMPLES", 3), mock.patch.object(Config, "HEDGE_MIN_DELAY", 0.1):
+            for _ in range(3):
+                latency.record(0.01)
+            self.assertEqual(await router.fetch(), {"height": 2})
+
+        self.assertEqual((router.hedged, router.hedge_wins), (1, 1))
+        self.assertEqual(len(latency._samples), 4)
+        self.assertGreaterEqual(latency._samples[-1], 0.1) # at least the hedge delay it was cancelled after
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import httpx
+
+from src.api.rate_limit import RateLimiter
+from tests.support import FakeUpstream, make_client
+
+
+class RateLimiterTest(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_gives_up_at_its_timeout(self):
+        limiter = RateLimiter(rate=0.5, burst=1)
+        self.assertTrue(await limiter.acquire(timeout=0.1))
+
+        started = time.monotonic()
+        self.assertFalse(await limiter.acquire(timeout=0.1)) # the next token is 2s away
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(limiter.timeouts, 1)
+        self.assertEqual(limiter.queue_depth, 0)
+
+    async def test_queued_caller_gives_up_while_another_one_waits(self):
+        limiter = RateLimiter(rate=2, burst=1)
+        await limiter.acquire()
+
+        first = asyncio.ensure_future(limiter.acquire(timeout=1)) # holds the turn for ~0.5s
+        await asyncio.sleep(0)
+        self.assertFalse(await limiter.acquire(timeout=0.1))
+        self.assertTrue(await first)
+
+    def test_abandoned_ticket_does_not_block_the_next_threads(self):
+        limiter = RateLimiter(rate=2, burst=1)
+        limiter.acquire_sync()
+        results = {}
+
+        def acquire(name: str, timeout: float) -> None:
+            results[name] = limiter.acquire_sync(timeout)
+
+        holder = threading.Thread(target=acquire, args=("holder", 2)) # waits ~0.5s for a token
+        holder.start()
+        time.sleep(0.05)
+        acquire("impatient", 0.05)
+        late = threading.Thread(target=acquire, args=("late", 2))
+        late.start()
+        holder.join()
+        late.join()
+
+        self.assertEqual(results, {"holder": True, "impatient": False, "late": True})
+        self.assertEqual(limiter.queue_depth, 0)
+
+
+class RetryAfterTest(unittest.IsolatedAsyncioTestCase):
+    async def test_long_retry_after_does_not_pause_the_upstream(self):
+        upstream = FakeUpstream({"/price": lambda request: httpx.Response(429, headers={"Retry-After": "3600"})})
+        client = make_client(upstream, RATE_LIMIT=100, RATE_LIMIT_BURST=10)
+
+        result = await client.get_many(["/price"])
+
+        self.assertEqual(result[0].error, "HTTP 429")
+        self.assertEqual(upstream.count("/price"), 1)
+        self.assertEqual(client.rate_limit_stats()["paused_for"], 0)
+
+    async def test_short_retry_after_pauses_then_retries(self):
+        answers = iter([httpx.Response(429, headers={"Retry-After": "0.2"}), httpx.Response(200, json={"usd": 1})])
+        upstream = FakeUpstream({"/price": lambda request: next(answers)})
+        client = make_client(upstream, RATE_LIMIT=100, RATE_LIMIT_BURST=10)
+
+        started = time.monotonic()
+        self.assertEqual(await client.get("/price"), {"usd": 1})
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        self.assertEqual(upstream.count("/price"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
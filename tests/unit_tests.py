@@ -1,7 +1,10 @@
 """
 Testing
 -------
-Unit tests coming soon! We're actively working on .
+The unit tests run the HTTP client layer against fake upstreams (httpx.MockTransport),
+no network access needed. From the repository root:
+
+    python -m unittest discover -s tests -t .
 
 MCP Inspector
 -------------
@@ -18,6 +21,3 @@ Resources:
     - GitHub: https://github.com/modelcontextprotocol/inspector
 """
 
-# TODO : Unit tests coming soon
-
-